@@ -32,9 +32,61 @@ class Settings(BaseSettings):
 
     # 4. OpenAI 설정
     OPENAI_API_KEY: str
+    # "standin"이면 오프라인 LLM 대역 사용 (OPENAI_BASE_URL이 없으면 프로세스 내부에서 실행)
+    LLM_BACKEND: Literal["openai", "standin"] = "openai"
+    OPENAI_BASE_URL: str = ""
+    LLM_STANDIN_LATENCY_MEDIAN_MS: float = 800.0
+    LLM_STANDIN_LATENCY_SIGMA: float = 0.5
+    LLM_STANDIN_FAILURE_RATE: float = 0.0
+    LLM_STANDIN_SEED: int = 0
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_RETRIES: int = 2
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 4.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_RESET_SECONDS: float = 30.0
+    LLM_USAGE_FLUSH_SECONDS: float = 60.0
+    LLM_USAGE_RETENTION_DAYS: int = 90
 
     # 5. 캐시 설정
     DEFAULT_EXERCISE_CACHE_TTL_DAYS: int = 7
+    POSE_CACHE_TTL_DAYS: int = 30
+    POSE_CACHE_MAX_ENTRIES: int = 512
+    # 메모리 캐시 항목 유지 시간 (다른 프로세스의 무효화/Mongo 만료가 반영되기까지 최대 지연)
+    POSE_CACHE_MEMORY_TTL_SECONDS: int = 300
+    RECOMMENDATION_CACHE_TTL_HOURS: int = 72
+    RECOMMENDATION_CACHE_MAX_ENTRIES: int = 256
+    RECOMMENDATION_CACHE_MEMORY_TTL_SECONDS: int = 300  # 메모리 캐시 항목 유지 시간
+    RECOMMENDATION_CACHE_POOL_SIZE: int = 12  # 지문별로 보관하는 운동 수
+    RECOMMENDATION_CACHE_RESULT_COUNT: int = 4  # 캐시 적중 시 반환하는 운동 수
+    RECOMMENDATION_CACHE_MIN_RESULTS: int = 3  # 제외 후 이보다 적게 남으면 캐시 미스
+    RECOMMENDATION_PRECOMPUTE_POOL_SIZE: int = 24  # 미리 생성하는 프로필별 운동 수
+    RECOMMENDATION_PRECOMPUTE_TTL_DAYS: int = 14
+
+    # 6. AI 포즈 생성 설정
+    POSE_GENERATION_CONCURRENCY: int = 3
+    POSE_GENERATION_TIMEOUT_SECONDS: float = 20.0
+    # separate: 추천 1회 + 운동별 포즈 생성 / combined: 추천과 포즈를 한 번의 호출로 생성
+    RECOMMENDATION_GENERATION_MODE: Literal["separate", "combined"] = "separate"
+    # 운동 이름이 내장 포즈 별칭과 이 유사도 이상이면 AI 포즈 생성 없이 내장 포즈 사용
+    EXERCISE_NAME_MATCH_THRESHOLD: float = 0.62
+
+    # 7. 운동 생성 작업 큐 설정
+    EXERCISE_JOB_WORKERS: int = 4
+    EXERCISE_JOB_QUEUE_SIZE: int = 200
+    EXERCISE_JOB_MAX_ATTEMPTS: int = 2
+    EXERCISE_JOB_LEASE_SECONDS: float = 120.0  # 실행 중 작업 임대 (만료되면 다른 워커가 다시 실행)
+    EXERCISE_JOB_POLL_SECONDS: float = 5.0  # 다른 프로세스에서 제출된 작업 확인 주기
+
+    # 8. 관리자 API 설정 (비어 있으면 관리자 API 비활성화)
+    ADMIN_API_KEY: str = ""
+
+    # 9. 운동 기록 통계 설정
+    # records: 원본 기록 집계 / rollup: daily_stats·user_stats 롤업에서 계산
+    # (rollup은 backfill_daily_stats, backfill_user_stats를 모두 실행한 뒤에만 켤 것 - 백필 전에는 통계/개수가 틀림)
+    RECORD_STATS_SOURCE: Literal["rollup", "records"] = "records"
+    SCORE_HISTORY_BUCKETS: int = 60  # 점수 이력 구간 요약(min/mean/max) 개수
+    SCORE_HISTORY_MAX_SAMPLES: int = 7200  # 이보다 긴 점수 이력은 구간 요약만 저장
 
 
 # 전역 설정 인스턴스
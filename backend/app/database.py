@@ -64,4 +64,34 @@ async def get_generated_exercises_collection():
 
 async def get_records_collection():
     database = await get_database()
-    return database["records"]
\ No newline at end of file
+    return database["records"]
+
+
+async def get_pose_cache_collection():
+    database = await get_database()
+    return database["pose_cache"]
+
+
+async def get_recommendation_cache_collection():
+    database = await get_database()
+    return database["recommendation_cache"]
+
+
+async def get_llm_usage_collection():
+    database = await get_database()
+    return database["llm_usage"]
+
+
+async def get_daily_stats_collection():
+    database = await get_database()
+    return database["daily_stats"]
+
+
+async def get_user_stats_collection():
+    database = await get_database()
+    return database["user_stats"]
+
+
+async def get_score_histories_collection():
+    database = await get_database()
+    return database["record_score_histories"]
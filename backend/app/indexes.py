@@ -0,0 +1,218 @@
+# app/indexes.py
+"""
+Mongo 인덱스 레지스트리
+
+모든 컬렉션의 인덱스를 한 곳에 선언하고, 시작 시(main.lifespan) 또는 CLI로 멱등하게 적용합니다.
+    python -m app.scripts.ensure_indexes            # 인덱스 적용
+    python -m app.scripts.ensure_indexes --explain  # 적용 후 주요 쿼리 실행 계획 확인 (COLLSCAN 경고)
+
+- 같은 이름/키/옵션의 인덱스가 있으면 아무것도 하지 않음
+- TTL 기간만 바뀐 경우 collMod로 expireAfterSeconds만 변경
+- 중복 데이터 등으로 인덱스를 만들 수 없으면 로그만 남기고 다음 인덱스로 진행 (서버 시작은 막지 않음)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+from app.config import settings
+from app.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# 같은 이름의 인덱스가 다른 옵션으로 이미 있을 때 서버가 반환하는 코드 (IndexOptionsConflict)
+INDEX_OPTIONS_CONFLICT = 85
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    name: str
+    unique: bool = False
+    expire_after_seconds: Optional[int] = None
+    reason: str = ""
+
+    def options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return options
+
+
+def index_registry() -> List[IndexSpec]:
+    """전체 인덱스 선언 (TTL 기간이 설정값에 따라 달라지므로 함수로 생성)"""
+    return [
+        # 사용자: 로그인/회원가입 이메일 조회, 이메일 중복 방지
+        IndexSpec("users", (("email", ASCENDING),), "email_unique", unique=True,
+                  reason="auth.register/login"),
+
+        # 운동 기록: 사용자별 최신순 목록, 기간별 통계
+        IndexSpec("records", (("user_id", ASCENDING), ("completed_at", DESCENDING), ("_id", DESCENDING)),
+                  "user_completed_at", reason="records 목록/통계"),
+        IndexSpec("records", (("user_id", ASCENDING), ("exercise_name_search", ASCENDING), ("completed_at", DESCENDING)),
+                  "user_exercise_name_search", reason="records.search/exercise-names"),
+        IndexSpec("records", (("user_id", ASCENDING), ("exercise_name_grams", ASCENDING)),
+                  "user_exercise_name_grams", reason="records 이름 부분 검색"),
+
+        # 기록 점수 이력 (_id = 기록 ID): 계정 삭제 시 사용자별 정리
+        IndexSpec("record_score_histories", (("user_id", ASCENDING),), "user_id",
+                  reason="bulk_writes.purge_user_data"),
+
+        # 일별 통계 롤업: (사용자, 날짜) 문서 1개, 기간 통계는 날짜 범위 조회
+        IndexSpec("daily_stats", (("user_id", ASCENDING), ("day", ASCENDING)),
+                  "user_day_unique", unique=True, reason="record_stats_service"),
+
+        # 누적 통계: 사용자당 문서 1개
+        IndexSpec("user_stats", (("user_id", ASCENDING),), "user_id_unique", unique=True,
+                  reason="records.statistics/lifetime"),
+
+        # 내 운동: 사용자별 저장순 목록, 같은 운동 중복 저장 방지
+        IndexSpec("my_exercises", (("user_id", ASCENDING), ("saved_at", DESCENDING)),
+                  "user_saved_at", reason="exercises.my-exercises"),
+        IndexSpec("my_exercises", (("user_id", ASCENDING), ("original_exercise_id", ASCENDING)),
+                  "user_original_exercise_unique", unique=True, reason="exercises.save"),
+
+        # 생성된 운동: 최근 24시간 추천 제외 목록, 만료 후 자동 삭제
+        IndexSpec("generated_exercises", (("user_id", ASCENDING), ("created_at", DESCENDING)),
+                  "user_created_at", reason="exercises.recommendations"),
+        IndexSpec("generated_exercises", (("expires_at", ASCENDING),), "expires_at_ttl",
+                  expire_after_seconds=0, reason="추천 운동 만료"),
+
+        # 운동 생성 작업: 워커가 오래된 대기 작업부터 가져감
+        IndexSpec("exercise_jobs", (("status", ASCENDING), ("created_at", ASCENDING)),
+                  "status_created_at", reason="exercise_job_queue 작업 가져가기/대기 작업 수"),
+        IndexSpec("exercise_jobs", (("user_id", ASCENDING),), "user_id",
+                  reason="bulk_writes.purge_user_data"),
+
+        # 캐시/사용량 (문서별 만료 시각 또는 보존 기간)
+        IndexSpec("pose_cache", (("expires_at", ASCENDING),), "expires_at_ttl",
+                  expire_after_seconds=0, reason="pose_cache 만료"),
+        IndexSpec("recommendation_cache", (("expires_at", ASCENDING),), "expires_at_ttl",
+                  expire_after_seconds=0, reason="recommendation_cache 만료"),
+        IndexSpec("llm_usage", (("window_start", ASCENDING),), "window_start_ttl",
+                  expire_after_seconds=settings.LLM_USAGE_RETENTION_DAYS * 86400, reason="llm_usage 보존 기간"),
+    ]
+
+
+async def _apply(db, spec: IndexSpec) -> str:
+    """인덱스 1개 적용 → "ok" | "ttl_updated" | "failed" """
+    collection = db[spec.collection]
+    try:
+        await collection.create_index(list(spec.keys), **spec.options())
+        return "ok"
+    except OperationFailure as e:
+        if e.code == INDEX_OPTIONS_CONFLICT and spec.expire_after_seconds is not None:
+            try:
+                await db.command(
+                    "collMod", spec.collection,
+                    index={"name": spec.name, "expireAfterSeconds": spec.expire_after_seconds},
+                )
+            except OperationFailure as mod_error:
+                # 같은 키의 기존 인덱스 이름이 다르면 collMod도 실패 (수동 정리 필요, 시작은 계속)
+                logger.error(f"Index {spec.collection}.{spec.name} TTL could not be updated: {mod_error}")
+                return "failed"
+            logger.info(f"Index TTL updated: {spec.collection}.{spec.name} → {spec.expire_after_seconds}s")
+            return "ttl_updated"
+        logger.error(f"Index {spec.collection}.{spec.name} could not be created: {e}")
+        return "failed"
+
+
+async def ensure_indexes() -> Dict[str, List[str]]:
+    """
+    레지스트리의 모든 인덱스 적용 (멱등)
+
+    Returns:
+        {"ok": [...], "ttl_updated": [...], "failed": [...]} - "컬렉션.인덱스" 이름 목록
+    """
+    db = await get_database()
+    result: Dict[str, List[str]] = {"ok": [], "ttl_updated": [], "failed": []}
+    for spec in index_registry():
+        outcome = await _apply(db, spec)
+        result[outcome].append(f"{spec.collection}.{spec.name}")
+
+    if result["failed"]:
+        logger.warning(f"Indexes not applied: {result['failed']}")
+    logger.info(f"Indexes ensured: {len(result['ok']) + len(result['ttl_updated'])}/{len(index_registry())}")
+    return result
+
+
+# --- 실행 계획 자가 점검 ---
+
+@dataclass
+class QueryCheck:
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: List[Tuple[str, int]] = field(default_factory=list)
+
+
+def hot_queries() -> List[QueryCheck]:
+    """자주 실행되는 쿼리 (값은 실행 계획 확인용 임의 값)"""
+    user_id = ObjectId()
+    return [
+        QueryCheck("login", "users", {"email": "explain@example.com"}),
+        QueryCheck("records_list", "records", {"user_id": user_id}, [("completed_at", DESCENDING)]),
+        QueryCheck("records_keyset", "records",
+                   {"user_id": user_id, "$or": [{"completed_at": {"$lt": user_id.generation_time}},
+                                                {"completed_at": user_id.generation_time, "_id": {"$lt": user_id}}]},
+                   [("completed_at", DESCENDING), ("_id", DESCENDING)]),
+        QueryCheck("records_name_prefix", "records", {"user_id": user_id, "exercise_name_search": {"$regex": "^스쿼트"}},
+                   [("exercise_name_search", ASCENDING), ("completed_at", DESCENDING)]),
+        QueryCheck("records_name_contains", "records", {"user_id": user_id, "exercise_name_grams": {"$all": ["스쿼", "쿼트"]}}),
+        QueryCheck("records_name_legacy", "records",
+                   {"user_id": user_id, "exercise_name_search": None, "exercise_name": {"$regex": "스쿼트", "$options": "i"}}),
+        QueryCheck("records_period", "records", {"user_id": user_id, "completed_at": {"$gte": user_id.generation_time}}),
+        QueryCheck("daily_stats_period", "daily_stats", {"user_id": user_id, "day": {"$gte": "2000-01-01"}},
+                   [("day", ASCENDING)]),
+        QueryCheck("user_stats", "user_stats", {"user_id": user_id}),
+        QueryCheck("my_exercises_list", "my_exercises", {"user_id": user_id}, [("saved_at", DESCENDING)]),
+        QueryCheck("my_exercise_saved", "my_exercises", {"user_id": user_id, "original_exercise_id": ObjectId()}),
+        QueryCheck("recent_generated", "generated_exercises",
+                   {"user_id": user_id, "created_at": {"$gte": user_id.generation_time}}),
+        QueryCheck("queued_jobs", "exercise_jobs", {"status": "queued"}, [("created_at", ASCENDING)]),
+    ]
+
+
+def _walk_plan(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """winningPlan 트리의 stage 목록 (위에서 아래로, SBE의 queryPlan 래퍼 포함)"""
+    plan = plan.get("queryPlan", plan)
+    stages = []
+    while plan:
+        stages.append(plan)
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0]
+    return stages
+
+
+async def explain_hot_queries() -> List[Dict[str, Any]]:
+    """
+    주요 쿼리의 실행 계획 확인 (COLLSCAN이면 collscan=True + 경고 로그)
+    컬렉션이 비어 있으면 EOF로 나올 수 있음 (인덱스 유무와 무관)
+    """
+    db = await get_database()
+    report = []
+    for check in hot_queries():
+        cursor = db[check.collection].find(check.filter)
+        if check.sort:
+            cursor = cursor.sort(check.sort)
+        explain = await cursor.explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        plan = _walk_plan(winning_plan)
+        stages = [stage.get("stage", "?") for stage in plan]
+        collscan = "COLLSCAN" in stages
+        if collscan:
+            logger.warning(f"COLLSCAN: {check.name} on {check.collection} {check.filter}")
+        report.append({
+            "name": check.name,
+            "collection": check.collection,
+            "stages": stages,
+            "index": next((stage["indexName"] for stage in plan if stage.get("indexName")), None),
+            "collscan": collscan,
+        })
+    return report
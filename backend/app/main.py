@@ -7,9 +7,14 @@ from contextlib import asynccontextmanager
 import logging
 
 from app.database import connect_to_mongodb, close_mongodb_connection
+from app.indexes import ensure_indexes
 from app.config import settings
+from app.services.pose_library import get_pose_library
+from app.services.exercise_name_index import build_exercise_name_index
+from app.services.exercise_job_queue import exercise_job_queue
+from app.services import bulk_writes, llm_gateway, llm_usage
 
-from app.routers import auth, users, exercises, records, analysis
+from app.routers import auth, users, exercises, records, analysis, admin
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,11 +32,22 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting Fitner API...")
     await connect_to_mongodb()
     logger.info("✅ Connected to MongoDB")
+    get_pose_library()
+    logger.info("✅ Loaded pose library")
+    build_exercise_name_index()
+    await ensure_indexes()
+    llm_usage.start_usage_flusher()
+    await exercise_job_queue.start()
+    bulk_writes.start_pending_purges()
     
     yield
     
     # 종료 시
     logger.info("🛑 Shutting down Fitner API...")
+    await exercise_job_queue.stop()
+    await bulk_writes.stop_pending_purges()
+    await llm_gateway.close()
+    await llm_usage.stop_usage_flusher()
     await close_mongodb_connection()
     logger.info("✅ Closed MongoDB connection")
 
@@ -124,6 +140,7 @@ app.include_router(users.router, prefix="/api/v1")
 app.include_router(exercises.router, prefix="/api/v1")
 app.include_router(records.router, prefix="/api/v1")
 app.include_router(analysis.router, prefix="/api/v1") 
+app.include_router(admin.router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+# app/projections.py
+"""
+Mongo 필드 projection (사용 목적별)
+
+운동 문서의 silhouette_animation / guide_poses와 기록의 score_history는 문서 대부분을 차지합니다.
+목록/이름 조회처럼 몇 개 필드만 쓰는 곳에서 통째로 읽지 않도록 라우터는 여기서 정의한 projection을 사용합니다.
+
+- 목록용 projection(LIST_PROJECTIONS)은 포함 방식만 쓰고 무거운 필드(HEAVY_FIELDS)를 읽지 않음
+  (문서에 필드가 추가돼도 목록 응답 크기가 늘지 않음 - tests/test_list_projections.py에서 확인)
+"""
+
+from typing import Dict
+
+Projection = Dict[str, int]
+
+# 목록 조회에서 읽으면 안 되는 필드
+HEAVY_FIELDS = ("silhouette_animation", "guide_poses", "score_history", "pose_analysis_summary.score_history")
+
+# 존재 여부 / ID만 필요할 때
+ID_ONLY: Projection = {"_id": 1}
+
+
+# --- 사용자 ---
+
+USER_BODY_CONDITION: Projection = {"body_condition": 1}
+USER_PASSWORD_HASH: Projection = {"password_hash": 1}
+
+
+# --- 운동 (generated_exercises / my_exercises) ---
+
+# 최근 추천 제외 목록 (이름만)
+EXERCISE_NAME: Projection = {"name": 1}
+
+# 내 운동 목록
+MY_EXERCISE_LIST: Projection = {
+    "name": 1,
+    "description": 1,
+    "duration_seconds": 1,
+    "intensity": 1,
+    "sets": 1,
+    "repetitions": 1,
+    "saved_at": 1,
+}
+
+# 운동 상세 (ExerciseResponse, guide_poses 제외)
+EXERCISE_DETAIL: Projection = {
+    "name": 1,
+    "description": 1,
+    "instructions": 1,
+    "duration_seconds": 1,
+    "repetitions": 1,
+    "sets": 1,
+    "target_parts": 1,
+    "safety_warnings": 1,
+    "intensity": 1,
+    "customization_params.intensity": 1,
+    "silhouette_animation": 1,
+    "saved_at": 1,
+    "created_at": 1,
+    "recommendation_reason": 1,
+}
+
+# 실시간 자세 분석 (기준 애니메이션 + 이름)
+EXERCISE_POSE_ANALYSIS: Projection = {"name": 1, "silhouette_animation": 1}
+
+# 운동 완료 기록 (이름 + 칼로리 계산용 강도)
+EXERCISE_COMPLETION: Projection = {"name": 1, "intensity": 1, "customization_params.intensity": 1}
+
+
+# --- 운동 기록 (records) ---
+
+# 기록 목록/상세 (_format_record_response 필드)
+RECORD_SUMMARY: Projection = {
+    "user_id": 1,
+    "exercise_id": 1,
+    "exercise_name": 1,
+    "completed_at": 1,
+    "duration_minutes": 1,
+    "completed_sets": 1,
+    "completed_reps": 1,
+    "score": 1,
+    "calories_burned": 1,
+    "pain_level_before": 1,
+    "pain_level_after": 1,
+    "feedback": 1,
+    # 요약 값만 (이전 기록은 pose_analysis_summary 안에도 점수 이력 배열이 있음)
+    "pose_analysis_summary.total_measurements": 1,
+    "pose_analysis_summary.average_score": 1,
+    "pose_analysis_summary.min_score": 1,
+    "pose_analysis_summary.max_score": 1,
+    "score_history_count": 1,
+}
+
+# 기록 상세 (점수 이력이 records 문서 안에 있던 이전 기록 포함)
+RECORD_DETAIL: Projection = {**RECORD_SUMMARY, "score_history": 1, "pose_analysis_summary.score_history": 1}
+
+
+# 목록/이름 조회용 projection (무거운 필드 금지)
+LIST_PROJECTIONS: Dict[str, Projection] = {
+    "ID_ONLY": ID_ONLY,
+    "EXERCISE_NAME": EXERCISE_NAME,
+    "MY_EXERCISE_LIST": MY_EXERCISE_LIST,
+    "EXERCISE_COMPLETION": EXERCISE_COMPLETION,
+    "RECORD_SUMMARY": RECORD_SUMMARY,
+}
+
@@ -0,0 +1,96 @@
+# backend/app/routers/admin.py
+
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from app.services import pose_cache, llm_gateway, llm_usage, recommendation_cache
+from app.services.exercise_name_index import get_name_index_stats
+from app.services.single_flight import get_single_flight_stats
+from app.utils.jwt_handler import verify_admin_key
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(verify_admin_key)])
+
+
+@router.get("/pose-cache/stats")
+async def get_pose_cache_stats():
+    """
+    AI 포즈 캐시 적중률 및 상태 조회
+    """
+    return pose_cache.get_pose_cache_stats()
+
+
+@router.delete("/pose-cache")
+async def invalidate_pose_cache(exercise_name: Optional[str] = None):
+    """
+    AI 포즈 캐시 무효화
+    
+    - exercise_name 지정 시 해당 운동만 삭제 (이름은 정규화 후 비교)
+    - 지정하지 않으면 전체 삭제
+    """
+    removed = await pose_cache.invalidate_poses(exercise_name)
+    return {
+        "message": "포즈 캐시가 무효화되었습니다.",
+        "exercise_name": exercise_name,
+        "removed": removed
+    }
+
+
+@router.get("/exercise-name-index/stats")
+async def get_exercise_name_index_stats():
+    """
+    운동 이름 퍼지 매칭 적중률 및 최근 미스 (점수가 임계값에 가까운 미스는 별칭 추가 후보)
+    """
+    return get_name_index_stats()
+
+
+@router.get("/recommendation-cache/stats")
+async def get_recommendation_cache_stats():
+    """
+    운동 추천 캐시 적중률 및 상태 조회
+    """
+    return recommendation_cache.get_recommendation_cache_stats()
+
+
+@router.delete("/recommendation-cache")
+async def invalidate_recommendation_cache():
+    """
+    운동 추천 캐시 전체 무효화
+    """
+    removed = await recommendation_cache.invalidate_recommendations()
+    return {
+        "message": "추천 캐시가 무효화되었습니다.",
+        "removed": removed
+    }
+
+
+@router.get("/single-flight/stats")
+async def get_llm_single_flight_stats():
+    """
+    LLM 호출 중복 제거 현황 (호출 지점별 실제 호출 수 / 합쳐진 호출 수)
+    """
+    return get_single_flight_stats()
+
+
+@router.get("/llm-gateway/stats")
+async def get_llm_gateway_stats():
+    """
+    LLM 게이트웨이 상태 (서킷 브레이커 상태, 호출 지점별 지연시간/토큰/재시도)
+    """
+    return llm_gateway.get_gateway_stats()
+
+
+@router.get("/llm-usage")
+async def get_llm_usage(hours: int = Query(24, ge=1, le=24 * 90)):
+    """
+    LLM 토큰/비용 사용량
+    
+    - current_process: 이 프로세스 시작 후 호출 지점별 사용량 (p95 지연시간 포함)
+    - persisted: Mongo에 저장된 최근 N시간 사용량 (모든 프로세스 합산)
+    """
+    return {
+        "current_process": llm_usage.get_usage_summary(),
+        "persisted": {
+            "hours": hours,
+            "call_sites": await llm_usage.get_persisted_usage(hours)
+        }
+    }
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/body-analysis", tags=["Body Analysis"])
 
 # 서비스 인스턴스 생성
-body_analysis_service = BodyAnalysisService(api_key=settings.OPENAI_API_KEY)
+body_analysis_service = BodyAnalysisService()
 
 
 class AnalyzeBodyRequest(BaseModel):
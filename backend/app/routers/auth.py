@@ -3,9 +3,11 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 import bcrypt
 
 from ..database import get_database
+from .. import projections
 from ..schemas.user_schema import UserRegister as RegisterRequest, UserLogin as LoginRequest
 from ..schemas.auth_schema import Token as AuthResponse
 from ..schemas.user_schema import UserResponse
@@ -22,7 +24,7 @@ async def register(request: RegisterRequest):
     db = await get_database()
     
     # 이메일 중복 체크
-    existing_user = await db.users.find_one({"email": request.email})
+    existing_user = await db.users.find_one({"email": request.email}, projections.ID_ONLY)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,8 +47,14 @@ async def register(request: RegisterRequest):
         "created_at": datetime.utcnow()
     }
     
-    # DB 삽입
-    result = await db.users.insert_one(user_doc)
+    # DB 삽입 (동시 가입 요청은 email 유니크 인덱스로 차단)
+    try:
+        result = await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 등록된 이메일입니다."
+        )
     user_id = str(result.inserted_id)
     
     # JWT 토큰 생성
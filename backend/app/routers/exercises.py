@@ -1,9 +1,12 @@
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from typing import List
 
 from app.database import get_database  # ⭐ 수정
+from app import projections
 from app.schemas.exercise_schema import (  # ⭐ 수정
     ExerciseGenerateRequest,
     ExerciseResponse,
@@ -11,11 +14,17 @@ from app.schemas.exercise_schema import (  # ⭐ 수정
     PoseAnalysisResponse,
     ExerciseCompleteRequest,
     ExerciseCompleteResponse,
-    RecommendationsResponse
+    RecommendationsResponse,
+    ExerciseJobResponse
 )
 from app.services import exercise_generation_service  # ⭐ 수정
 from app.services.pose_analysis_service import analyze_pose  # ⭐ 수정
+from app.services import bulk_writes, record_stats_service, score_history_service
+from app.services.exercise_resolver import resolve_exercise, resolve_exercise_for_completion
+from app.services.exercise_job_queue import exercise_job_queue, JobQueueFullError, TERMINAL_STATUSES
 from app.utils.jwt_handler import get_current_user  # ⭐ 수정
+from app.utils.sse import format_sse, SSE_HEADERS
+from app.utils.exercise_names import exercise_name_search_fields
 
 router = APIRouter(prefix="/exercises", tags=["Exercises"])
 
@@ -25,7 +34,7 @@ async def get_exercise_recommendations(current_user: dict = Depends(get_current_
     db = await get_database()
     user_id = ObjectId(current_user["user_id"])
     
-    user = await db.users.find_one({"_id": user_id})
+    user = await db.users.find_one({"_id": user_id}, projections.USER_BODY_CONDITION)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
     
@@ -40,7 +49,7 @@ async def get_exercise_recommendations(current_user: dict = Depends(get_current_
         recent_exercises = await db.generated_exercises.find({
             "user_id": user_id,
             "created_at": {"$gte": datetime.utcnow() - timedelta(hours=24)}
-        }).to_list(length=None)
+        }, projections.EXERCISE_NAME).to_list(length=None)
         
         exclude_names = [ex.get("name") for ex in recent_exercises if ex.get("name")]
         
@@ -53,39 +62,131 @@ async def get_exercise_recommendations(current_user: dict = Depends(get_current_
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"AI 추천 생성 오류: {str(e)}")
 
+    # 추천 운동은 서로 독립적이므로 한 번에 삽입 (저장에 실패한 운동은 응답에서 제외)
+    exercise_docs = [_build_recommendation_doc(user_id, rec) for rec in recommendations]
+    saved = await bulk_writes.insert_documents(db.generated_exercises, exercise_docs)
+    
     recommended_exercises = []
-    for rec in recommendations:
-        duration_minutes = rec.get("duration_minutes", 10)
-        
-        # ✅ 수정: silhouette_animation은 이미 rec에 포함되어 있음
-        exercise_doc = {
-            "user_id": user_id,
-            "name": rec.get("name"),
-            "description": rec.get("description"),
-            "instructions": rec.get("instructions", []),
-            "duration_seconds": duration_minutes * 60,  # ✅ 수정
-            "duration_minutes": duration_minutes,
-            "repetitions": rec.get("repetitions"),
-            "sets": rec.get("sets"),
-            "intensity": rec.get("intensity", "medium"),
-            "target_parts": rec.get("target_parts", []),
-            "safety_warnings": rec.get("safety_warnings", []),
-            "silhouette_animation": rec.get("silhouette_animation", {}),  # ✅ 이미 있음
-            "guide_poses": rec.get("guide_poses", []),  # ✅ 추가
-            "customization_params": {"intensity": rec.get("intensity", "medium")},
-            "recommendation_reason": rec.get("recommendation_reason"),
-            "is_saved": False,  # ✅ 기본값: 저장 안됨
-            "created_at": datetime.utcnow(),
-            "expires_at": datetime.utcnow() + timedelta(days=1)
-        }
-        result = await db.generated_exercises.insert_one(exercise_doc)
-        
-        rec["exercise_id"] = str(result.inserted_id)
+    for rec, exercise_doc, ok in zip(recommendations, exercise_docs, saved):
+        if not ok:
+            continue
+        rec["exercise_id"] = str(exercise_doc["_id"])
         recommended_exercises.append(rec)
 
     return RecommendationsResponse(exercises=recommended_exercises)
 
 
+@router.get("/recommendations/stream")
+async def stream_exercise_recommendations(current_user: dict = Depends(get_current_user)):
+    """
+    운동 추천을 Server-Sent Events로 스트리밍합니다.
+    
+    - event: recommendations → LLM 응답 직후 추천 운동 메타데이터 전송
+    - event: exercise → 각 운동의 애니메이션 생성 및 저장 완료 시 exercise_id 전송
+    - event: done / error → 스트림 종료
+    """
+    db = await get_database()
+    user_id = ObjectId(current_user["user_id"])
+    
+    user = await db.users.find_one({"_id": user_id}, projections.USER_BODY_CONDITION)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
+    
+    body_condition = user.get("body_condition")
+    if not body_condition or not body_condition.get("injured_parts"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="운동 추천을 위한 사용자 신체 정보가 부족합니다."
+        )
+    
+    recent_exercises = await db.generated_exercises.find({
+        "user_id": user_id,
+        "created_at": {"$gte": datetime.utcnow() - timedelta(hours=24)}
+    }, projections.EXERCISE_NAME).to_list(length=None)
+    exclude_names = [ex.get("name") for ex in recent_exercises if ex.get("name")]
+    
+    async def event_stream():
+        completed = 0
+        try:
+            async for event, payload in exercise_generation_service.stream_exercise_recommendations(
+                body_condition,
+                exclude_exercises=exclude_names
+            ):
+                if event == "recommendations":
+                    if not payload:
+                        yield format_sse("error", {"message": "AI 추천 서버 응답 실패"})
+                        return
+                    yield format_sse("recommendations", {
+                        "exercises": [
+                            {"index": idx, **_recommendation_metadata(rec)}
+                            for idx, rec in enumerate(payload)
+                        ]
+                    })
+                    continue
+                
+                idx, rec = payload
+                result = await db.generated_exercises.insert_one(_build_recommendation_doc(user_id, rec))
+                completed += 1
+                yield format_sse("exercise", {
+                    "index": idx,
+                    "exercise_id": str(result.inserted_id),
+                    "name": rec.get("name"),
+                    "animation_ready": True,
+                    "keyframe_count": len(rec.get("silhouette_animation", {}).get("keyframes", []))
+                })
+            
+            yield format_sse("done", {"count": completed})
+        
+        except Exception as e:
+            print(f"❌ 추천 스트리밍 오류: {e}")
+            yield format_sse("error", {"message": f"AI 추천 생성 오류: {str(e)}"})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+def _recommendation_metadata(rec: dict) -> dict:
+    """애니메이션 데이터를 제외한 추천 운동 메타데이터"""
+    return {
+        "name": rec.get("name"),
+        "description": rec.get("description"),
+        "instructions": rec.get("instructions", []),
+        "safety_warnings": rec.get("safety_warnings", []),
+        "target_parts": rec.get("target_parts", []),
+        "duration_minutes": rec.get("duration_minutes", 10),
+        "intensity": rec.get("intensity", "medium"),
+        "sets": rec.get("sets"),
+        "repetitions": rec.get("repetitions"),
+        "recommendation_reason": rec.get("recommendation_reason")
+    }
+
+
+def _build_recommendation_doc(user_id: ObjectId, rec: dict) -> dict:
+    """추천 운동을 generated_exercises 문서로 변환"""
+    duration_minutes = rec.get("duration_minutes", 10)
+    
+    # ✅ 수정: silhouette_animation은 이미 rec에 포함되어 있음
+    return {
+        "user_id": user_id,
+        "name": rec.get("name"),
+        "description": rec.get("description"),
+        "instructions": rec.get("instructions", []),
+        "duration_seconds": duration_minutes * 60,  # ✅ 수정
+        "duration_minutes": duration_minutes,
+        "repetitions": rec.get("repetitions"),
+        "sets": rec.get("sets"),
+        "intensity": rec.get("intensity", "medium"),
+        "target_parts": rec.get("target_parts", []),
+        "safety_warnings": rec.get("safety_warnings", []),
+        "silhouette_animation": rec.get("silhouette_animation", {}),  # ✅ 이미 있음
+        "guide_poses": rec.get("guide_poses", []),  # ✅ 추가
+        "customization_params": {"intensity": rec.get("intensity", "medium")},
+        "recommendation_reason": rec.get("recommendation_reason"),
+        "is_saved": False,  # ✅ 기본값: 저장 안됨
+        "created_at": datetime.utcnow(),
+        "expires_at": datetime.utcnow() + timedelta(days=1)
+    }
+
+
 @router.post("/{exercise_id}/save")
 async def save_exercise(
     exercise_id: str,
@@ -117,7 +218,7 @@ async def save_exercise(
         existing = await db.my_exercises.find_one({
             "user_id": user_id,
             "original_exercise_id": exercise_oid
-        })
+        }, projections.ID_ONLY)
         
         if existing:
             return {
@@ -158,7 +259,20 @@ async def save_exercise(
             # ✅ TTL 없음 = 영구 저장!
         }
         
-        result = await db.my_exercises.insert_one(my_exercise_doc)
+        try:
+            result = await db.my_exercises.insert_one(my_exercise_doc)
+        except DuplicateKeyError:
+            # 동시에 들어온 저장 요청 (user_id + original_exercise_id 유니크 인덱스)
+            existing = await db.my_exercises.find_one(
+                {"user_id": user_id, "original_exercise_id": exercise_oid},
+                projections.ID_ONLY
+            )
+            return {
+                "message": "이미 저장된 운동입니다.",
+                "exercise_id": str(existing["_id"]),
+                "exercise_name": exercise.get("name"),
+                "is_new": False
+            }
         
         # 4. generated_exercises의 is_saved도 업데이트 (선택)
         await db.generated_exercises.update_one(
@@ -185,7 +299,7 @@ async def save_exercise(
 async def generate_exercise(request: ExerciseGenerateRequest, current_user: dict = Depends(get_current_user)):
     """사용자 맞춤 운동 생성 (AI 기반)"""
     db = await get_database()
-    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])})
+    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])}, projections.USER_BODY_CONDITION)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
     
@@ -200,24 +314,9 @@ async def generate_exercise(request: ExerciseGenerateRequest, current_user: dict
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"운동 생성 오류: {str(e)}")
     
-    exercise_doc = {
-        "user_id": ObjectId(current_user["user_id"]),
-        "base_template_id": generated_exercise.get("base_template_id"),
-        "name": generated_exercise["name"], 
-        "description": generated_exercise["description"],
-        "instructions": generated_exercise["instructions"], 
-        "duration_seconds": generated_exercise["duration_seconds"],
-        "repetitions": generated_exercise["repetitions"], 
-        "sets": generated_exercise["sets"],
-        "target_parts": generated_exercise["target_parts"], 
-        "safety_warnings": generated_exercise["safety_warnings"],
-        "silhouette_animation": generated_exercise.get("silhouette_animation"),
-        "guide_poses": generated_exercise.get("guide_poses", []),  # ✅ 추가
-        "customization_params": generated_exercise.get("customization_params", {}),
-        "is_saved": True,
-        "created_at": datetime.utcnow(), 
-        "expires_at": datetime.utcnow() + timedelta(days=7)
-    }
+    exercise_doc = exercise_generation_service.build_generated_exercise_doc(
+        ObjectId(current_user["user_id"]), generated_exercise
+    )
     result = await db.generated_exercises.insert_one(exercise_doc)
     exercise_id = str(result.inserted_id)
     
@@ -237,13 +336,131 @@ async def generate_exercise(request: ExerciseGenerateRequest, current_user: dict
     )
 
 
+def _job_response(job: dict) -> ExerciseJobResponse:
+    return ExerciseJobResponse(
+        job_id=str(job["_id"]),
+        status=job["status"],
+        exercise_id=str(job["exercise_id"]) if job.get("exercise_id") else None,
+        error=job.get("error"),
+        created_at=job["created_at"].isoformat(),
+        updated_at=job["updated_at"].isoformat()
+    )
+
+
+@router.post("/generate/jobs", response_model=ExerciseJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generate_exercise_job(request: ExerciseGenerateRequest, current_user: dict = Depends(get_current_user)):
+    """
+    사용자 맞춤 운동 생성 작업 등록 (비동기)
+    - 즉시 job_id 반환, 결과는 /jobs/{job_id} 또는 /jobs/{job_id}/events 로 확인
+    """
+    db = await get_database()
+    user_id = ObjectId(current_user["user_id"])
+    if not await db.users.find_one({"_id": user_id}, projections.ID_ONLY):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
+
+    try:
+        job = await exercise_job_queue.submit(user_id, request.model_dump(exclude={"focus_areas"}))
+    except JobQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="운동 생성 요청이 많습니다. 잠시 후 다시 시도해주세요."
+        )
+
+    return _job_response(job)
+
+
+async def _get_user_job(job_id: str, user_id: ObjectId) -> dict:
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 작업 ID입니다.")
+    job = await exercise_job_queue.get_job(job_id, user_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=ExerciseJobResponse)
+async def get_generate_exercise_job(job_id: str, current_user: dict = Depends(get_current_user)):
+    """운동 생성 작업 상태 조회"""
+    job = await _get_user_job(job_id, ObjectId(current_user["user_id"]))
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_generate_exercise_job(job_id: str, current_user: dict = Depends(get_current_user)):
+    """
+    운동 생성 작업 상태 스트리밍 (Server-Sent Events)
+    - status 이벤트: 상태가 바뀔 때마다 전송, succeeded/failed 후 종료
+    """
+    user_id = ObjectId(current_user["user_id"])
+    job = await _get_user_job(job_id, user_id)
+
+    async def event_stream():
+        current = job
+        last_status = None
+        while True:
+            if current["status"] != last_status:
+                last_status = current["status"]
+                yield format_sse("status", _job_response(current).model_dump())
+            if last_status in TERMINAL_STATUSES:
+                break
+            await exercise_job_queue.wait_for_update(job_id, timeout=1.0)
+            current = await exercise_job_queue.get_job(job_id, user_id)
+            if not current:
+                yield format_sse("error", {"message": "작업을 찾을 수 없습니다."})
+                break
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+# /{exercise_id}보다 먼저 등록해야 "my-exercises"가 운동 ID로 해석되지 않음
+@router.get("/my-exercises")
+async def get_my_exercises(
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    내 운동 목록 조회 (My Exercise 페이지용)
+    ✅ 수정: my_exercises 컬렉션에서 조회 (영구 저장된 운동)
+    """
+    try:
+        # ✅ my_exercises 컬렉션에서 조회 (generated_exercises 아님!)
+        exercises = await db.my_exercises.find({
+            "user_id": ObjectId(current_user["user_id"])
+        }, projections.MY_EXERCISE_LIST).sort("saved_at", -1).to_list(length=None)
+        
+        formatted_exercises = []
+        for ex in exercises:
+            # ✅ duration_minutes 계산 (초 단위를 분으로 변환)
+            duration_seconds = ex.get("duration_seconds", 0)
+            duration_minutes = duration_seconds // 60 if duration_seconds else 10
+            
+            formatted_exercises.append({
+                "exercise_id": str(ex["_id"]),  # ✅ my_exercises의 ID 사용
+                "name": ex.get("name"),
+                "description": ex.get("description"),
+                "duration_minutes": duration_minutes,
+                "intensity": ex.get("intensity", "medium"),
+                "sets": ex.get("sets"),
+                "repetitions": ex.get("repetitions"),
+                "created_at": ex.get("saved_at").isoformat() if ex.get("saved_at") else None  # ✅ saved_at 사용
+            })
+        
+        return {
+            "total": len(formatted_exercises),
+            "exercises": formatted_exercises
+        }
+        
+    except Exception as e:
+        print(f"❌ 운동 목록 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"운동 목록 조회 실패: {str(e)}")
+
+
 @router.get("/{exercise_id}", response_model=ExerciseResponse)
 async def get_exercise(exercise_id: str, current_user: dict = Depends(get_current_user)):
     """
     특정 운동 상세 조회
-    ✅ 수정: my_exercises와 generated_exercises 둘 다 확인
+    ✅ 수정: my_exercises와 generated_exercises 둘 다 확인 (한 번의 조회)
     """
-    db = await get_database()
     try:
         obj_id = ObjectId(exercise_id)
     except Exception:
@@ -251,20 +468,12 @@ async def get_exercise(exercise_id: str, current_user: dict = Depends(get_curren
     
     user_oid = ObjectId(current_user["user_id"])
     
-    # ✅ 먼저 my_exercises에서 찾기
-    exercise = await db.my_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    # ✅ 없으면 generated_exercises에서 찾기
-    if not exercise:
-        exercise = await db.generated_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    if not exercise:
+    resolved = await resolve_exercise(obj_id, user_oid, projections.EXERCISE_DETAIL)
+    if not resolved:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="운동을 찾을 수 없거나 접근 권한이 없습니다.")
     
-    # ✅ intensity 처리
-    intensity = exercise.get("intensity")
-    if not intensity:
-        intensity = exercise.get("customization_params", {}).get("intensity", "medium")
+    exercise = resolved.doc
+    intensity = resolved.intensity
     
     return ExerciseResponse(
         exercise_id=str(exercise["_id"]), 
@@ -292,10 +501,8 @@ async def analyze_pose_realtime(
 ):
     """
     실시간 자세 분석 및 피드백 제공
-    ✅ 수정: my_exercises와 generated_exercises 둘 다 확인
+    ✅ 수정: my_exercises와 generated_exercises 둘 다 확인 (한 번의 조회)
     """
-    db = await get_database()
-    
     try: 
         obj_id = ObjectId(exercise_id)
     except Exception: 
@@ -303,14 +510,8 @@ async def analyze_pose_realtime(
     
     user_oid = ObjectId(current_user["user_id"])
     
-    # ✅ 먼저 my_exercises에서 찾기
-    exercise = await db.my_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    # ✅ 없으면 generated_exercises에서 찾기
-    if not exercise:
-        exercise = await db.generated_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    if not exercise: 
+    resolved = await resolve_exercise(obj_id, user_oid, projections.EXERCISE_POSE_ANALYSIS)
+    if not resolved: 
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="운동을 찾을 수 없거나 접근 권한이 없습니다."
@@ -319,7 +520,7 @@ async def analyze_pose_realtime(
     try: 
         analysis_result = await analyze_pose(
             pose_landmarks=request.pose_landmarks, 
-            exercise_data=exercise, 
+            exercise_data=resolved.doc, 
             timestamp_ms=request.timestamp_ms
         )
     except Exception as e: 
@@ -341,6 +542,7 @@ async def complete_exercise(
     """
     운동 완료 기록 저장
     ✅ 수정: my_exercises와 generated_exercises 둘 다 확인
+    (내 운동이면 조회와 수행 횟수 갱신을 한 번에 → 기록 저장 포함 2번의 DB 왕복)
     """
     db = await get_database()
     
@@ -351,33 +553,17 @@ async def complete_exercise(
     
     user_oid = ObjectId(current_user["user_id"])
     
-    # ✅ 먼저 my_exercises에서 찾기
-    exercise = await db.my_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    # ✅ 없으면 generated_exercises에서 찾기
-    if not exercise:
-        exercise = await db.generated_exercises.find_one({"_id": obj_id, "user_id": user_oid})
-    
-    if not exercise: 
+    # ✅ my_exercises면 last_performed_at / total_performed_count 업데이트, 없으면 generated_exercises
+    resolved = await resolve_exercise_for_completion(obj_id, user_oid)
+    if not resolved: 
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="운동을 찾을 수 없거나 접근 권한이 없습니다."
         )
-    
-    # ✅ 운동이 my_exercises에 있으면 last_performed_at 업데이트
-    if await db.my_exercises.find_one({"_id": obj_id}):
-        await db.my_exercises.update_one(
-            {"_id": obj_id},
-            {
-                "$set": {"last_performed_at": datetime.utcnow()},
-                "$inc": {"total_performed_count": 1}
-            }
-        )
+    exercise = resolved.doc
     
     # ✅ 칼로리 계산
-    intensity = exercise.get("intensity")
-    if not intensity:
-        intensity = exercise.get("customization_params", {}).get("intensity", "medium")
+    intensity = resolved.intensity
     
     intensity_multiplier = {"low": 1.0, "medium": 1.5, "high": 2.0}.get(intensity, 1.5)
     calories_burned = int(request.duration_minutes * 3 * intensity_multiplier)
@@ -405,11 +591,14 @@ async def complete_exercise(
         feedback["summary"] = "처음이라 어려울 수 있어요. 천천히 연습해보세요."
         feedback["improvements"] = ["천천히 동작을 따라해보세요", "가이드를 켜고 연습해보세요"]
     
-    # ✅ 기록 저장
+    # ✅ 기록 저장 (점수 이력은 0~100 정수로 맞춤 - 범위 밖/소수 점수도 거부하지 않음)
+    score_history = score_history_service.normalize_scores(request.score_history)
     record_doc = {
+        "_id": ObjectId(),
         "user_id": user_oid, 
         "exercise_id": obj_id, 
         "exercise_name": exercise["name"],
+        **exercise_name_search_fields(exercise["name"]),
         "completed_at": datetime.utcnow(), 
         "duration_minutes": request.duration_minutes,
         "completed_sets": request.completed_sets, 
@@ -419,10 +608,14 @@ async def complete_exercise(
         "pain_level_before": request.pain_level_before, 
         "pain_level_after": request.pain_level_after,
         "feedback": feedback,
-        "score_history": request.score_history if hasattr(request, 'score_history') else []
+        # 점수 이력은 record_score_histories에 따로 저장 (기록 문서에는 샘플 수만)
+        "score_history_count": len(score_history)
     }
     
+    # 기록을 먼저 저장한 뒤 점수 이력 저장 (이력 저장 실패는 로그만 - 통계 훅과 동일)
     result = await db.records.insert_one(record_doc)
+    await score_history_service.save_score_history(record_doc["_id"], user_oid, score_history)
+    await record_stats_service.on_record_created(record_doc)
     
     print(f"✅ 운동 기록 저장 완료: {result.inserted_id}")
     
@@ -452,7 +645,7 @@ async def delete_exercise(
         exercise = await db.my_exercises.find_one({
             "_id": exercise_oid,
             "user_id": user_oid
-        })
+        }, projections.EXERCISE_NAME)
         
         if not exercise:
             raise HTTPException(status_code=404, detail="운동을 찾을 수 없거나 삭제 권한이 없습니다.")
@@ -479,45 +672,3 @@ async def delete_exercise(
         if "not a valid ObjectId" in str(e):
             raise HTTPException(status_code=400, detail="올바르지 않은 운동 ID입니다.")
         raise HTTPException(status_code=500, detail=f"운동 삭제 실패: {str(e)}")
-
-
-@router.get("/my-exercises")
-async def get_my_exercises(
-    current_user: dict = Depends(get_current_user),
-    db = Depends(get_database)
-):
-    """
-    내 운동 목록 조회 (My Exercise 페이지용)
-    ✅ 수정: my_exercises 컬렉션에서 조회 (영구 저장된 운동)
-    """
-    try:
-        # ✅ my_exercises 컬렉션에서 조회 (generated_exercises 아님!)
-        exercises = await db.my_exercises.find({
-            "user_id": ObjectId(current_user["user_id"])
-        }).sort("saved_at", -1).to_list(length=None)
-        
-        formatted_exercises = []
-        for ex in exercises:
-            # ✅ duration_minutes 계산 (초 단위를 분으로 변환)
-            duration_seconds = ex.get("duration_seconds", 0)
-            duration_minutes = duration_seconds // 60 if duration_seconds else 10
-            
-            formatted_exercises.append({
-                "exercise_id": str(ex["_id"]),  # ✅ my_exercises의 ID 사용
-                "name": ex.get("name"),
-                "description": ex.get("description"),
-                "duration_minutes": duration_minutes,
-                "intensity": ex.get("intensity", "medium"),
-                "sets": ex.get("sets"),
-                "repetitions": ex.get("repetitions"),
-                "created_at": ex.get("saved_at").isoformat() if ex.get("saved_at") else None  # ✅ saved_at 사용
-            })
-        
-        return {
-            "total": len(formatted_exercises),
-            "exercises": formatted_exercises
-        }
-        
-    except Exception as e:
-        print(f"❌ 운동 목록 조회 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"운동 목록 조회 실패: {str(e)}")
@@ -2,18 +2,27 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
+import re
 from datetime import datetime, timedelta
 from bson import ObjectId
 
+from app import projections
+from app.config import settings
 from app.database import get_database
+from app.services import record_stats_service, score_history_service
+from app.services.exercise_resolver import resolve_exercise
 from app.utils.jwt_handler import get_current_user
+from app.utils.pagination import after_cursor_filter, encode_cursor
+from app.utils.exercise_names import exercise_name_search_fields, name_bigrams, search_exercise_name
 from app.schemas.record_schema import (
     RecordCreate,
     RecordResponse,
     RecordListResponse,
     RecordStatisticsResponse,
-    DailyBreakdown
+    DailyBreakdown,
+    ExerciseNameSuggestionsResponse
 )
+from app.schemas.stats_schema import CumulativeStatsResponse
 
 router = APIRouter(prefix="/records", tags=["records"])
 
@@ -28,19 +37,28 @@ async def create_record(
     운동 완료 후 기록 생성
     """
     try:
-        # 운동 정보 조회
-        exercise = await db.generated_exercises.find_one({
-            "_id": ObjectId(record_data.exercise_id)
-        })
+        # 운동 정보 조회 (my_exercises / generated_exercises)
+        resolved = await resolve_exercise(
+            ObjectId(record_data.exercise_id),
+            ObjectId(current_user["user_id"]),
+            projections.EXERCISE_COMPLETION
+        )
         
-        if not exercise:
+        if not resolved:
             raise HTTPException(status_code=404, detail="운동을 찾을 수 없습니다.")
+        exercise = resolved.doc
+        
+        # 점수 이력은 record_score_histories에 따로 저장 (pose_analysis_summary에는 요약 값만)
+        summary = dict(record_data.pose_analysis_summary) if record_data.pose_analysis_summary else None
+        score_history = score_history_service.numeric_scores(summary.pop("score_history", None) if summary else None)
         
         # 기록 문서 생성
         record_doc = {
+            "_id": ObjectId(),
             "user_id": ObjectId(current_user["user_id"]),
             "exercise_id": ObjectId(record_data.exercise_id),
             "exercise_name": exercise.get("name"),
+            **exercise_name_search_fields(exercise.get("name")),
             "completed_at": datetime.utcnow(),
             "duration_minutes": record_data.duration_minutes,
             "completed_sets": record_data.completed_sets,
@@ -48,17 +66,20 @@ async def create_record(
             "score": record_data.average_score,
             "calories_burned": _calculate_calories(
                 duration_minutes=record_data.duration_minutes,
-                intensity=exercise.get("intensity", "medium")
+                intensity=resolved.intensity
             ),
             "pain_level_before": record_data.pain_level_before,
             "pain_level_after": record_data.pain_level_after,
             "feedback": record_data.feedback.dict() if record_data.feedback else None,
-            "pose_analysis_summary": record_data.pose_analysis_summary,
+            "pose_analysis_summary": summary,
+            "score_history_count": len(score_history),
             "created_at": datetime.utcnow()
         }
         
-        result = await db.records.insert_one(record_doc)
-        record_doc["_id"] = result.inserted_id
+        # 기록을 먼저 저장한 뒤 점수 이력 저장 (이력 저장 실패는 로그만)
+        await db.records.insert_one(record_doc)
+        await score_history_service.save_score_history(record_doc["_id"], record_doc["user_id"], score_history)
+        await record_stats_service.on_record_created(record_doc)
         
         # ObjectId를 문자열로 변환하여 반환
         return _format_record_response(record_doc)
@@ -71,6 +92,8 @@ async def create_record(
 async def get_records(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (키셋 페이지네이션, page 대신 사용)"),
+    include_total: bool = Query(False, description="커서 모드에서 전체 개수 포함 여부"),
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     exercise_name: Optional[str] = Query(None, description="운동 이름 필터"),
@@ -79,10 +102,17 @@ async def get_records(
 ):
     """
     사용자의 운동 기록 목록 조회 (페이지네이션, 필터링 지원)
+    
+    - page 모드: 기존 방식 (skip), 항상 total 포함
+    - 커서 모드: cursor가 있거나 첫 페이지에서 next_cursor를 이어서 요청
+      (completed_at, _id) 범위 조회라 깊은 페이지도 느려지지 않음, total은 include_total일 때만
+    - total은 가능하면 통계 롤업(user_stats/daily_stats)에서 계산하고, 운동 이름 필터가 있을 때만 count
     """
     try:
+        user_oid = ObjectId(current_user["user_id"])
+        
         # 필터 조건 구성
-        query = {"user_id": ObjectId(current_user["user_id"])}
+        query = {"user_id": user_oid}
         
         # 날짜 필터
         if start_date or end_date:
@@ -94,19 +124,41 @@ async def get_records(
                 date_filter["$lt"] = end_datetime
             query["completed_at"] = date_filter
         
-        # 운동 이름 필터
+        # 운동 이름 필터 (검색 키 부분 일치, 2-gram 인덱스 사용)
         if exercise_name:
-            query["exercise_name"] = {"$regex": exercise_name, "$options": "i"}
-        
-        # 전체 개수 조회
-        total = await db.records.count_documents(query)
+            query.update(_exercise_name_contains_filter(exercise_name))
         
-        # 페이지네이션
-        skip = (page - 1) * limit
+        # 전체 개수 (커서 모드에서는 요청할 때만)
+        total = None
+        if cursor is None or include_total:
+            total = await _count_records(db, user_oid, query, start_date, end_date, exercise_name)
         
         # 기록 조회 (최신순 정렬)
-        cursor = db.records.find(query).sort("completed_at", -1).skip(skip).limit(limit)
-        records = await cursor.to_list(length=limit)
+        page_query = query
+        if cursor:
+            try:
+                # 이름 필터도 $or를 쓰므로 $and로 합침
+                page_query = {"$and": [query, after_cursor_filter(cursor)]}
+            except ValueError:
+                raise HTTPException(status_code=400, detail="올바르지 않은 커서입니다.")
+            skip = 0
+        else:
+            skip = (page - 1) * limit
+        
+        records_cursor = (
+            db.records.find(page_query, projections.RECORD_SUMMARY)
+            .sort([("completed_at", -1), ("_id", -1)])
+            .skip(skip)
+            .limit(limit + 1)
+        )
+        records = await records_cursor.to_list(length=limit + 1)
+        
+        # 한 개 더 읽어서 다음 페이지 존재 여부 확인
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_cursor(last["completed_at"], last["_id"])
         
         # 응답 포맷팅
         formatted_records = [_format_record_response(record) for record in records]
@@ -115,13 +167,114 @@ async def get_records(
             "total": total,
             "page": page,
             "limit": limit,
-            "records": formatted_records
+            "records": formatted_records,
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"기록 조회 실패: {str(e)}")
 
 
+@router.get("/search", response_model=RecordListResponse)
+async def search_records(
+    q: str = Query(..., min_length=1, description="운동 이름 검색어"),
+    match: str = Query("prefix", regex="^(prefix|contains)$", description="prefix: 이름 앞부분 일치 / contains: 부분 일치"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    운동 이름으로 기록 검색 (검색 키 기준, 대소문자/띄어쓰기/구두점 차이 무시)
+    
+    - prefix: (user_id, exercise_name_search, completed_at) 인덱스 범위 조회, 이름순 → 최신순
+    - contains: 이름 2-gram 인덱스로 부분 일치 ("스쿼트" → "벽 스쿼트", "의자 스쿼트"), 최신순
+    - 검색 키 필드가 없는 이전 기록은 원래 이름 정규식으로 찾음 (_legacy_exercise_name_filter)
+    """
+    key = search_exercise_name(q)
+    if not key:
+        return {"total": None, "page": 1, "limit": limit, "records": [], "next_cursor": None}
+    
+    try:
+        user_oid = ObjectId(current_user["user_id"])
+        if match == "prefix":
+            query = {
+                "user_id": user_oid,
+                "$or": [
+                    {"exercise_name_search": {"$regex": f"^{re.escape(key)}"}},
+                    _legacy_exercise_name_filter(f"^{re.escape(q.strip())}"),
+                ],
+            }
+            sort = [("exercise_name_search", 1), ("completed_at", -1)]
+        else:
+            query = {"user_id": user_oid, **_exercise_name_contains_filter(q)}
+            sort = [("completed_at", -1), ("_id", -1)]
+        
+        records = await db.records.find(query, projections.RECORD_SUMMARY).sort(sort).limit(limit).to_list(length=limit)
+        
+        return {
+            "total": None,
+            "page": 1,
+            "limit": limit,
+            "records": [_format_record_response(record) for record in records],
+            "next_cursor": None
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"기록 검색 실패: {str(e)}")
+
+
+@router.get("/exercise-names", response_model=ExerciseNameSuggestionsResponse)
+async def get_exercise_name_suggestions(
+    prefix: str = Query("", description="이름 앞부분 (비우면 전체)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    내가 기록한 운동 이름 자동완성 (검색 키별 1개, 많이 한 순)
+    검색 키 필드가 없는 이전 기록은 원래 이름 정규식으로 찾고 소문자 이름으로 묶음
+    """
+    try:
+        match = {"user_id": ObjectId(current_user["user_id"])}
+        key = search_exercise_name(prefix)
+        if key:
+            match["$or"] = [
+                {"exercise_name_search": {"$regex": f"^{re.escape(key)}"}},
+                _legacy_exercise_name_filter(f"^{re.escape(prefix.strip())}"),
+            ]
+        
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"exercise_name_search": 1, "completed_at": -1}},
+            {"$group": {
+                "_id": {"$ifNull": ["$exercise_name_search", {"$toLower": "$exercise_name"}]},
+                "exercise_name": {"$first": "$exercise_name"},
+                "count": {"$sum": 1},
+                "last_completed_at": {"$first": "$completed_at"}
+            }},
+            {"$sort": {"count": -1, "last_completed_at": -1}},
+            {"$limit": limit}
+        ]
+        names = await db.records.aggregate(pipeline).to_list(length=limit)
+        
+        return {
+            "names": [
+                {
+                    "exercise_name": item["exercise_name"],
+                    "count": item["count"],
+                    "last_completed_at": item["last_completed_at"].isoformat() if item.get("last_completed_at") else None
+                }
+                for item in names
+                if item["_id"]
+            ]
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"운동 이름 조회 실패: {str(e)}")
+
+
 @router.get("/{record_id}", response_model=RecordResponse)
 async def get_record_detail(
     record_id: str,
@@ -135,12 +288,24 @@ async def get_record_detail(
         record = await db.records.find_one({
             "_id": ObjectId(record_id),
             "user_id": ObjectId(current_user["user_id"])
-        })
+        }, projections.RECORD_DETAIL)
         
         if not record:
             raise HTTPException(status_code=404, detail="기록을 찾을 수 없습니다.")
         
-        return _format_record_response(record)
+        # 점수 이력 (이전 기록은 문서 안의 배열, 이후 기록은 record_score_histories)
+        summary = record.get("pose_analysis_summary") or {}
+        legacy_history = record.get("score_history") or summary.pop("score_history", None)
+        response = _format_record_response(record)
+        
+        if legacy_history:
+            response["score_history"] = score_history_service.normalize_scores(legacy_history)
+        elif record.get("score_history_count"):
+            history = await score_history_service.get_score_history(record["_id"])
+            if history:
+                response.update(history)
+        
+        return response
         
     except Exception as e:
         if "not a valid ObjectId" in str(e):
@@ -167,15 +332,27 @@ async def get_statistics(
         else:  # year
             start_date = now - timedelta(days=365)
         
+        user_oid = ObjectId(current_user["user_id"])
+        
+        # 일별 롤업에서 계산 (기간 시작일의 기록은 하루 전체 포함)
+        if settings.RECORD_STATS_SOURCE == "rollup":
+            days = await record_stats_service.get_daily_stats(
+                user_oid, record_stats_service.day_key(start_date)
+            )
+            return {"period": period, **record_stats_service.summarize_daily_stats(days)}
+        
         # 기간 내 기록 조회
         query = {
-            "user_id": ObjectId(current_user["user_id"]),
+            "user_id": user_oid,
             "completed_at": {"$gte": start_date}
         }
         
-        records = await db.records.find(query).to_list(length=None)
+        # 합계/운동별/일별 집계를 한 번의 $facet 파이프라인으로 계산 (기록 문서는 서버 밖으로 나오지 않음)
+        facets = await db.records.aggregate(_statistics_pipeline(query)).to_list(length=1)
+        facet = facets[0] if facets else {}
+        totals = facet.get("totals") or []
         
-        if not records:
+        if not totals:
             return {
                 "period": period,
                 "total_exercises": 0,
@@ -186,66 +363,35 @@ async def get_statistics(
                 "daily_breakdown": []
             }
         
-        # 통계 계산
-        total_exercises = len(records)
-        total_duration = sum(r.get("duration_minutes", 0) for r in records)
-        total_calories = sum(r.get("calories_burned", 0) for r in records)
-        average_score = sum(r.get("score", 0) for r in records) / total_exercises
+        summary = totals[0]
         
         # 가장 많이 한 운동
-        exercise_counts = {}
-        for record in records:
-            ex_id = str(record.get("exercise_id"))
-            ex_name = record.get("exercise_name")
-            if ex_id not in exercise_counts:
-                exercise_counts[ex_id] = {"name": ex_name, "count": 0}
-            exercise_counts[ex_id]["count"] += 1
-        
         most_frequent = None
-        if exercise_counts:
-            most_frequent_id = max(exercise_counts, key=lambda k: exercise_counts[k]["count"])
+        if facet.get("most_frequent"):
+            top = facet["most_frequent"][0]
             most_frequent = {
-                "exercise_id": most_frequent_id,
-                "name": exercise_counts[most_frequent_id]["name"],
-                "count": exercise_counts[most_frequent_id]["count"]
+                "exercise_id": str(top["_id"]),
+                "name": top.get("name"),
+                "count": top["count"]
             }
         
         # 일별 분석
-        daily_data = {}
-        for record in records:
-            date_key = record["completed_at"].strftime("%Y-%m-%d")
-            if date_key not in daily_data:
-                daily_data[date_key] = {
-                    "date": date_key,
-                    "exercise_count": 0,
-                    "duration_minutes": 0,
-                    "total_score": 0,
-                    "score_count": 0
-                }
-            
-            daily_data[date_key]["exercise_count"] += 1
-            daily_data[date_key]["duration_minutes"] += record.get("duration_minutes", 0)
-            daily_data[date_key]["total_score"] += record.get("score", 0)
-            daily_data[date_key]["score_count"] += 1
-        
-        # 평균 점수 계산
-        daily_breakdown = []
-        for date_key in sorted(daily_data.keys()):
-            data = daily_data[date_key]
-            avg_score = data["total_score"] / data["score_count"] if data["score_count"] > 0 else 0
-            daily_breakdown.append({
-                "date": data["date"],
-                "exercise_count": data["exercise_count"],
-                "duration_minutes": data["duration_minutes"],
-                "average_score": round(avg_score, 1)
-            })
+        daily_breakdown = [
+            {
+                "date": day["_id"],
+                "exercise_count": day["exercise_count"],
+                "duration_minutes": day["duration_minutes"],
+                "average_score": round(day["average_score"] or 0, 1)
+            }
+            for day in facet.get("daily", [])
+        ]
         
         return {
             "period": period,
-            "total_exercises": total_exercises,
-            "total_duration_minutes": total_duration,
-            "total_calories_burned": total_calories,
-            "average_score": round(average_score, 1),
+            "total_exercises": summary["total_exercises"],
+            "total_duration_minutes": summary["total_duration_minutes"],
+            "total_calories_burned": summary["total_calories_burned"],
+            "average_score": round(summary["average_score"] or 0, 1),
             "most_frequent_exercise": most_frequent,
             "daily_breakdown": daily_breakdown
         }
@@ -254,6 +400,22 @@ async def get_statistics(
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 
+@router.get("/statistics/lifetime", response_model=CumulativeStatsResponse)
+async def get_lifetime_statistics(
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    누적 운동 통계 조회
+    
+    - total_*_ever: 지금까지의 전체 운동 (기록을 삭제해도 줄지 않음)
+    - current_*: 현재 남아 있는 기록 기준
+    """
+    try:
+        return await record_stats_service.get_cumulative_stats(ObjectId(current_user["user_id"]))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"누적 통계 조회 실패: {str(e)}")
+
+
 # backend/app/routers/records.py의 delete_record 함수를 이것으로 교체
 
 @router.delete("/{record_id}")
@@ -265,7 +427,7 @@ async def delete_record(
     """
     운동 기록 삭제
     
-    - 기록은 삭제되지만, 이미 집계된 통계(총 운동 시간, 횟수 등)는 유지됩니다.
+    - 기록은 삭제되지만, 이미 집계된 누적 통계(총 운동 시간, 횟수 등)는 유지됩니다. (/records/statistics/lifetime)
     - 실제 운동 기록만 삭제되며, 운동 템플릿(my_exercises)은 영향받지 않습니다.
     """
     try:
@@ -273,7 +435,7 @@ async def delete_record(
         record = await db.records.find_one({
             "_id": ObjectId(record_id),
             "user_id": ObjectId(current_user["user_id"])
-        })
+        }, projections.RECORD_SUMMARY)
         
         if not record:
             raise HTTPException(status_code=404, detail="기록을 찾을 수 없습니다.")
@@ -287,6 +449,10 @@ async def delete_record(
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="기록 삭제에 실패했습니다.")
         
+        await record_stats_service.on_record_deleted(record)
+        if record.get("score_history_count"):
+            await score_history_service.delete_score_history(record["_id"])
+        
         # 204 No Content 대신 200 OK로 메시지 반환 (프론트엔드에서 확인 가능)
         return {
             "message": "기록이 삭제되었습니다.",
@@ -303,6 +469,103 @@ async def delete_record(
 
 
 
+def _statistics_pipeline(query: dict) -> list:
+    """
+    기간 통계 집계 파이프라인 (필요한 필드만 projection → 합계 / 운동별 횟수 / 일별 분석을 $facet으로 한 번에)
+    결과는 문서 1개: {"totals": [...], "most_frequent": [...], "daily": [...]}
+    """
+    return [
+        {"$match": query},
+        {"$project": {
+            "_id": 0,
+            "exercise_id": 1,
+            "exercise_name": 1,
+            "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$completed_at"}},
+            "duration_minutes": {"$ifNull": ["$duration_minutes", 0]},
+            "calories_burned": {"$ifNull": ["$calories_burned", 0]},
+            "score": {"$ifNull": ["$score", 0]},
+        }},
+        {"$facet": {
+            "totals": [
+                {"$group": {
+                    "_id": None,
+                    "total_exercises": {"$sum": 1},
+                    "total_duration_minutes": {"$sum": "$duration_minutes"},
+                    "total_calories_burned": {"$sum": "$calories_burned"},
+                    "average_score": {"$avg": "$score"},
+                }},
+            ],
+            "most_frequent": [
+                {"$group": {
+                    "_id": "$exercise_id",
+                    "name": {"$first": "$exercise_name"},
+                    "count": {"$sum": 1},
+                }},
+                {"$sort": {"count": -1, "_id": 1}},
+                {"$limit": 1},
+            ],
+            "daily": [
+                {"$group": {
+                    "_id": "$day",
+                    "exercise_count": {"$sum": 1},
+                    "duration_minutes": {"$sum": "$duration_minutes"},
+                    "average_score": {"$avg": "$score"},
+                }},
+                {"$sort": {"_id": 1}},
+            ],
+        }},
+    ]
+
+
+def _legacy_exercise_name_filter(pattern: str) -> dict:
+    """
+    검색 키 필드가 없는 기록(backfill_record_name_fields 실행 전)용 조건 - 기존 방식대로 원래 이름 정규식
+    (user_exercise_name_search 인덱스의 exercise_name_search=null 범위만 읽음)
+    """
+    return {"exercise_name_search": None, "exercise_name": {"$regex": pattern, "$options": "i"}}
+
+
+def _exercise_name_contains_filter(exercise_name: str) -> dict:
+    """
+    운동 이름 부분 일치 조건
+    2-gram 배열($all)로 인덱스 후보를 좁히고, 검색 키에 검색어가 연속으로 들어 있는지 확인
+    (한 글자 검색어는 2-gram이 없으므로 검색 키만 확인)
+    검색 키 필드가 없는 기록은 원래 이름에 검색어가 들어 있는지 확인
+    """
+    key = search_exercise_name(exercise_name)
+    if not key:
+        return {}
+    condition = {"exercise_name_search": {"$regex": re.escape(key)}}
+    if len(key) >= 2:
+        condition["exercise_name_grams"] = {"$all": name_bigrams(key)}
+    return {"$or": [condition, _legacy_exercise_name_filter(re.escape(exercise_name.strip()))]}
+
+
+async def _count_records(
+    db,
+    user_oid: ObjectId,
+    query: dict,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    exercise_name: Optional[str]
+) -> int:
+    """
+    목록 필터에 맞는 기록 수
+    - 필터 없음: user_stats 문서 1개 / 날짜(YYYY-MM-DD) 필터만: daily_stats 합계
+    - 운동 이름 필터, 시각이 포함된 날짜, 롤업 미사용(RECORD_STATS_SOURCE=records): count_documents
+    """
+    day_only = all(len(value) == 10 for value in (start_date, end_date) if value)
+    if exercise_name or not day_only or settings.RECORD_STATS_SOURCE != "rollup":
+        return await db.records.count_documents(query)
+    
+    if not start_date and not end_date:
+        stats = await record_stats_service.get_cumulative_stats(user_oid)
+        return stats["current_total_workouts"]
+    
+    days = await record_stats_service.get_daily_stats(user_oid, start_date or "", end_date)
+    return sum(day.get("count", 0) for day in days)
+
+
 def _format_record_response(record: dict) -> dict:
     """
     MongoDB 문서를 API 응답 형식으로 변환
@@ -1,6 +1,6 @@
 # backend/app/routers/users.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from bson import ObjectId
 import bcrypt
@@ -15,6 +15,8 @@ from ..schemas.user_schema import (
 )
 from ..utils.jwt_handler import decode_access_token
 from ..database import get_database
+from .. import projections
+from ..services.bulk_writes import enqueue_user_purge, purge_user_data
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -98,19 +100,20 @@ async def update_user_body_condition(
 @router.delete("/me", response_model=DeleteAccountResponse)
 async def delete_account(
     request: DeleteAccountRequest,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
     """
     현재 로그인한 사용자 계정 삭제 (복구 불가능)
     
     - 비밀번호 확인 필수
-    - 사용자 데이터, 생성한 운동, 운동 기록 모두 삭제
-    - 삭제 후 로그인 불가
+    - 사용자 데이터, 생성한 운동, 내 운동, 운동 기록, 통계 모두 삭제
+    - 계정은 즉시 삭제되어 로그인 불가, 나머지 데이터는 응답 후 백그라운드에서 청크 단위로 정리
     """
     db = await get_database()
     
     # 1. 사용자 조회
-    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])})
+    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])}, projections.USER_PASSWORD_HASH)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -134,30 +137,26 @@ async def delete_account(
     user_id = ObjectId(current_user["user_id"])
     deleted_at = datetime.utcnow()
     
-    # 4. 관련 데이터 삭제 (트랜잭션 없이 순차 삭제)
+    # 4. 정리 작업 기록 후 사용자 계정 삭제 (이후 로그인 불가)
+    #    (정리 작업 문서는 모든 데이터 삭제가 끝나야 지워지므로 도중에 실패해도 서버 시작 시 재시도)
     try:
-        # 4-1. 생성한 운동 삭제
-        await db.generated_exercises.delete_many({"user_id": user_id})
-        
-        # 4-2. 운동 기록 삭제
-        await db.records.delete_many({"user_id": user_id})
-        
-        # 4-3. 사용자 계정 삭제
+        await enqueue_user_purge(user_id)
         result = await db.users.delete_one({"_id": user_id})
-        
-        if result.deleted_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="계정 삭제 중 오류가 발생했습니다."
-            )
-        
     except Exception as e:
-        # 삭제 중 오류 발생 시
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"계정 삭제 중 오류가 발생했습니다: {str(e)}"
         )
     
+    if result.deleted_count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="계정 삭제 중 오류가 발생했습니다."
+        )
+    
+    # 4-1. 관련 데이터(운동, 기록, 통계 등)는 응답 후 백그라운드에서 정리
+    background_tasks.add_task(purge_user_data, user_id)
+    
     # 5. 성공 응답
     return DeleteAccountResponse(
         message="계정이 성공적으로 삭제되었습니다. 그동안 이용해주셔서 감사합니다.",
@@ -178,7 +177,7 @@ async def verify_password(
     """
     db = await get_database()
     
-    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])})
+    user = await db.users.find_one({"_id": ObjectId(current_user["user_id"])}, projections.USER_PASSWORD_HASH)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -62,6 +62,15 @@ class ExerciseResponse(BaseModel):
     expires_at: Optional[str] = None
     recommendation_reason: Optional[str] = None  # ✅ 추가: 추천 이유
 
+class ExerciseJobResponse(BaseModel):
+    """운동 생성 작업 상태 응답"""
+    job_id: str
+    status: str = Field(..., description="queued | running | succeeded | failed")
+    exercise_id: Optional[str] = Field(default=None, description="생성 완료된 운동 ID")
+    error: Optional[str] = None
+    created_at: str
+    updated_at: str
+
 class ExerciseListResponse(BaseModel):
     """운동 목록 응답"""
     total: int
@@ -147,7 +156,9 @@ class ExerciseCompleteRequest(BaseModel):
     pain_level_before: Optional[int] = Field(None, ge=0, le=10, description="운동 전 통증 수준")
     pain_level_after: int = Field(..., ge=0, le=10, description="운동 후 통증 수준")
     duration_minutes: int = Field(..., gt=0, description="실제 운동 시간 (분)")
-    score_history: Optional[List[int]] = Field(default=[], description="시간대별 점수 배열")  # ✅ 추가!
+    score_history: Optional[List[float]] = Field(
+        default=[], description="시간대별 점수 배열 (저장 시 0~100 정수로 반올림/자름)"
+    )
 
     class Config:
         schema_extra = {
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -36,13 +36,16 @@ class RecordResponse(BaseModel):
     pain_level_after: Optional[int]
     feedback: Optional[dict]
     pose_analysis_summary: Optional[dict]
+    score_history: Optional[List[int]] = None  # 상세 조회에서만 (긴 이력은 None, 구간 요약만)
+    score_history_buckets: Optional[Dict[str, List[int]]] = None  # {"min": [...], "mean": [...], "max": [...]}
 
 
 class RecordListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # 커서 모드에서는 include_total일 때만
     page: int
     limit: int
     records: List[RecordResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
 
 
 class MostFrequentExercise(BaseModel):
@@ -65,4 +68,14 @@ class RecordStatisticsResponse(BaseModel):
     total_calories_burned: int
     average_score: float
     most_frequent_exercise: Optional[MostFrequentExercise]
-    daily_breakdown: List[DailyBreakdown]
\ No newline at end of file
+    daily_breakdown: List[DailyBreakdown]
+
+
+class ExerciseNameSuggestion(BaseModel):
+    exercise_name: str
+    count: int
+    last_completed_at: Optional[str]
+
+
+class ExerciseNameSuggestionsResponse(BaseModel):
+    names: List[ExerciseNameSuggestion]
\ No newline at end of file
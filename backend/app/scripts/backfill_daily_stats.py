@@ -0,0 +1,45 @@
+"""
+daily_stats 일별 롤업 백필/재계산 (원본 records 기준)
+
+롤업 도입 전 기록을 집계하거나, 롤업 갱신 실패로 어긋난 값을 바로잡을 때 실행합니다.
+재계산 중 새로 추가된 기록의 갱신이 덮어써질 수 있으므로 쓰기가 적은 시간에 실행하세요.
+
+전체 사용자 백필 후 backfill_user_stats까지 끝나면 RECORD_STATS_SOURCE=rollup으로 롤업 통계를 켭니다.
+(기본값 records - 백필 전 롤업은 값이 모자라 통계/기록 개수가 틀림)
+
+사용법:
+    python -m app.scripts.backfill_daily_stats
+    python -m app.scripts.backfill_daily_stats --user-id 665f1c...
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from bson import ObjectId
+
+from app.database import connect_to_mongodb, close_mongodb_connection
+from app.services.record_stats_service import rebuild_daily_stats
+
+
+async def run(args: argparse.Namespace) -> int:
+    user_id = ObjectId(args.user_id) if args.user_id else None
+
+    await connect_to_mongodb()
+    try:
+        written = await rebuild_daily_stats(user_id)
+        print(f"✅ daily_stats 재계산 완료: {written}개 문서 ({args.user_id or '전체 사용자'})")
+    finally:
+        await close_mongodb_connection()
+    return 0
+
+
+def _main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="records에서 daily_stats 일별 롤업 재계산")
+    parser.add_argument("--user-id", help="이 사용자만 재계산 (기본: 전체)")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
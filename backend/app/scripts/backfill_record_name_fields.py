@@ -0,0 +1,74 @@
+"""
+운동 기록 검색 필드 백필 (exercise_name_search / exercise_name_grams)
+
+검색 필드 도입 전 기록과 검색 키 규칙(search_exercise_name)이 바뀐 뒤의 기록을 다시 계산합니다.
+표기 변형을 치환해 저장하던 이전 필드(exercise_name_normalized)와 그 인덱스(user_exercise_name)는 삭제합니다.
+(백필 전 기록은 records 라우터가 원래 이름 정규식으로 찾으므로 검색 결과에서 빠지지 않음)
+
+사용법:
+    python -m app.scripts.backfill_record_name_fields           # 필드가 없는 기록만
+    python -m app.scripts.backfill_record_name_fields --all     # 전체 기록 재계산
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from pymongo import UpdateOne
+
+from app.database import connect_to_mongodb, close_mongodb_connection, get_database
+from app.utils.exercise_names import exercise_name_search_fields
+
+BATCH_SIZE = 500
+LEGACY_FIELD = "exercise_name_normalized"
+LEGACY_INDEX = "user_exercise_name"
+
+
+async def backfill(recompute_all: bool) -> int:
+    db = await get_database()
+    query = {} if recompute_all else {"exercise_name_search": {"$exists": False}}
+
+    operations: List[UpdateOne] = []
+    updated = 0
+    async for record in db.records.find(query, {"exercise_name": 1}):
+        operations.append(UpdateOne(
+            {"_id": record["_id"]},
+            {
+                "$set": exercise_name_search_fields(record.get("exercise_name")),
+                "$unset": {LEGACY_FIELD: ""},
+            }
+        ))
+        if len(operations) >= BATCH_SIZE:
+            result = await db.records.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+            operations = []
+
+    if operations:
+        result = await db.records.bulk_write(operations, ordered=False)
+        updated += result.modified_count
+
+    if LEGACY_INDEX in await db.records.index_information():
+        await db.records.drop_index(LEGACY_INDEX)
+        print(f"🗑️ 이전 인덱스 삭제: records.{LEGACY_INDEX}")
+    return updated
+
+
+async def run(args: argparse.Namespace) -> int:
+    await connect_to_mongodb()
+    try:
+        updated = await backfill(args.all)
+        print(f"✅ 검색 필드 갱신: {updated}개 기록")
+    finally:
+        await close_mongodb_connection()
+    return 0
+
+
+def _main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="운동 기록 이름 검색 필드 백필")
+    parser.add_argument("--all", action="store_true", help="필드가 있는 기록도 다시 계산")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,46 @@
+"""
+user_stats 누적 통계 백필/재계산 (원본 records 기준)
+
+누적 통계 도입 전 기록을 집계할 때 실행합니다.
+- current_*(현재 기록 기준)는 다시 계산한 값으로 덮어씀
+- *_ever(삭제와 무관한 누적값)는 기존 값보다 클 때만 갱신 (이미 삭제된 기록은 복구할 수 없음)
+
+전체 사용자 백필 후 backfill_daily_stats까지 끝나면 RECORD_STATS_SOURCE=rollup으로 롤업 통계를 켭니다.
+(기본값 records - 백필 전 롤업은 값이 모자라 통계/기록 개수가 틀림)
+
+사용법:
+    python -m app.scripts.backfill_user_stats
+    python -m app.scripts.backfill_user_stats --user-id 665f1c...
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from bson import ObjectId
+
+from app.database import connect_to_mongodb, close_mongodb_connection
+from app.services.record_stats_service import rebuild_user_stats
+
+
+async def run(args: argparse.Namespace) -> int:
+    user_id = ObjectId(args.user_id) if args.user_id else None
+
+    await connect_to_mongodb()
+    try:
+        updated = await rebuild_user_stats(user_id)
+        print(f"✅ user_stats 재계산 완료: {updated}명 ({args.user_id or '전체 사용자'})")
+    finally:
+        await close_mongodb_connection()
+    return 0
+
+
+def _main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="records에서 user_stats 누적 통계 재계산")
+    parser.add_argument("--user-id", help="이 사용자만 재계산 (기본: 전체)")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Mongo 인덱스 적용 (app.indexes 레지스트리) + 실행 계획 점검
+
+사용법:
+    python -m app.scripts.ensure_indexes
+    python -m app.scripts.ensure_indexes --explain
+    python -m app.scripts.ensure_indexes --list
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from app.database import connect_to_mongodb, close_mongodb_connection
+from app.indexes import ensure_indexes, explain_hot_queries, index_registry
+
+
+def print_registry() -> None:
+    for spec in index_registry():
+        flags = []
+        if spec.unique:
+            flags.append("unique")
+        if spec.expire_after_seconds is not None:
+            flags.append(f"ttl={spec.expire_after_seconds}s")
+        keys = ", ".join(f"{field}:{direction}" for field, direction in spec.keys)
+        print(f"  {spec.collection}.{spec.name} ({keys}) {' '.join(flags)} - {spec.reason}")
+
+
+async def run(args: argparse.Namespace) -> int:
+    if args.list:
+        print_registry()
+        return 0
+
+    await connect_to_mongodb()
+    try:
+        result = await ensure_indexes()
+        print(f"✅ 적용: {len(result['ok'])}개, TTL 변경: {len(result['ttl_updated'])}개")
+        for name in result["failed"]:
+            print(f"  ❌ 실패: {name}")
+
+        collscans = 0
+        if args.explain:
+            print("\n📋 주요 쿼리 실행 계획")
+            for item in await explain_hot_queries():
+                mark = "❌ COLLSCAN" if item["collscan"] else "✅"
+                print(f"  {mark} {item['name']} ({item['collection']}): "
+                      f"{' → '.join(item['stages'])} [index: {item['index']}]")
+                collscans += item["collscan"]
+    finally:
+        await close_mongodb_connection()
+    return 1 if result["failed"] or collscans else 0
+
+
+def _main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Mongo 인덱스 적용 및 실행 계획 점검")
+    parser.add_argument("--explain", action="store_true", help="적용 후 주요 쿼리의 COLLSCAN 여부 확인")
+    parser.add_argument("--list", action="store_true", help="DB 연결 없이 인덱스 선언만 출력")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+records 문서 안의 score_history 배열(pose_analysis_summary.score_history 포함)을 record_score_histories로 이동
+
+점수 이력 별도 저장 도입 전 기록을 옮겨 기록 문서 크기를 줄입니다.
+이력을 먼저 저장한 뒤 기록에서 배열을 지우므로 중간에 멈춰도 다시 실행하면 이어서 처리됩니다.
+
+사용법:
+    python -m app.scripts.migrate_score_histories
+"""
+
+import asyncio
+import sys
+from typing import List
+
+from pymongo import ReplaceOne, UpdateOne
+
+from app.database import connect_to_mongodb, close_mongodb_connection, get_database
+from app.services.score_history_service import build_score_history_doc, numeric_scores
+
+BATCH_SIZE = 200
+
+
+async def migrate() -> int:
+    db = await get_database()
+    history_ops: List[ReplaceOne] = []
+    record_ops: List[UpdateOne] = []
+    migrated = 0
+
+    async def flush() -> None:
+        nonlocal history_ops, record_ops, migrated
+        if history_ops:
+            await db.record_score_histories.bulk_write(history_ops, ordered=False)
+        if record_ops:
+            await db.records.bulk_write(record_ops, ordered=False)
+        migrated += len(record_ops)
+        history_ops, record_ops = [], []
+
+    # POST /records로 저장된 이전 기록은 pose_analysis_summary 안에 배열이 있음
+    cursor = db.records.find(
+        {"$or": [{"score_history": {"$exists": True}}, {"pose_analysis_summary.score_history": {"$exists": True}}]},
+        {"user_id": 1, "score_history": 1, "pose_analysis_summary.score_history": 1}
+    )
+    async for record in cursor:
+        summary = record.get("pose_analysis_summary") or {}
+        scores = numeric_scores(record.get("score_history") or summary.get("score_history"))
+        if scores:
+            doc = build_score_history_doc(record["_id"], record["user_id"], scores)
+            history_ops.append(ReplaceOne({"_id": record["_id"]}, doc, upsert=True))
+        unset = {"score_history": ""}
+        if "score_history" in summary:
+            unset["pose_analysis_summary.score_history"] = ""
+        record_ops.append(UpdateOne(
+            {"_id": record["_id"]},
+            {"$unset": unset, "$set": {"score_history_count": len(scores)}}
+        ))
+        if len(record_ops) >= BATCH_SIZE:
+            await flush()
+
+    await flush()
+    return migrated
+
+
+async def run() -> int:
+    await connect_to_mongodb()
+    try:
+        migrated = await migrate()
+        print(f"✅ 점수 이력 이동 완료: {migrated}개 기록")
+    finally:
+        await close_mongodb_connection()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,133 @@
+"""
+자주 나오는 신체 상태 프로필의 추천 운동 풀 미리 생성 (오프피크 배치)
+
+users 컬렉션의 body_condition을 지문(recommendation_cache.body_condition_fingerprint) 기준으로
+집계해 사용자가 많은 프로필부터, 프로필마다 여러 번 추천을 생성해 큰 운동 풀을 만듭니다.
+(guide_poses까지 생성해 저장하므로 온라인 요청은 애니메이션만 만들면 됨)
+
+사용법:
+    python -m app.scripts.precompute_recommendations --top 20 --pool-size 24
+    python -m app.scripts.precompute_recommendations --dry-run
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import connect_to_mongodb, close_mongodb_connection, get_database
+from app.services import exercise_generation_service, recommendation_cache
+
+
+async def find_common_profiles(top: int, min_users: int) -> List[Tuple[Dict, int]]:
+    """사용자 수가 많은 순으로 (대표 body_condition, 사용자 수) 반환"""
+    db = await get_database()
+    counts: Counter = Counter()
+    representatives: Dict[str, Dict] = {}
+
+    cursor = db.users.find(
+        {"body_condition.injured_parts.0": {"$exists": True}},
+        {"body_condition": 1}
+    )
+    async for user in cursor:
+        body_condition = user["body_condition"]
+        key = recommendation_cache.body_condition_fingerprint(body_condition)
+        counts[key] += 1
+        representatives.setdefault(key, body_condition)
+
+    return [
+        (representatives[key], count)
+        for key, count in counts.most_common(top)
+        if count >= min_users
+    ]
+
+
+# 연속으로 이만큼 풀이 늘지 않으면 (생성 실패 / 새 운동 없음) 해당 프로필 중단
+MAX_STALLED_ROUNDS = 2
+
+
+def default_rounds(pool_size: int) -> int:
+    """풀을 채우는 데 필요한 생성 횟수의 여유 있는 상한 (1회 생성 ≈ RESULT_COUNT개 기준 2배)"""
+    per_round = max(1, settings.RECOMMENDATION_CACHE_RESULT_COUNT)
+    return 2 * math.ceil(pool_size / per_round)
+
+
+async def precompute_profile(body_condition: Dict, rounds: Optional[int], pool_size: int, ttl_hours: int) -> int:
+    """
+    프로필 1개의 운동 풀 생성 (라운드마다 이미 풀에 있는 운동은 제외하고 새로 생성)
+    - 풀이 pool_size에 도달하거나 MAX_STALLED_ROUNDS번 연속 늘지 않을 때까지 반복
+    - rounds는 안전 상한 (None이면 pool_size로 계산)
+    """
+    max_rounds = rounds or default_rounds(pool_size)
+    pool_count = len(await recommendation_cache.get_pool_names(body_condition))
+    stalled = 0
+
+    for round_index in range(max_rounds):
+        if pool_count >= pool_size:
+            break
+        if stalled >= MAX_STALLED_ROUNDS:
+            print(f"  ⚠️ {stalled}회 연속 풀이 늘지 않아 중단 (풀 {pool_count}/{pool_size}개)")
+            break
+
+        exclude = await recommendation_cache.get_pool_names(body_condition)
+        recommendations = await exercise_generation_service.request_exercise_recommendations(
+            body_condition, exclude
+        )
+        if not recommendations:
+            print(f"  ⚠️ {round_index + 1}회차: 추천 생성 실패")
+            stalled += 1
+            continue
+
+        built = await asyncio.gather(*[
+            exercise_generation_service.build_recommendation_assets(rec, idx)
+            for idx, rec in enumerate(recommendations)
+        ])
+        previous_count = pool_count
+        pool_count = await recommendation_cache.store_recommendations(
+            body_condition, list(built),
+            pool_size=pool_size,
+            ttl_hours=ttl_hours,
+            precomputed=True
+        )
+        stalled = stalled + 1 if pool_count <= previous_count else 0
+        print(f"  ✅ {round_index + 1}회차: {len(built)}개 생성 → 풀 {pool_count}/{pool_size}개")
+
+    return pool_count
+
+
+async def run(args: argparse.Namespace) -> int:
+    await connect_to_mongodb()
+    try:
+        profiles = await find_common_profiles(args.top, args.min_users)
+        print(f"📊 대상 프로필 {len(profiles)}개")
+
+        for index, (body_condition, user_count) in enumerate(profiles, start=1):
+            profile = recommendation_cache.body_condition_profile(body_condition)
+            print(f"\n[{index}/{len(profiles)}] 사용자 {user_count}명: {profile}")
+            if args.dry_run:
+                continue
+            await precompute_profile(body_condition, args.rounds, args.pool_size, args.ttl_days * 24)
+    finally:
+        await close_mongodb_connection()
+    return 0
+
+
+def _main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="자주 나오는 신체 상태의 추천 운동 풀 미리 생성")
+    parser.add_argument("--top", type=int, default=20, help="대상 프로필 수 (사용자 수 순)")
+    parser.add_argument("--min-users", type=int, default=2, help="이보다 사용자가 적은 프로필은 제외")
+    parser.add_argument("--rounds", type=int, default=None,
+                        help="프로필별 최대 추천 생성 횟수 (기본: pool-size로 계산)")
+    parser.add_argument("--pool-size", type=int, default=settings.RECOMMENDATION_PRECOMPUTE_POOL_SIZE,
+                        help="프로필별 목표 운동 수")
+    parser.add_argument("--ttl-days", type=int, default=settings.RECOMMENDATION_PRECOMPUTE_TTL_DAYS,
+                        help="미리 생성한 풀의 보관 기간 (일)")
+    parser.add_argument("--dry-run", action="store_true", help="대상 프로필만 출력")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -1,22 +1,38 @@
 from typing import List, Dict, Optional
-from openai import AsyncOpenAI
 import base64
+import hashlib
 from io import BytesIO
 from PIL import Image
 import logging
 
+from app.services import llm_gateway
+from app.services.single_flight import get_single_flight
+
 logger = logging.getLogger(__name__)
 
+# 같은 이미지에 대한 동시 분석 요청은 Vision API를 한 번만 호출
+body_analysis_flight = get_single_flight("body_analysis")
+
 class BodyAnalysisService:
-    def __init__(self, api_key: str):
-        self.client = AsyncOpenAI(api_key=api_key)
-    
     async def analyze_body_condition(
         self, 
         image_base64: str
     ) -> Dict[str, any]:
         """
         이미지를 분석하여 신체 상태를 추론합니다.
+        (같은 이미지의 동시 요청은 이미지 해시 기준으로 한 번만 분석)
+        """
+        image_hash = hashlib.sha256(image_base64.encode("utf-8")).hexdigest()
+        return await body_analysis_flight.do(
+            image_hash, lambda: self._analyze_body_condition(image_base64)
+        )
+    
+    async def _analyze_body_condition(
+        self, 
+        image_base64: str
+    ) -> Dict[str, any]:
+        """
+        이미지를 분석하여 신체 상태를 추론합니다.
         
         Returns:
             {
@@ -31,7 +47,8 @@ class BodyAnalysisService:
             processed_image = self._preprocess_image(image_base64)
             
             # OpenAI Vision API 호출
-            response = await self.client.chat.completions.create(
+            response = await llm_gateway.chat_completion(
+                "body_analysis",
                 model="gpt-4o-mini",  # 비용 효율적
                 messages=[
                     {
@@ -0,0 +1,171 @@
+"""
+Mongo 대량 쓰기 (일괄 삽입 / 청크 단위 삭제 / 계정 데이터 정리)
+
+- insert_documents: insert_many(ordered=False) 한 번으로 삽입, 일부 실패해도 나머지는 저장
+- delete_in_chunks: _id를 청크 단위로 읽어 삭제 (큰 삭제가 한 번에 서버/요청을 오래 붙잡지 않도록)
+- purge_user_data: 계정 삭제 후 사용자 소유 컬렉션 전체를 동시에 청크 삭제 (BackgroundTasks에서 실행)
+
+계정 정리 작업은 account_purges 컬렉션에 먼저 기록하고(users 문서 삭제 전), 모든 컬렉션 삭제가
+성공한 뒤에만 지웁니다. 프로세스가 도중에 종료되거나 일부 컬렉션 삭제가 실패하면 문서가 남아
+다음 서버 시작 시(main.lifespan → start_pending_purges) 다시 실행됩니다. (삭제는 멱등)
+
+account_purges 문서:
+    {"_id": 사용자 ObjectId, "requested_at": datetime, "attempts": 1, "last_error": "...", "updated_at": datetime}
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app import projections
+from app.database import get_database
+
+logger = logging.getLogger(__name__)
+
+DELETE_CHUNK_SIZE = 1000
+ACCOUNT_PURGES = "account_purges"
+
+_resume_task: Optional[asyncio.Task] = None
+
+# 사용자 소유 데이터 (컬렉션, 사용자 필드) - 계정 삭제 시 모두 정리
+USER_DATA_COLLECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("records", "user_id"),
+    ("record_score_histories", "user_id"),
+    ("generated_exercises", "user_id"),
+    ("my_exercises", "user_id"),
+    ("exercise_jobs", "user_id"),
+    ("daily_stats", "user_id"),
+    ("user_stats", "user_id"),
+)
+
+
+async def insert_documents(collection, docs: List[Dict[str, Any]]) -> List[bool]:
+    """
+    문서 일괄 삽입 (순서 무관, 서로 독립적인 문서에만 사용)
+    각 문서에 _id가 채워지며, 문서별 저장 성공 여부를 같은 순서로 반환
+    """
+    if not docs:
+        return []
+
+    try:
+        await collection.insert_many(docs, ordered=False)
+        return [True] * len(docs)
+    except BulkWriteError as e:
+        failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        logger.error(f"insert_many into {collection.name}: {len(failed)}/{len(docs)} failed")
+        return [index not in failed for index in range(len(docs))]
+
+
+async def delete_in_chunks(collection, query: Dict[str, Any], chunk_size: int = DELETE_CHUNK_SIZE) -> int:
+    """조건에 맞는 문서를 chunk_size개씩 삭제, 삭제한 문서 수 반환"""
+    deleted = 0
+    while True:
+        ids = [
+            doc["_id"]
+            for doc in await collection.find(query, projections.ID_ONLY).limit(chunk_size).to_list(length=chunk_size)
+        ]
+        if not ids:
+            return deleted
+        result = await collection.delete_many({"_id": {"$in": ids}})
+        deleted += result.deleted_count
+        # 청크 사이에 다른 요청이 이벤트 루프를 쓸 수 있도록 양보
+        await asyncio.sleep(0)
+
+
+async def enqueue_user_purge(user_id: ObjectId) -> None:
+    """계정 정리 작업 기록 (users 문서 삭제 전에 호출 - 실패하면 예외)"""
+    db = await get_database()
+    now = datetime.utcnow()
+    await db[ACCOUNT_PURGES].update_one(
+        {"_id": user_id},
+        {"$setOnInsert": {"requested_at": now, "attempts": 0}, "$set": {"updated_at": now}},
+        upsert=True,
+    )
+
+
+async def purge_user_data(user_id: ObjectId, chunk_size: int = DELETE_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    사용자 소유 컬렉션 전체 삭제 (컬렉션끼리는 동시에, 컬렉션 안에서는 청크 단위)
+    users 문서는 호출 전에 삭제 (로그인은 즉시 불가, 나머지 데이터는 백그라운드 정리)
+    모두 성공하면 account_purges 문서 삭제, 하나라도 실패하면 남겨 두고 다음 시작 시 재시도
+    """
+    db = await get_database()
+    results = await asyncio.gather(
+        *(
+            delete_in_chunks(db[collection], {field: user_id}, chunk_size)
+            for collection, field in USER_DATA_COLLECTIONS
+        ),
+        return_exceptions=True,
+    )
+
+    summary: Dict[str, int] = {}
+    errors: List[str] = []
+    for (collection, _), result in zip(USER_DATA_COLLECTIONS, results):
+        if isinstance(result, Exception):
+            logger.error(f"Purge {collection} for user {user_id} failed: {result}")
+            summary[collection] = -1
+            errors.append(f"{collection}: {result}")
+        else:
+            summary[collection] = result
+
+    try:
+        if errors:
+            await db[ACCOUNT_PURGES].update_one(
+                {"_id": user_id},
+                {
+                    "$inc": {"attempts": 1},
+                    "$set": {"last_error": "; ".join(errors)[:1000], "updated_at": datetime.utcnow()},
+                },
+            )
+        else:
+            await db[ACCOUNT_PURGES].delete_one({"_id": user_id})
+    except Exception as e:
+        logger.error(f"Purge job update for user {user_id} failed: {e}")
+
+    logger.info(f"User data purged: {user_id} {summary}")
+    return summary
+
+
+async def resume_pending_purges() -> int:
+    """
+    남아 있는 계정 정리 작업을 하나씩 다시 실행, 실행한 작업 수 반환
+    users 문서가 아직 있으면(계정 삭제 자체가 실패한 경우) 데이터는 두고 작업만 삭제
+    """
+    db = await get_database()
+    user_ids = [doc["_id"] async for doc in db[ACCOUNT_PURGES].find({}, projections.ID_ONLY)]
+    resumed = 0
+    for user_id in user_ids:
+        if await db.users.find_one({"_id": user_id}, projections.ID_ONLY):
+            await db[ACCOUNT_PURGES].delete_one({"_id": user_id})
+            continue
+        await purge_user_data(user_id)
+        resumed += 1
+    if resumed:
+        logger.info(f"Resumed {resumed} pending account purges")
+    return resumed
+
+
+def start_pending_purges() -> None:
+    """서버 시작 시 남은 계정 정리 작업을 백그라운드에서 재실행 (시작을 막지 않음)"""
+    global _resume_task
+    if _resume_task is None or _resume_task.done():
+        _resume_task = asyncio.create_task(_resume_pending_purges_logged(), name="account-purges")
+
+
+async def _resume_pending_purges_logged() -> None:
+    try:
+        await resume_pending_purges()
+    except Exception as e:
+        logger.error(f"Resuming account purges failed: {e}")
+
+
+async def stop_pending_purges() -> None:
+    global _resume_task
+    if _resume_task is not None:
+        _resume_task.cancel()
+        await asyncio.gather(_resume_task, return_exceptions=True)
+        _resume_task = None
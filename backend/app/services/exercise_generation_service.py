@@ -1,14 +1,36 @@
+import asyncio
 import json
-from typing import Dict, List, Any
-from openai import AsyncOpenAI
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
 from bson import ObjectId
 
 from app.config import settings 
-
-# OpenAI 클라이언트 초기화
-client = AsyncOpenAI(
-    api_key=settings.OPENAI_API_KEY
+from app.services.pose_library import get_library_guide_poses, get_pose_library
+from app.services.pose_synthesizer import (
+    MOTION_TEMPLATES,
+    describe_joint_parameters,
+    get_template_guide_poses,
+    parse_motion,
+    synthesize_guide_poses,
+)
+from app.services.pose_validation import interpolate_missing_landmark, repair_pose_frames
+from app.services import pose_cache, llm_gateway, recommendation_cache
+from app.services.exercise_name_index import (
+    detect_posture,
+    get_matched_guide_poses,
+    get_pose_key_guide_poses,
+    posture_compatible,
 )
+from app.services.single_flight import get_single_flight, request_key
+from app.utils.exercise_names import normalize_exercise_name
+
+# 추천 운동별 포즈 생성 동시 실행 수 제한 (모든 요청이 공유)
+pose_generation_semaphore = asyncio.Semaphore(settings.POSE_GENERATION_CONCURRENCY)
+
+# 동시에 들어온 동일 요청은 OpenAI를 한 번만 호출
+exercise_flight = get_single_flight("exercise")
+recommendations_flight = get_single_flight("recommendations")
+pose_flight = get_single_flight("poses")
 
 def debug_print_animation(silhouette_animation: Dict, exercise_name: str):
     """생성된 애니메이션 데이터를 출력하여 확인"""
@@ -69,7 +91,8 @@ async def generate_personalized_exercise(
     prompt = create_exercise_prompt(user_body_condition, {}, exercise_type, intensity, duration_minutes)
     
     try:
-        response = await client.chat.completions.create(
+        response = await exercise_flight.do(request_key(prompt), lambda: llm_gateway.chat_completion(
+            "exercise",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "당신은 재활 운동 전문가입니다. 응답은 반드시 JSON 형식이어야 합니다."},
@@ -78,7 +101,7 @@ async def generate_personalized_exercise(
             response_format={"type": "json_object"},
             temperature=0.7,
             max_tokens=2000
-        )
+        ))
         
         content = response.choices[0].message.content
         if content.strip().startswith("```json"):
@@ -139,6 +162,29 @@ async def generate_personalized_exercise(
         }
     }
     return final_exercise
+
+
+def build_generated_exercise_doc(user_id: ObjectId, generated_exercise: Dict[str, Any]) -> Dict[str, Any]:
+    """generate_personalized_exercise 결과를 generated_exercises 문서로 변환"""
+    return {
+        "user_id": user_id,
+        "base_template_id": generated_exercise.get("base_template_id"),
+        "name": generated_exercise["name"], 
+        "description": generated_exercise["description"],
+        "instructions": generated_exercise["instructions"], 
+        "duration_seconds": generated_exercise["duration_seconds"],
+        "repetitions": generated_exercise["repetitions"], 
+        "sets": generated_exercise["sets"],
+        "target_parts": generated_exercise["target_parts"], 
+        "safety_warnings": generated_exercise["safety_warnings"],
+        "silhouette_animation": generated_exercise.get("silhouette_animation"),
+        "guide_poses": generated_exercise.get("guide_poses", []),  # ✅ 추가
+        "customization_params": generated_exercise.get("customization_params", {}),
+        "is_saved": True,
+        "created_at": datetime.utcnow(), 
+        "expires_at": datetime.utcnow() + timedelta(days=7)
+    }
+
 # --- 추천 운동 생성 함수 (guide_poses + 새로고침 기능 추가) ---
 
 def create_recommendations_prompt(user_body_condition: Dict, exclude_exercises: List[str] = None) -> str:
@@ -239,21 +285,114 @@ def create_recommendations_prompt(user_body_condition: Dict, exclude_exercises:
 8.  각 운동은 서로 다른 종류여야 하며, 다양성을 가져야 합니다.
 """
 
-async def generate_exercise_recommendations(
+# combined 모드에서 LLM에 알려주는 내장 포즈 세트
+POSE_LIBRARY_KEY_DESCRIPTIONS = {
+    "neck": "목 스트레칭/회전",
+    "sitting": "의자에 앉은 자세 운동",
+    "wrist": "손목 돌리기/스트레칭",
+    "shoulder": "어깨 돌리기/으쓱",
+    "arm_raise": "팔 들어올리기",
+    "ankle": "발목 돌리기",
+    "calf_raise": "까치발 들기/종아리",
+    "squat": "스쿼트",
+    "lunge": "런지",
+    "plank": "플랭크",
+    "pushup": "팔굽혀펴기",
+    "leg_raise": "다리 들기/뻗기",
+    "stretching": "전신 스트레칭",
+    "wall_pushup": "벽 팔굽혀펴기",
+    "foam_roller": "폼롤러",
+    # 관절 각도 템플릿 (pose_synthesizer.MOTION_TEMPLATES)
+    "side_bend": "옆구리 늘리기",
+    "knee_raise": "무릎 들어올리기/제자리 걷기",
+    "hip_abduction": "서서 다리 옆으로 들기",
+    "hip_hinge": "힙 힌지/굿모닝",
+    "glute_bridge": "누워서 엉덩이 들기 (브릿지)",
+    "bird_dog": "네 발 기기 자세에서 팔다리 뻗기 (버드독)",
+}
+
+
+def create_combined_recommendations_prompt(user_body_condition: Dict, exclude_exercises: List[str] = None) -> str:
+    """
+    추천 + 포즈를 한 번에 요청하는 프롬프트 (combined 모드)
+    기존 추천 프롬프트에 운동별 포즈 필드 지침만 추가
+    """
+    library_keys = "\n".join(
+        f"- {key}: {description}" for key, description in POSE_LIBRARY_KEY_DESCRIPTIONS.items()
+    )
+    return create_recommendations_prompt(user_body_condition, exclude_exercises) + f"""
+**포즈 데이터 (각 추천 운동에 반드시 추가):**
+각 운동 객체에 다음 둘 중 하나를 추가하세요.
+1. "pose_library_key": 아래 내장 포즈 중 동작이 같은 것이 있으면 그 키
+{library_keys}
+2. "motion": 맞는 내장 포즈가 없을 때만, 관절 각도 키프레임 3-5개
+   - 형식: {{"view": "front" 또는 "side", "keyframes": [{{"관절": 각도, ...}}, ...]}}
+   - 각도는 도 단위, 생략한 관절은 0 (차렷 자세), left_/right_ 없이 쓰면 양쪽에 적용
+   - 관절과 범위:
+{describe_joint_parameters()}
+   - 예: "motion": {{"view": "front", "keyframes": [{{}}, {{"hip_flexion": 90, "knee": 90}}, {{}}]}}
+"""
+
+
+def resolve_combined_poses(rec: Dict[str, Any]) -> Tuple[List[Dict[str, Dict[str, float]]], Optional[str]]:
+    """
+    combined 응답의 포즈 필드를 guide_poses로 변환 (pose_library_key, motion 필드는 제거)
+    
+    순서: 이름 기반 내장 포즈 → pose_library_key (내장 포즈/동작 템플릿) → 관절 각도 키프레임 합성
+    유효한 포즈가 없으면 ([], None) (build_recommendation_assets가 기존 방식으로 생성)
+    
+    Returns:
+        (guide_poses, 출처: "builtin" | "library" | "keyframes" | None)
+        ("keyframes"는 관절 각도 키프레임을 pose_synthesizer로 합성한 포즈)
+    """
+    library_key = rec.pop("pose_library_key", None)
+    motion = rec.pop("motion", None)
+    exercise_name = rec.get("name", "")
+    
+    hardcoded_poses = get_exercise_specific_poses(exercise_name)
+    if hardcoded_poses:
+        return hardcoded_poses, "builtin"
+    
+    if isinstance(library_key, str) and library_key in get_pose_library():
+        print(f"✅ [{exercise_name}] 내장 포즈 '{library_key}' 사용")
+        return get_library_guide_poses(library_key), "library"
+    if isinstance(library_key, str) and library_key in MOTION_TEMPLATES:
+        print(f"✅ [{exercise_name}] 동작 템플릿 '{library_key}' 사용")
+        return get_template_guide_poses(library_key), "library"
+    
+    parsed = parse_motion(motion)
+    if parsed is None:
+        print(f"⚠️ [{exercise_name}] 관절 각도 키프레임 없음/부족 → 개별 포즈 생성")
+        return [], None
+    
+    keyframes, view, _ = parsed
+    print(f"✅ [{exercise_name}] 관절 각도 키프레임 {len(keyframes)}개로 포즈 합성")
+    return synthesize_guide_poses(keyframes, view), "keyframes"
+
+
+async def request_exercise_recommendations(
     user_body_condition: Dict, 
     exclude_exercises: List[str] = None
 ) -> List[Dict[str, Any]]:
     """
-    AI를 사용하여 사용자에게 여러 맞춤 운동을 추천
-    ✅ 수정: guide_poses 생성 실패 시 기본 포즈 사용
+    추천 운동 메타데이터를 LLM으로 생성
+    - separate 모드: 메타데이터만 (포즈는 운동별로 따로 생성)
+    - combined 모드: 한 번의 호출로 포즈(라이브러리 키 또는 관절 각도 키프레임)까지 생성
+      → 유효한 포즈는 rec["guide_poses"]에 담겨 반환되고, 나머지는 기존 포즈 생성으로 처리
     """
     if not user_body_condition:
         return []
 
-    prompt = create_recommendations_prompt(user_body_condition, exclude_exercises)
+    combined = settings.RECOMMENDATION_GENERATION_MODE == "combined"
+    if combined:
+        prompt = create_combined_recommendations_prompt(user_body_condition, exclude_exercises)
+    else:
+        prompt = create_recommendations_prompt(user_body_condition, exclude_exercises)
 
     try:
-        response = await client.chat.completions.create(
+        response = await recommendations_flight.do(request_key(prompt), lambda: llm_gateway.chat_completion(
+            "recommendations",
+            call_site="recommendations_combined" if combined else "recommendations",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "당신은 재활 전문가입니다. JSON 형식으로 3개의 운동을 추천하세요."},
@@ -261,8 +400,8 @@ async def generate_exercise_recommendations(
             ],
             response_format={"type": "json_object"},
             temperature=0.8,
-            max_tokens=3000
-        )
+            max_tokens=6000 if combined else 3000
+        ))
         
         content = response.choices[0].message.content
         if content.strip().startswith("```json"):
@@ -271,193 +410,221 @@ async def generate_exercise_recommendations(
         result = json.loads(content)
         recommendations = result.get("recommendations", [])
         
-        print(f"\n🎯 추천 운동 {len(recommendations)}개 생성됨")
-        
-        # ✅ 각 추천 운동에 guide_poses와 silhouette_animation 추가
-        for idx, rec in enumerate(recommendations):
-            exercise_name = rec.get("name", "기본 운동")
-            intensity = rec.get("intensity", "medium")
-            
-            print(f"\n[{idx+1}] {exercise_name} 처리 중...")
-            
-            # guide_poses 생성
-            try:
-                rec["guide_poses"] = await generate_guide_poses(exercise_name)
-                
-                if not rec["guide_poses"] or len(rec["guide_poses"]) < 2:
-                    print(f"⚠️ guide_poses 부족! 기본 애니메이션 사용")
-                    rec["guide_poses"] = get_default_guide_poses_with_animation()
-                
-                print(f"✅ guide_poses: {len(rec['guide_poses'])}개 프레임")
-                
-            except Exception as e:
-                print(f"❌ guide_poses 생성 실패: {e}")
-                rec["guide_poses"] = get_default_guide_poses_with_animation()
-            
-            # silhouette_animation 생성
-            try:
-                rec["silhouette_animation"] = generate_silhouette_from_guide_poses(
-                    guide_poses=rec["guide_poses"],
-                    duration_seconds=rec.get("duration_minutes", 10) * 60,
-                    intensity=intensity
-                )
-                print(f"✅ silhouette_animation: {len(rec['silhouette_animation']['keyframes'])}개 키프레임")
-                
-            except Exception as e:
-                print(f"❌ silhouette_animation 생성 실패: {e}")
-                # 최소한의 애니메이션
-                rec["silhouette_animation"] = {
-                    "fps": 30,
-                    "keyframes": [
-                        {
-                            "timestamp_ms": 0,
-                            "pose_landmarks": convert_guide_pose_to_landmarks(rec["guide_poses"][0]),
-                            "description": "시작"
-                        }
-                    ]
-                }
+        if combined:
+            for rec in recommendations:
+                poses, source = resolve_combined_poses(rec)
+                cacheable = False
+                if source == "keyframes":
+                    poses, cacheable = repair_synthesized_poses(rec.get("name", ""), poses)
+                    if len(poses) < 2:
+                        poses = []  # build_recommendation_assets가 기존 방식으로 생성
+                if poses:
+                    rec["guide_poses"] = poses
+                if cacheable and poses:
+                    await pose_cache.store_poses(rec.get("name", ""), poses)
         
+        print(f"\n🎯 추천 운동 {len(recommendations)}개 생성됨")
         return recommendations
 
     except Exception as e:
         print(f"❌ OpenAI API 오류: {e}")
         return []
 
-# ✅ async 추가 및 await 추가
+
+async def get_recommendation_metadata(
+    user_body_condition: Dict, 
+    exclude_exercises: List[str] = None
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    추천 운동 메타데이터 조회 (캐시 → LLM 순)
+    
+    Returns:
+        (추천 리스트, 캐시 사용 여부) - 캐시 항목에는 guide_poses가 이미 포함됨
+    """
+    cached = await recommendation_cache.get_cached_recommendations(user_body_condition, exclude_exercises)
+    if cached:
+        print(f"\n⚡ 캐시된 추천 운동 {len(cached)}개 사용")
+        return cached, True
+    
+    return await request_exercise_recommendations(user_body_condition, exclude_exercises), False
+
+
+async def generate_exercise_recommendations(
+    user_body_condition: Dict, 
+    exclude_exercises: List[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    AI를 사용하여 사용자에게 여러 맞춤 운동을 추천
+    ✅ 수정: guide_poses 생성 실패 시 기본 포즈 사용
+    ✅ 수정: 추천 운동별 포즈/애니메이션 생성을 동시에 실행
+    ✅ 추가: 같은 신체 상태 지문의 추천은 캐시에서 재사용
+    """
+    recommendations, from_cache = await get_recommendation_metadata(user_body_condition, exclude_exercises)
+    
+    # ✅ 각 추천 운동의 guide_poses와 silhouette_animation을 동시에 생성
+    results = list(await asyncio.gather(*[
+        build_recommendation_assets(rec, idx)
+        for idx, rec in enumerate(recommendations)
+    ]))
+    
+    if results and not from_cache:
+        await recommendation_cache.store_recommendations(user_body_condition, results)
+    return results
+
+
+async def stream_exercise_recommendations(
+    user_body_condition: Dict, 
+    exclude_exercises: List[str] = None
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    추천 운동을 단계별로 생성하며 이벤트를 순서대로 반환 (SSE용)
+    
+    Yields:
+        ("recommendations", [메타데이터, ...])  - LLM 응답 파싱(또는 캐시 조회) 직후 1회
+        ("exercise", (idx, rec))                - 각 운동의 포즈/애니메이션 완성 시
+    """
+    recommendations, from_cache = await get_recommendation_metadata(user_body_condition, exclude_exercises)
+    metadata = [
+        {k: v for k, v in rec.items() if k != "guide_poses"}
+        for rec in recommendations
+    ]
+    
+    async def build(idx: int, rec: Dict[str, Any]):
+        return idx, await build_recommendation_assets(rec, idx)
+    
+    tasks = [asyncio.create_task(build(idx, rec)) for idx, rec in enumerate(recommendations)]
+    completed = []
+    try:
+        yield "recommendations", metadata
+        
+        for finished in asyncio.as_completed(tasks):
+            idx, rec = await finished
+            completed.append(rec)
+            yield "exercise", (idx, rec)
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 작업 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    
+    if completed and not from_cache:
+        await recommendation_cache.store_recommendations(user_body_condition, completed)
+
+
+async def build_recommendation_assets(rec: Dict[str, Any], idx: int = 0) -> Dict[str, Any]:
+    """
+    추천 운동 1개에 guide_poses와 silhouette_animation 추가
+    - guide_poses가 이미 있으면(캐시된 추천) silhouette_animation만 생성
+    - 공유 세마포어로 동시 실행 수 제한
+    - 포즈 생성 시간 초과/실패 시 기본 포즈 사용
+    """
+    exercise_name = rec.get("name", "기본 운동")
+    intensity = rec.get("intensity", "medium")
+    
+    print(f"\n[{idx+1}] {exercise_name} 처리 중...")
+    
+    # guide_poses 생성 (캐시된 추천은 이미 포함되어 있으므로 건너뜀)
+    try:
+        if not rec.get("guide_poses"):
+            async with pose_generation_semaphore:
+                # 데드라인을 LLM 게이트웨이까지 전파 (남은 시간 안에서만 재시도)
+                with llm_gateway.llm_deadline(settings.POSE_GENERATION_TIMEOUT_SECONDS):
+                    rec["guide_poses"] = await asyncio.wait_for(
+                        generate_guide_poses(exercise_name),
+                        timeout=settings.POSE_GENERATION_TIMEOUT_SECONDS
+                    )
+        
+        if not rec["guide_poses"] or len(rec["guide_poses"]) < 2:
+            print(f"⚠️ guide_poses 부족! 기본 애니메이션 사용")
+            rec["guide_poses"] = get_default_guide_poses_with_animation()
+        
+        print(f"✅ guide_poses: {len(rec['guide_poses'])}개 프레임")
+        
+    except asyncio.TimeoutError:
+        print(f"⏱️ [{exercise_name}] guide_poses 생성 시간 초과! 기본 애니메이션 사용")
+        rec["guide_poses"] = get_default_guide_poses_with_animation()
+    except Exception as e:
+        print(f"❌ guide_poses 생성 실패: {e}")
+        rec["guide_poses"] = get_default_guide_poses_with_animation()
+    
+    # silhouette_animation 생성 (CPU 작업이므로 스레드에서 실행)
+    try:
+        rec["silhouette_animation"] = await asyncio.to_thread(
+            generate_silhouette_from_guide_poses,
+            guide_poses=rec["guide_poses"],
+            duration_seconds=rec.get("duration_minutes", 10) * 60,
+            intensity=intensity
+        )
+        print(f"✅ silhouette_animation: {len(rec['silhouette_animation']['keyframes'])}개 키프레임")
+        
+    except Exception as e:
+        print(f"❌ silhouette_animation 생성 실패: {e}")
+        # 최소한의 애니메이션
+        rec["silhouette_animation"] = {
+            "fps": 30,
+            "keyframes": [
+                {
+                    "timestamp_ms": 0,
+                    "pose_landmarks": convert_guide_pose_to_landmarks(rec["guide_poses"][0]),
+                    "description": "시작"
+                }
+            ]
+        }
+    
+    return rec
+
 async def generate_poses_with_ai(exercise_name: str) -> List[Dict[str, Dict[str, float]]]:
     """
-    AI를 사용하여 운동 포즈 생성 (대폭 개선된 버전)
+    AI 포즈 생성 (같은 운동 - 정규화된 이름 기준 - 의 동시 요청은 한 번만 생성)
+    """
+    key = normalize_exercise_name(exercise_name) or exercise_name
+    return await pose_flight.do(key, lambda: _generate_poses_with_ai(exercise_name))
+
+
+async def _generate_poses_with_ai(exercise_name: str) -> List[Dict[str, Dict[str, float]]]:
+    """
+    AI로 운동 동작을 관절 각도 키프레임으로 생성한 뒤 로컬에서 포즈 합성
+    (LLM은 숫자 몇 개만 생성, 33개 랜드마크 좌표는 pose_synthesizer가 순운동학으로 계산)
     
     Args:
         exercise_name: 운동 이름
     
     Returns:
-        MediaPipe 33개 랜드마크 포즈 리스트 (4-6개 프레임)
+        MediaPipe 33개 랜드마크 포즈 리스트 (3-6개 프레임), 실패 시 None
     """
     prompt = f"""
-당신은 운동 동작 전문가이자 애니메이션 제작자입니다. 다음 운동의 **매우 상세한 MediaPipe Pose 랜드마크 좌표**를 생성해주세요.
+다음 운동의 동작을 **관절 각도 키프레임**으로 표현해주세요.
 
 **운동 이름:** {exercise_name}
 
-**핵심 지침:**
-1. **반드시 4-6개의 프레임**을 생성하여 부드러운 동작을 만드세요
-2. 각 프레임은 운동의 핵심 단계를 나타내야 합니다
-3. 시작 자세 → 중간 동작 → 최종 자세 → (필요시) 복귀 순서로 구성
-4. 모든 좌표는 해부학적으로 정확하고 자연스러워야 합니다
-
-**필수 랜드마크 좌표 (0-32번 모두 포함!):**
-```
-얼굴 (0-10):
-  0: nose, 1-6: 눈 주변, 7-8: 귀, 9-10: 입
-
-상체 (11-22):
-  11-12: 어깨, 13-14: 팔꿈치, 15-16: 손목
-  17-22: 손가락 (핑키, 검지, 엄지)
-
-하체 (23-32):
-  23-24: 엉덩이, 25-26: 무릎, 27-28: 발목
-  29-30: 발뒤꿈치, 31-32: 발끝
-```
-
-**좌표 시스템:**
-- x: 0.0(왼쪽) ~ 1.0(오른쪽), 중앙=0.5
-- y: 0.0(위) ~ 1.0(아래)
-- z: -0.5 ~ 0.5, 대부분 -0.1 ~ 0.1
-
-**표준 자세 y좌표 가이드:**
-
-서있는 자세:
-- 코(0): 0.10-0.15
-- 눈(1-6): 0.12-0.14
-- 귀(7-8): 0.14-0.16
-- 어깨(11-12): 0.25-0.30
-- 팔꿈치(13-14): 0.45-0.52
-- 손목(15-16): 0.68-0.72
-- 엉덩이(23-24): 0.55-0.60
-- 무릎(25-26): 0.78-0.82
-- 발목(27-28): 0.92-0.95
-- 발끝(31-32): 0.96-0.98
-
-앉은 자세:
-- 코(0): 0.20-0.25
-- 어깨(11-12): 0.32-0.38
-- 팔꿈치(13-14): 0.48-0.54
-- 손목(15-16): 0.62-0.68
-- 엉덩이(23-24): 0.60-0.68
-- 무릎(25-26): 0.78-0.82
-- 발목(27-28): 0.92-0.95
-
-**반드시 지켜야 할 해부학적 규칙:**
-1. 어깨 너비: x 차이 0.15-0.25
-2. 엉덩이 너비: x 차이 0.12-0.18
-3. 팔 길이: 어깨→팔꿈치→손목이 자연스럽게 연결
-4. 다리 길이: 엉덩이→무릎→발목이 일직선
-5. 좌우 대칭: 왼쪽/오른쪽 랜드마크 x값이 0.5 기준 대칭
-
-**응답 형식 (JSON만, 주석 절대 금지!):**
-{{
-  "frames": [
-    {{
-      "0": {{"x": 0.50, "y": 0.15, "z": -0.1}},
-      "1": {{"x": 0.51, "y": 0.14, "z": -0.1}},
-      "2": {{"x": 0.52, "y": 0.14, "z": -0.1}},
-      "3": {{"x": 0.53, "y": 0.14, "z": -0.1}},
-      "4": {{"x": 0.49, "y": 0.14, "z": -0.1}},
-      "5": {{"x": 0.48, "y": 0.14, "z": -0.1}},
-      "6": {{"x": 0.47, "y": 0.14, "z": -0.1}},
-      "7": {{"x": 0.54, "y": 0.16, "z": -0.1}},
-      "8": {{"x": 0.46, "y": 0.16, "z": -0.1}},
-      "9": {{"x": 0.51, "y": 0.18, "z": -0.1}},
-      "10": {{"x": 0.49, "y": 0.18, "z": -0.1}},
-      "11": {{"x": 0.40, "y": 0.30, "z": -0.1}},
-      "12": {{"x": 0.60, "y": 0.30, "z": -0.1}},
-      "13": {{"x": 0.35, "y": 0.50, "z": -0.1}},
-      "14": {{"x": 0.65, "y": 0.50, "z": -0.1}},
-      "15": {{"x": 0.30, "y": 0.70, "z": -0.1}},
-      "16": {{"x": 0.70, "y": 0.70, "z": -0.1}},
-      "17": {{"x": 0.28, "y": 0.72, "z": -0.1}},
-      "18": {{"x": 0.72, "y": 0.72, "z": -0.1}},
-      "19": {{"x": 0.28, "y": 0.72, "z": -0.1}},
-      "20": {{"x": 0.72, "y": 0.72, "z": -0.1}},
-      "21": {{"x": 0.28, "y": 0.72, "z": -0.1}},
-      "22": {{"x": 0.72, "y": 0.72, "z": -0.1}},
-      "23": {{"x": 0.42, "y": 0.60, "z": -0.1}},
-      "24": {{"x": 0.58, "y": 0.60, "z": -0.1}},
-      "25": {{"x": 0.40, "y": 0.80, "z": -0.1}},
-      "26": {{"x": 0.60, "y": 0.80, "z": -0.1}},
-      "27": {{"x": 0.38, "y": 0.95, "z": -0.1}},
-      "28": {{"x": 0.62, "y": 0.95, "z": -0.1}},
-      "29": {{"x": 0.36, "y": 0.97, "z": -0.1}},
-      "30": {{"x": 0.64, "y": 0.97, "z": -0.1}},
-      "31": {{"x": 0.36, "y": 0.98, "z": -0.1}},
-      "32": {{"x": 0.64, "y": 0.98, "z": -0.1}}
-    }},
-    ... (총 4-6개 프레임)
-  ]
-}}
+**지침:**
+1. 시작 자세 → 핵심 동작 → 복귀 순서로 3-6개 키프레임
+2. 각도는 도 단위, 생략한 관절은 0 (차렷 자세)
+3. left_/right_ 없이 쓰면 양쪽에 같은 값 적용 (예: "knee": 90)
+4. view: 정면에서 잘 보이면 "front", 누운 자세/엎드린 자세처럼 옆에서 봐야 하면 "side"
+
+**관절과 범위:**
+{describe_joint_parameters()}
+(body_pitch: 90 = 엎드린 수평, -90 = 누운 수평 / shoulder_flexion 180 = 팔 머리 위)
 
-**최종 체크리스트:**
-✅ 프레임 수: 4-6개
-✅ 각 프레임에 랜드마크 0-32 모두 포함
-✅ x, y 좌표가 0.0-1.0 범위 내
-✅ 동작이 자연스럽고 연속적
-✅ 해부학적으로 올바른 관절 각도
-✅ JSON 형식만 반환 (주석, 설명 없이)
+**응답 형식 (JSON만):**
+{{"view": "front", "keyframes": [{{}}, {{"hip_flexion": 90, "knee": 90, "shoulder_flexion": 90}}, {{}}]}}
 """
 
     try:
-        response = await client.chat.completions.create(
+        response = await llm_gateway.chat_completion(
+            "poses",
             model="gpt-4o-mini",
             messages=[
                 {
                     "role": "system", 
-                    "content": "당신은 운동 동작을 MediaPipe Pose 좌표로 변환하는 전문가입니다. 항상 완전하고 유효한 JSON만 반환하세요. 주석이나 설명은 절대 포함하지 마세요."
+                    "content": "당신은 운동 동작을 관절 각도로 표현하는 전문가입니다. 항상 유효한 JSON만 반환하세요."
                 },
                 {"role": "user", "content": prompt}
             ],
             response_format={"type": "json_object"},
             temperature=0.7,
-            max_tokens=4000  # ✅ 토큰 증가 (더 많은 프레임 생성)
+            max_tokens=600
         )
         
         content = response.choices[0].message.content
@@ -471,732 +638,97 @@ async def generate_poses_with_ai(exercise_name: str) -> List[Dict[str, Dict[str,
                 lines = lines[:-1]
             content = '\n'.join(lines)
         
-        result = json.loads(content)
-        frames = result.get("frames", [])
-        
-        # ✅ 프레임 검증
-        if not frames or len(frames) < 3:
-            print(f"⚠️ AI 포즈 프레임 부족: {len(frames)}개")
+        # ✅ 키프레임 검증 (모르는 관절 무시, 가동 범위 밖 각도는 잘라냄)
+        parsed = parse_motion(json.loads(content))
+        if parsed is None:
+            print(f"⚠️ AI 관절 각도 키프레임 부족 또는 동작 없음")
             return None
         
-        # ✅ 각 프레임 검증
-        valid_frames = []
-        for i, frame in enumerate(frames):
-            if validate_pose_frame(frame):
-                valid_frames.append(frame)
-            else:
-                print(f"⚠️ 프레임 {i+1} 검증 실패")
+        keyframes, view, clamped = parsed
+        if clamped:
+            print(f"🔧 가동 범위 밖 각도 {clamped}개 보정")
         
-        if len(valid_frames) >= 3:
-            print(f"✅ AI 포즈 생성 성공: {len(valid_frames)}개 프레임")
-            return valid_frames
-        else:
-            print(f"⚠️ 유효한 프레임 부족: {len(valid_frames)}개")
-            return None
+        frames = synthesize_guide_poses(keyframes[:6], view)
+        print(f"✅ AI 포즈 생성 성공: {len(frames)}개 프레임 ({view})")
+        return frames
             
     except Exception as e:
         print(f"❌ AI 포즈 생성 오류: {e}")
         return None
     
-def validate_pose_frame(frame: Dict) -> bool:
-    """
-    포즈 프레임 검증
-    - 필수 랜드마크 존재 확인
-    - 좌표 범위 확인
-    - 해부학적 타당성 확인
+def repair_synthesized_poses(
+    exercise_name: str,
+    frames: List[Dict[str, Dict[str, float]]]
+) -> Tuple[List[Dict[str, Dict[str, float]]], bool]:
     """
-    # 필수 랜드마크
-    required_landmarks = [0, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28, 31, 32]
-    
-    for idx in required_landmarks:
-        key = str(idx)
-        if key not in frame:
-            print(f"  ❌ 필수 랜드마크 {idx} 없음")
-            return False
-        
-        landmark = frame[key]
-        if not isinstance(landmark, dict):
-            print(f"  ❌ 랜드마크 {idx} 형식 오류")
-            return False
-        
-        # 좌표 범위 확인
-        x = landmark.get("x", -1)
-        y = landmark.get("y", -1)
-        
-        if not (0.0 <= x <= 1.0) or not (0.0 <= y <= 1.0):
-            print(f"  ❌ 랜드마크 {idx} 좌표 범위 초과: x={x}, y={y}")
-            return False
+    합성한 포즈를 캐시 저장 전에 검증/보정 (pose_validation.repair_pose_frames)
     
-    # 해부학적 타당성 확인
-    nose_y = frame["0"]["y"]
-    shoulder_y = (frame["11"]["y"] + frame["12"]["y"]) / 2
-    hip_y = (frame["23"]["y"] + frame["24"]["y"]) / 2
-    ankle_y = (frame["27"]["y"] + frame["28"]["y"]) / 2
-    
-    # 머리 < 어깨 < 엉덩이 < 발목 (y좌표)
-    if not (nose_y < shoulder_y < hip_y < ankle_y):
-        print(f"  ❌ 해부학적 순서 오류: nose={nose_y:.2f}, shoulder={shoulder_y:.2f}, hip={hip_y:.2f}, ankle={ankle_y:.2f}")
-        return False
-    
-    return True
+    Returns:
+        (검증/보정을 통과한 프레임, 캐시 저장 가능 여부 - 버려진 프레임이 없을 때만)
+    """
+    repaired, report = repair_pose_frames(frames)
+    if report.repaired or report.dropped:
+        print(f"🔧 [{exercise_name}] 포즈 보정 {report.repaired}개, 제외 {report.dropped}개 / {report.total}개")
+    return repaired, report.dropped == 0
 
 # 손목 운동 가이드 포즈
 def get_neck_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """목 돌리기/숙이기 가이드 포즈 (4개 프레임으로 회전 표현)"""
-    return [
-        # 프레임 1: 목 중앙 (시작)
-        {
-            "0": {"x": 0.5, "y": 0.15},   # 코 중앙
-            "1": {"x": 0.51, "y": 0.14},  # 얼굴 랜드마크
-            "2": {"x": 0.52, "y": 0.14},
-            "3": {"x": 0.53, "y": 0.14},
-            "4": {"x": 0.49, "y": 0.14},
-            "5": {"x": 0.48, "y": 0.14},
-            "6": {"x": 0.47, "y": 0.14},
-            "7": {"x": 0.54, "y": 0.16},  # 귀
-            "8": {"x": 0.46, "y": 0.16},
-            "9": {"x": 0.51, "y": 0.18},  # 입
-            "10": {"x": 0.49, "y": 0.18},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 목 왼쪽으로 기울이기
-        {
-            "0": {"x": 0.45, "y": 0.15},   # 코 왼쪽으로
-            "1": {"x": 0.46, "y": 0.14},
-            "2": {"x": 0.47, "y": 0.14},
-            "3": {"x": 0.48, "y": 0.14},
-            "4": {"x": 0.44, "y": 0.14},
-            "5": {"x": 0.43, "y": 0.14},
-            "6": {"x": 0.42, "y": 0.14},
-            "7": {"x": 0.49, "y": 0.16},
-            "8": {"x": 0.41, "y": 0.16},
-            "9": {"x": 0.46, "y": 0.18},
-            "10": {"x": 0.44, "y": 0.18},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 3: 목 아래로 숙이기
-        {
-            "0": {"x": 0.5, "y": 0.2},    # 코 아래로
-            "1": {"x": 0.51, "y": 0.19},
-            "2": {"x": 0.52, "y": 0.19},
-            "3": {"x": 0.53, "y": 0.19},
-            "4": {"x": 0.49, "y": 0.19},
-            "5": {"x": 0.48, "y": 0.19},
-            "6": {"x": 0.47, "y": 0.19},
-            "7": {"x": 0.54, "y": 0.21},
-            "8": {"x": 0.46, "y": 0.21},
-            "9": {"x": 0.51, "y": 0.23},
-            "10": {"x": 0.49, "y": 0.23},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 4: 목 오른쪽으로 기울이기
-        {
-            "0": {"x": 0.55, "y": 0.15},   # 코 오른쪽으로
-            "1": {"x": 0.56, "y": 0.14},
-            "2": {"x": 0.57, "y": 0.14},
-            "3": {"x": 0.58, "y": 0.14},
-            "4": {"x": 0.54, "y": 0.14},
-            "5": {"x": 0.53, "y": 0.14},
-            "6": {"x": 0.52, "y": 0.14},
-            "7": {"x": 0.59, "y": 0.16},
-            "8": {"x": 0.51, "y": 0.16},
-            "9": {"x": 0.56, "y": 0.18},
-            "10": {"x": 0.54, "y": 0.18},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("neck")
+
 
 # ✅ 의자에 앉아 하는 운동 가이드 포즈 추가
 def get_sitting_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """의자에 앉아 하는 운동 가이드 포즈 (앉은 자세 기본)"""
-    return [
-        # 프레임 1: 앉아서 팔 내림
-        {
-            "0": {"x": 0.5, "y": 0.25},    # 앉은 자세 - 머리 위치
-            "11": {"x": 0.4, "y": 0.35},   # 어깨
-            "12": {"x": 0.6, "y": 0.35},
-            "13": {"x": 0.35, "y": 0.5},   # 팔꿈치
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.65},   # 손목
-            "16": {"x": 0.7, "y": 0.65},
-            "19": {"x": 0.28, "y": 0.67},
-            "20": {"x": 0.72, "y": 0.67},
-            "23": {"x": 0.42, "y": 0.65},  # 엉덩이 (앉은 위치)
-            "24": {"x": 0.58, "y": 0.65},
-            "25": {"x": 0.38, "y": 0.8},   # 무릎 (90도 굽힘)
-            "26": {"x": 0.62, "y": 0.8},
-            "27": {"x": 0.36, "y": 0.95},  # 발목
-            "28": {"x": 0.64, "y": 0.95},
-            "31": {"x": 0.34, "y": 0.98},  # 발끝
-            "32": {"x": 0.66, "y": 0.98}
-        },
-        # 프레임 2: 앉아서 팔 들기 또는 다리 뻗기
-        {
-            "0": {"x": 0.5, "y": 0.25},
-            "11": {"x": 0.4, "y": 0.35},
-            "12": {"x": 0.6, "y": 0.35},
-            "13": {"x": 0.3, "y": 0.4},    # 팔 위로
-            "14": {"x": 0.7, "y": 0.4},
-            "15": {"x": 0.25, "y": 0.35},  # 손 위로
-            "16": {"x": 0.75, "y": 0.35},
-            "19": {"x": 0.23, "y": 0.34},
-            "20": {"x": 0.77, "y": 0.34},
-            "23": {"x": 0.42, "y": 0.65},
-            "24": {"x": 0.58, "y": 0.65},
-            "25": {"x": 0.38, "y": 0.75},  # 다리 약간 펴기
-            "26": {"x": 0.62, "y": 0.75},
-            "27": {"x": 0.36, "y": 0.9},
-            "28": {"x": 0.64, "y": 0.9},
-            "31": {"x": 0.34, "y": 0.93},
-            "32": {"x": 0.66, "y": 0.93}
-        }
-    ]
+    return get_library_guide_poses("sitting")
+
 
 def get_wrist_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """손목 돌리기/굽히기 가이드 포즈 (4개 프레임으로 회전 표현)"""
-    return [
-        # 프레임 1: 손목 중앙 (시작)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.45},
-            "14": {"x": 0.65, "y": 0.45},
-            "15": {"x": 0.32, "y": 0.6},
-            "16": {"x": 0.68, "y": 0.6},
-            "19": {"x": 0.3, "y": 0.65},
-            "20": {"x": 0.7, "y": 0.65},
-            "21": {"x": 0.28, "y": 0.63},
-            "22": {"x": 0.72, "y": 0.63},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 손목 오른쪽으로
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.45},
-            "14": {"x": 0.65, "y": 0.45},
-            "15": {"x": 0.32, "y": 0.6},
-            "16": {"x": 0.68, "y": 0.6},
-            "19": {"x": 0.35, "y": 0.6},
-            "20": {"x": 0.73, "y": 0.6},
-            "21": {"x": 0.3, "y": 0.58},
-            "22": {"x": 0.7, "y": 0.58},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 3: 손목 아래로
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.45},
-            "14": {"x": 0.65, "y": 0.45},
-            "15": {"x": 0.32, "y": 0.6},
-            "16": {"x": 0.68, "y": 0.6},
-            "19": {"x": 0.3, "y": 0.55},
-            "20": {"x": 0.7, "y": 0.55},
-            "21": {"x": 0.28, "y": 0.57},
-            "22": {"x": 0.72, "y": 0.57},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 4: 손목 왼쪽으로
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.45},
-            "14": {"x": 0.65, "y": 0.45},
-            "15": {"x": 0.32, "y": 0.6},
-            "16": {"x": 0.68, "y": 0.6},
-            "19": {"x": 0.27, "y": 0.6},
-            "20": {"x": 0.65, "y": 0.6},
-            "21": {"x": 0.3, "y": 0.62},
-            "22": {"x": 0.68, "y": 0.62},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        }
-    ]
-    
+    return get_library_guide_poses("wrist")
+
+
 # ✨ 어깨 운동 가이드 포즈 추가
 def get_shoulder_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """어깨 돌리기/으쓱하기 가이드 포즈"""
-    return [
-        # 프레임 1: 어깨 내림
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.35},
-            "12": {"x": 0.6, "y": 0.35},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 어깨 올림 (으쓱)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.25},
-            "12": {"x": 0.6, "y": 0.25},
-            "13": {"x": 0.35, "y": 0.4},
-            "14": {"x": 0.65, "y": 0.4},
-            "15": {"x": 0.3, "y": 0.6},
-            "16": {"x": 0.7, "y": 0.6},
-            "19": {"x": 0.28, "y": 0.62},
-            "20": {"x": 0.72, "y": 0.62},
-            "23": {"x": 0.42, "y": 0.55},
-            "24": {"x": 0.58, "y": 0.55},
-            "25": {"x": 0.4, "y": 0.75},
-            "26": {"x": 0.6, "y": 0.75},
-            "27": {"x": 0.38, "y": 0.9},
-            "28": {"x": 0.62, "y": 0.9},
-            "31": {"x": 0.36, "y": 0.93},
-            "32": {"x": 0.64, "y": 0.93}
-        }
-    ]
+    return get_library_guide_poses("shoulder")
+
 
 # ✨ 팔 들기 운동 가이드 포즈 추가
 def get_arm_raise_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """팔 벌리기/들기 가이드 포즈"""
-    return [
-        # 프레임 1: 팔 내림
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 팔 옆으로 벌림 (90도)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.25, "y": 0.35},
-            "14": {"x": 0.75, "y": 0.35},
-            "15": {"x": 0.15, "y": 0.35},
-            "16": {"x": 0.85, "y": 0.35},
-            "19": {"x": 0.12, "y": 0.35},
-            "20": {"x": 0.88, "y": 0.35},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        }
-    ]
-    
+    return get_library_guide_poses("arm_raise")
+
+
 def get_ankle_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """발목 돌리기/굽히기 가이드 포즈 (4개 프레임으로 회전 표현)"""
-    return [
-        # 프레임 1: 발목 중앙 (시작)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.92},
-            "28": {"x": 0.62, "y": 0.92},
-            "29": {"x": 0.36, "y": 0.93},
-            "30": {"x": 0.64, "y": 0.93},
-            "31": {"x": 0.38, "y": 0.95},
-            "32": {"x": 0.62, "y": 0.95}
-        },
-        # 프레임 2: 발끝 위로 (발목 굽힘)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.92},
-            "28": {"x": 0.62, "y": 0.92},
-            "29": {"x": 0.36, "y": 0.95},
-            "30": {"x": 0.64, "y": 0.95},
-            "31": {"x": 0.38, "y": 0.88},
-            "32": {"x": 0.62, "y": 0.88}
-        },
-        # 프레임 3: 발끝 오른쪽으로
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.92},
-            "28": {"x": 0.62, "y": 0.92},
-            "29": {"x": 0.34, "y": 0.93},
-            "30": {"x": 0.6, "y": 0.93},
-            "31": {"x": 0.32, "y": 0.95},
-            "32": {"x": 0.66, "y": 0.95}
-        },
-        # 프레임 4: 발끝 아래로 (발목 펴기)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.92},
-            "28": {"x": 0.62, "y": 0.92},
-            "29": {"x": 0.36, "y": 0.9},
-            "30": {"x": 0.64, "y": 0.9},
-            "31": {"x": 0.38, "y": 0.98},
-            "32": {"x": 0.62, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("ankle")
 
 
 # ✨ 종아리(카프) 레이즈 가이드 포즈 추가
 def get_calf_raise_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """종아리 올리기 (카프 레이즈) 가이드 포즈"""
-    return [
-        # 프레임 1: 발뒤꿈치 내림 (시작)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "29": {"x": 0.36, "y": 0.97},
-            "30": {"x": 0.64, "y": 0.97},
-            "31": {"x": 0.38, "y": 0.98},
-            "32": {"x": 0.62, "y": 0.98}
-        },
-        # 프레임 2: 발뒤꿈치 올림 (까치발)
-        {
-            "0": {"x": 0.5, "y": 0.1},
-            "11": {"x": 0.4, "y": 0.25},
-            "12": {"x": 0.6, "y": 0.25},
-            "13": {"x": 0.35, "y": 0.45},
-            "14": {"x": 0.65, "y": 0.45},
-            "15": {"x": 0.3, "y": 0.65},
-            "16": {"x": 0.7, "y": 0.65},
-            "19": {"x": 0.28, "y": 0.67},
-            "20": {"x": 0.72, "y": 0.67},
-            "23": {"x": 0.42, "y": 0.55},
-            "24": {"x": 0.58, "y": 0.55},
-            "25": {"x": 0.4, "y": 0.75},
-            "26": {"x": 0.6, "y": 0.75},
-            "27": {"x": 0.38, "y": 0.88},
-            "28": {"x": 0.62, "y": 0.88},
-            "29": {"x": 0.36, "y": 0.85},
-            "30": {"x": 0.64, "y": 0.85},
-            "31": {"x": 0.38, "y": 0.98},
-            "32": {"x": 0.62, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("calf_raise")
 
 
 def get_squat_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """스쿼트 가이드 포즈 (손목, 발목까지 세밀하게)"""
-    return [
-        # 프레임 1: 서있는 자세
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 앉은 자세
-        {
-            "0": {"x": 0.5, "y": 0.25},
-            "11": {"x": 0.4, "y": 0.4},
-            "12": {"x": 0.6, "y": 0.4},
-            "13": {"x": 0.32, "y": 0.55},
-            "14": {"x": 0.68, "y": 0.55},
-            "15": {"x": 0.25, "y": 0.7},
-            "16": {"x": 0.75, "y": 0.7},
-            "19": {"x": 0.23, "y": 0.72},
-            "20": {"x": 0.77, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.75},
-            "24": {"x": 0.58, "y": 0.75},
-            "25": {"x": 0.35, "y": 0.85},
-            "26": {"x": 0.65, "y": 0.85},
-            "27": {"x": 0.33, "y": 0.95},
-            "28": {"x": 0.67, "y": 0.95},
-            "31": {"x": 0.31, "y": 0.98},
-            "32": {"x": 0.69, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("squat")
 
 
 def get_lunge_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """런지 가이드 포즈"""
-    return [
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        {
-            "0": {"x": 0.5, "y": 0.2},
-            "11": {"x": 0.4, "y": 0.35},
-            "12": {"x": 0.6, "y": 0.35},
-            "13": {"x": 0.32, "y": 0.55},
-            "14": {"x": 0.68, "y": 0.55},
-            "15": {"x": 0.28, "y": 0.75},
-            "16": {"x": 0.72, "y": 0.75},
-            "23": {"x": 0.42, "y": 0.65},
-            "24": {"x": 0.58, "y": 0.65},
-            "25": {"x": 0.35, "y": 0.8},
-            "26": {"x": 0.65, "y": 0.85},
-            "27": {"x": 0.33, "y": 0.92},
-            "28": {"x": 0.67, "y": 0.97},
-            "29": {"x": 0.32, "y": 0.93},
-            "30": {"x": 0.68, "y": 0.98},
-            "31": {"x": 0.31, "y": 0.95},
-            "32": {"x": 0.69, "y": 0.99}
-        }
-    ]
+    return get_library_guide_poses("lunge")
 
 
 def get_plank_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """플랭크 가이드 포즈"""
-    return [
-        {
-            "0": {"x": 0.5, "y": 0.4},
-            "11": {"x": 0.35, "y": 0.45},
-            "12": {"x": 0.65, "y": 0.45},
-            "13": {"x": 0.25, "y": 0.5},
-            "14": {"x": 0.75, "y": 0.5},
-            "15": {"x": 0.2, "y": 0.55},
-            "16": {"x": 0.8, "y": 0.55},
-            "19": {"x": 0.18, "y": 0.56},
-            "20": {"x": 0.82, "y": 0.56},
-            "23": {"x": 0.38, "y": 0.55},
-            "24": {"x": 0.62, "y": 0.55},
-            "25": {"x": 0.4, "y": 0.65},
-            "26": {"x": 0.6, "y": 0.65},
-            "27": {"x": 0.42, "y": 0.75},
-            "28": {"x": 0.58, "y": 0.75},
-            "31": {"x": 0.44, "y": 0.78},
-            "32": {"x": 0.56, "y": 0.78}
-        }
-    ]
+    return get_library_guide_poses("plank")
 
 
 def get_pushup_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """팔굽혀펴기 가이드 포즈"""
-    return [
-        {
-            "0": {"x": 0.5, "y": 0.35},
-            "11": {"x": 0.35, "y": 0.4},
-            "12": {"x": 0.65, "y": 0.4},
-            "13": {"x": 0.25, "y": 0.45},
-            "14": {"x": 0.75, "y": 0.45},
-            "15": {"x": 0.2, "y": 0.5},
-            "16": {"x": 0.8, "y": 0.5},
-            "19": {"x": 0.18, "y": 0.52},
-            "20": {"x": 0.82, "y": 0.52},
-            "23": {"x": 0.38, "y": 0.5},
-            "24": {"x": 0.62, "y": 0.5},
-            "25": {"x": 0.4, "y": 0.6},
-            "26": {"x": 0.6, "y": 0.6},
-            "27": {"x": 0.42, "y": 0.7},
-            "28": {"x": 0.58, "y": 0.7},
-            "31": {"x": 0.44, "y": 0.73},
-            "32": {"x": 0.56, "y": 0.73}
-        },
-        {
-            "0": {"x": 0.5, "y": 0.47},
-            "11": {"x": 0.35, "y": 0.52},
-            "12": {"x": 0.65, "y": 0.52},
-            "13": {"x": 0.28, "y": 0.54},
-            "14": {"x": 0.72, "y": 0.54},
-            "15": {"x": 0.2, "y": 0.55},
-            "16": {"x": 0.8, "y": 0.55},
-            "19": {"x": 0.18, "y": 0.56},
-            "20": {"x": 0.82, "y": 0.56},
-            "23": {"x": 0.38, "y": 0.58},
-            "24": {"x": 0.62, "y": 0.58},
-            "25": {"x": 0.4, "y": 0.68},
-            "26": {"x": 0.6, "y": 0.68},
-            "27": {"x": 0.42, "y": 0.78},
-            "28": {"x": 0.58, "y": 0.78},
-            "31": {"x": 0.44, "y": 0.81},
-            "32": {"x": 0.56, "y": 0.81}
-        }
-    ]
+    return get_library_guide_poses("pushup")
 
 
 def get_leg_raise_guide_poses() -> List[Dict[str, Dict[str, float]]]:
@@ -1204,92 +736,12 @@ def get_leg_raise_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     레그 레이즈 (하체 올리기) 가이드 포즈
     ✅ 수정: 더 명확한 다리 올리기 동작
     """
-    return [
-        # 프레임 1: 다리 내림 (시작)
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.45, "y": 0.3},
-            "12": {"x": 0.55, "y": 0.3},
-            "13": {"x": 0.4, "y": 0.5},
-            "14": {"x": 0.6, "y": 0.5},
-            "15": {"x": 0.35, "y": 0.7},
-            "16": {"x": 0.65, "y": 0.7},
-            "19": {"x": 0.33, "y": 0.72},
-            "20": {"x": 0.67, "y": 0.72},
-            "23": {"x": 0.48, "y": 0.6},
-            "24": {"x": 0.52, "y": 0.6},
-            "25": {"x": 0.48, "y": 0.8},
-            "26": {"x": 0.52, "y": 0.8},
-            "27": {"x": 0.48, "y": 0.95},
-            "28": {"x": 0.52, "y": 0.95},
-            "31": {"x": 0.48, "y": 0.98},
-            "32": {"x": 0.52, "y": 0.98}
-        },
-        # 프레임 2: 왼쪽 다리 올리기
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.45, "y": 0.3},
-            "12": {"x": 0.55, "y": 0.3},
-            "13": {"x": 0.4, "y": 0.5},
-            "14": {"x": 0.6, "y": 0.5},
-            "15": {"x": 0.35, "y": 0.7},
-            "16": {"x": 0.65, "y": 0.7},
-            "19": {"x": 0.33, "y": 0.72},
-            "20": {"x": 0.67, "y": 0.72},
-            "23": {"x": 0.48, "y": 0.6},
-            "24": {"x": 0.52, "y": 0.6},
-            "25": {"x": 0.35, "y": 0.65},  # 왼쪽 무릎 올라감
-            "26": {"x": 0.52, "y": 0.8},   # 오른쪽 다리는 그대로
-            "27": {"x": 0.25, "y": 0.7},   # 왼쪽 발목 올라감
-            "28": {"x": 0.52, "y": 0.95},
-            "31": {"x": 0.22, "y": 0.73},  # 왼쪽 발끝 올라감
-            "32": {"x": 0.52, "y": 0.98}
-        },
-        # 프레임 3: 다시 내림
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.45, "y": 0.3},
-            "12": {"x": 0.55, "y": 0.3},
-            "13": {"x": 0.4, "y": 0.5},
-            "14": {"x": 0.6, "y": 0.5},
-            "15": {"x": 0.35, "y": 0.7},
-            "16": {"x": 0.65, "y": 0.7},
-            "19": {"x": 0.33, "y": 0.72},
-            "20": {"x": 0.67, "y": 0.72},
-            "23": {"x": 0.48, "y": 0.6},
-            "24": {"x": 0.52, "y": 0.6},
-            "25": {"x": 0.48, "y": 0.8},
-            "26": {"x": 0.52, "y": 0.8},
-            "27": {"x": 0.48, "y": 0.95},
-            "28": {"x": 0.52, "y": 0.95},
-            "31": {"x": 0.48, "y": 0.98},
-            "32": {"x": 0.52, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("leg_raise")
+
 
 def get_stretching_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """스트레칭 가이드 포즈"""
-    return [
-        {
-            "0": {"x": 0.5, "y": 0.2},
-            "11": {"x": 0.4, "y": 0.35},
-            "12": {"x": 0.6, "y": 0.35},
-            "13": {"x": 0.3, "y": 0.4},
-            "14": {"x": 0.7, "y": 0.4},
-            "15": {"x": 0.2, "y": 0.45},
-            "16": {"x": 0.8, "y": 0.45},
-            "19": {"x": 0.18, "y": 0.46},
-            "20": {"x": 0.82, "y": 0.46},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("stretching")
 
 
 def get_default_guide_poses_with_animation() -> List[Dict[str, Dict[str, float]]]:
@@ -1297,68 +749,8 @@ def get_default_guide_poses_with_animation() -> List[Dict[str, Dict[str, float]]
     기본 가이드 포즈 (서있는 자세 → 팔 올리기 → 서있는 자세)
     ✅ 반드시 3개 이상의 프레임으로 애니메이션 가능하게!
     """
-    return [
-        # 프레임 1: 서있는 자세
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 팔 옆으로 올리기
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.25, "y": 0.35},
-            "14": {"x": 0.75, "y": 0.35},
-            "15": {"x": 0.15, "y": 0.35},
-            "16": {"x": 0.85, "y": 0.35},
-            "19": {"x": 0.12, "y": 0.35},
-            "20": {"x": 0.88, "y": 0.35},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 3: 다시 팔 내리기
-        {
-            "0": {"x": 0.5, "y": 0.15},
-            "11": {"x": 0.4, "y": 0.3},
-            "12": {"x": 0.6, "y": 0.3},
-            "13": {"x": 0.35, "y": 0.5},
-            "14": {"x": 0.65, "y": 0.5},
-            "15": {"x": 0.3, "y": 0.7},
-            "16": {"x": 0.7, "y": 0.7},
-            "19": {"x": 0.28, "y": 0.72},
-            "20": {"x": 0.72, "y": 0.72},
-            "23": {"x": 0.42, "y": 0.6},
-            "24": {"x": 0.58, "y": 0.6},
-            "25": {"x": 0.4, "y": 0.8},
-            "26": {"x": 0.6, "y": 0.8},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        }
-    ]
+    return get_library_guide_poses("default")
+
 
 # --- 아래는 기존 헬퍼 함수들 ---
 
@@ -1795,138 +1187,70 @@ def generate_silhouette_from_guide_poses(
         "keyframes": keyframes
     }
 
-def get_exercise_specific_poses(exercise_name: str) -> List[Dict[str, Dict[str, float]]]:
-    """
-    운동 이름에서 키워드를 찾아 적절한 하드코딩 포즈 반환
-    """
-    name_lower = exercise_name.lower()
-    
+# 키워드 → 포즈 키 (위에서부터 처음 맞는 규칙 사용)
+EXERCISE_KEYWORD_POSES: List[Tuple[Tuple[str, ...], str]] = [
     # 팔 운동
-    if any(kw in name_lower for kw in ["팔굽혀펴기", "푸시업", "pushup", "push-up"]):
-        return get_pushup_guide_poses()
-    elif any(kw in name_lower for kw in ["벽 팔", "wall push", "벽 밀기"]):
-        return get_wall_pushup_guide_poses()
-    elif any(kw in name_lower for kw in ["팔 들", "팔 올리", "어깨 올리", "shoulder raise"]):
-        return get_arm_raise_guide_poses()
-    
+    (("팔굽혀펴기", "푸시업", "pushup", "push-up"), "pushup"),
+    (("벽 팔", "wall push", "벽 밀기"), "wall_pushup"),
+    (("팔 들", "팔 올리", "어깨 올리", "shoulder raise"), "arm_raise"),
     # 다리 운동
-    elif any(kw in name_lower for kw in ["스쿼트", "squat"]):
-        return get_squat_guide_poses()
-    elif any(kw in name_lower for kw in ["런지", "lunge"]):
-        return get_lunge_guide_poses()
-    elif any(kw in name_lower for kw in ["다리 뻗", "다리 들", "leg raise", "leg extension"]):
-        return get_leg_raise_guide_poses()
-    elif any(kw in name_lower for kw in ["카프", "종아리", "calf"]):
-        return get_calf_raise_guide_poses()
-    
+    (("스쿼트", "squat"), "squat"),
+    (("런지", "lunge"), "lunge"),
+    (("다리 뻗", "다리 들", "leg raise", "leg extension"), "leg_raise"),
+    (("카프", "종아리", "calf"), "calf_raise"),
     # 코어 운동
-    elif any(kw in name_lower for kw in ["플랭크", "plank"]):
-        return get_plank_guide_poses()
-    
+    (("플랭크", "plank"), "plank"),
+    (("브릿지", "bridge"), "glute_bridge"),
+    (("버드독", "bird dog", "bird-dog"), "bird_dog"),
+    # 관절 각도 템플릿 동작
+    (("옆구리", "side bend"), "side_bend"),
+    (("무릎 들", "무릎 올리", "제자리 걷", "knee raise", "march"), "knee_raise"),
+    (("다리 옆", "외전", "hip abduction"), "hip_abduction"),
+    (("힙 힌지", "굿모닝", "hip hinge", "good morning"), "hip_hinge"),
     # 특정 부위
-    elif any(kw in name_lower for kw in ["목", "neck", "경추"]):
-        return get_neck_guide_poses()
-    elif any(kw in name_lower for kw in ["손목", "wrist"]):
-        return get_wrist_guide_poses()
-    elif any(kw in name_lower for kw in ["발목", "ankle"]):
-        return get_ankle_guide_poses()
-    elif any(kw in name_lower for kw in ["어깨", "shoulder"]):
-        return get_shoulder_guide_poses()
-    
+    (("목", "neck", "경추"), "neck"),
+    (("손목", "wrist"), "wrist"),
+    (("발목", "ankle"), "ankle"),
+    (("어깨", "shoulder"), "shoulder"),
     # 앉은 자세
-    elif any(kw in name_lower for kw in ["의자", "앉아", "sitting", "seated"]):
-        return get_sitting_guide_poses()
-    
+    (("의자", "앉아", "sitting", "seated"), "sitting"),
     # 스트레칭
-    elif any(kw in name_lower for kw in ["스트레칭", "스트레치", "stretching", "stretch"]):
-        return get_stretching_guide_poses()
-    
+    (("스트레칭", "스트레치", "stretching", "stretch"), "stretching"),
     # 폼롤러
-    elif any(kw in name_lower for kw in ["폼롤러", "foam roller", "롤러"]):
-        return get_foam_roller_guide_poses()
+    (("폼롤러", "foam roller", "롤러"), "foam_roller"),
+]
+
+
+def get_exercise_specific_poses(exercise_name: str) -> List[Dict[str, Dict[str, float]]]:
+    """
+    운동 이름에서 적절한 하드코딩 포즈 반환
+    1. 이름 퍼지 매칭 (내장 포즈 별칭과 유사도가 임계값 이상)
+    2. 키워드 매칭 (EXERCISE_KEYWORD_POSES)
+    두 단계 모두 이름의 자세 단어("누워서", "앉아서" 등)와 자세가 어긋나는 포즈는 건너뜀
+    (맞는 포즈가 없으면 None → AI 포즈 생성)
+    """
+    matched_poses = get_matched_guide_poses(exercise_name)
+    if matched_poses:
+        return matched_poses
+    
+    name_lower = exercise_name.lower()
+    posture = detect_posture(exercise_name)
+    
+    for keywords, pose_key in EXERCISE_KEYWORD_POSES:
+        if any(kw in name_lower for kw in keywords) and posture_compatible(pose_key, posture):
+            return get_pose_key_guide_poses(pose_key)
     
     return None
 
 def get_wall_pushup_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """벽 팔굽혀펴기 전용 포즈 (6개 프레임)"""
-    return [
-        # 프레임 1: 시작 - 벽에서 팔 쭉 펴기
-        create_full_pose(
-            nose_y=0.15, shoulder_y=0.30, elbow_y=0.45, wrist_y=0.50,
-            hip_y=0.60, knee_y=0.80, ankle_y=0.95
-        ),
-        # 프레임 2: 기울이기 시작
-        create_full_pose(
-            nose_y=0.17, shoulder_y=0.32, elbow_y=0.48, wrist_y=0.52,
-            hip_y=0.61, knee_y=0.80, ankle_y=0.95
-        ),
-        # 프레임 3: 최대한 벽에 가까이
-        create_full_pose(
-            nose_y=0.20, shoulder_y=0.35, elbow_y=0.52, wrist_y=0.55,
-            hip_y=0.63, knee_y=0.80, ankle_y=0.95
-        ),
-        # 프레임 4: 밀기 시작
-        create_full_pose(
-            nose_y=0.18, shoulder_y=0.33, elbow_y=0.50, wrist_y=0.53,
-            hip_y=0.62, knee_y=0.80, ankle_y=0.95
-        ),
-        # 프레임 5: 거의 원위치
-        create_full_pose(
-            nose_y=0.16, shoulder_y=0.31, elbow_y=0.47, wrist_y=0.51,
-            hip_y=0.61, knee_y=0.80, ankle_y=0.95
-        ),
-        # 프레임 6: 완전 원위치
-        create_full_pose(
-            nose_y=0.15, shoulder_y=0.30, elbow_y=0.45, wrist_y=0.50,
-            hip_y=0.60, knee_y=0.80, ankle_y=0.95
-        ),
-    ]
+    return get_library_guide_poses("wall_pushup")
 
 
 def get_foam_roller_guide_poses() -> List[Dict[str, Dict[str, float]]]:
     """폼롤러 스트레칭 포즈 (누운 자세)"""
-    return [
-        # 프레임 1: 누워서 다리 펴기
-        {
-            "0": {"x": 0.50, "y": 0.70},
-            "11": {"x": 0.35, "y": 0.72},
-            "12": {"x": 0.65, "y": 0.72},
-            "13": {"x": 0.25, "y": 0.75},
-            "14": {"x": 0.75, "y": 0.75},
-            "15": {"x": 0.20, "y": 0.78},
-            "16": {"x": 0.80, "y": 0.78},
-            "19": {"x": 0.18, "y": 0.80},
-            "20": {"x": 0.82, "y": 0.80},
-            "23": {"x": 0.42, "y": 0.80},
-            "24": {"x": 0.58, "y": 0.80},
-            "25": {"x": 0.40, "y": 0.88},
-            "26": {"x": 0.60, "y": 0.88},
-            "27": {"x": 0.38, "y": 0.95},
-            "28": {"x": 0.62, "y": 0.95},
-            "31": {"x": 0.36, "y": 0.98},
-            "32": {"x": 0.64, "y": 0.98}
-        },
-        # 프레임 2: 무릎 구부리기
-        {
-            "0": {"x": 0.50, "y": 0.70},
-            "11": {"x": 0.35, "y": 0.72},
-            "12": {"x": 0.65, "y": 0.72},
-            "13": {"x": 0.25, "y": 0.75},
-            "14": {"x": 0.75, "y": 0.75},
-            "15": {"x": 0.20, "y": 0.78},
-            "16": {"x": 0.80, "y": 0.78},
-            "19": {"x": 0.18, "y": 0.80},
-            "20": {"x": 0.82, "y": 0.80},
-            "23": {"x": 0.42, "y": 0.80},
-            "24": {"x": 0.58, "y": 0.80},
-            "25": {"x": 0.38, "y": 0.85},
-            "26": {"x": 0.62, "y": 0.85},
-            "27": {"x": 0.35, "y": 0.90},
-            "28": {"x": 0.65, "y": 0.90},
-            "31": {"x": 0.33, "y": 0.93},
-            "32": {"x": 0.67, "y": 0.93}
-        }
-    ]
+    return get_library_guide_poses("foam_roller")
+
 
 def create_full_pose(nose_y, shoulder_y, elbow_y, wrist_y, hip_y, knee_y, ankle_y) -> Dict[str, Dict[str, float]]:
     """
@@ -1976,9 +1300,10 @@ def create_full_pose(nose_y, shoulder_y, elbow_y, wrist_y, hip_y, knee_y, ankle_
 async def generate_guide_poses(exercise_name: str) -> List[Dict[str, Dict[str, float]]]:
     """
     운동 이름 기반 가이드 포즈 생성 (개선된 버전)
-    1. 하드코딩 포즈 확인
-    2. AI 생성 시도
-    3. 기본 포즈 사용
+    1. 하드코딩 포즈 확인 (이름 퍼지 매칭 → 키워드)
+    2. AI 포즈 캐시 확인
+    3. AI 생성 시도 (검증/보정 후 버려진 프레임이 없으면 캐시에 저장)
+    4. 기본 포즈 사용
     """
     print(f"🎯 generate_guide_poses 호출: '{exercise_name}'")
     
@@ -1988,15 +1313,26 @@ async def generate_guide_poses(exercise_name: str) -> List[Dict[str, Dict[str, f
         print(f"✅ 하드코딩 포즈 사용: {len(hardcoded_poses)}개 프레임")
         return hardcoded_poses
     
-    # ✅ 2단계: AI 생성 시도
+    # ✅ 2단계: 이전에 생성한 AI 포즈 캐시 확인
+    cached_poses = await pose_cache.get_cached_poses(exercise_name)
+    if cached_poses and len(cached_poses) >= 3:
+        print(f"✅ 캐시된 AI 포즈 사용: {len(cached_poses)}개 프레임")
+        return cached_poses
+    
+    # ✅ 3단계: AI 생성 시도 (관절 각도 키프레임 → 로컬 포즈 합성)
     print(f"🤖 AI 포즈 생성 시도: {exercise_name}")
     ai_poses = await generate_poses_with_ai(exercise_name)
+    cacheable = False
+    if ai_poses:
+        ai_poses, cacheable = repair_synthesized_poses(exercise_name, ai_poses)
     
     if ai_poses and len(ai_poses) >= 3:
         print(f"✅ AI 포즈 생성 성공: {len(ai_poses)}개 프레임")
+        if cacheable:
+            await pose_cache.store_poses(exercise_name, ai_poses)
         return ai_poses
     
-    # ✅ 3단계: 기본 포즈 사용
+    # ✅ 4단계: 기본 포즈 사용
     print(f"⚠️ AI 포즈 생성 실패, 기본 포즈 사용")
     default = get_default_guide_poses_with_animation()
     print(f"✅ 기본 애니메이션 포즈 사용: {len(default)}개 프레임")
@@ -2019,43 +1355,3 @@ def convert_guide_pose_to_landmarks(guide_pose: Dict[str, Dict[str, float]]) ->
         else:
             landmarks.append(interpolate_missing_landmark(i, guide_pose))
     return landmarks
-
-
-def interpolate_missing_landmark(landmark_index: int, guide_pose: Dict[str, Dict[str, float]]) -> Dict:
-    """guide_pose에 없는 랜드마크를 주변 랜드마크 기반으로 보간"""
-    if 1 <= landmark_index <= 10:
-        if "0" in guide_pose:
-            nose = guide_pose["0"]
-            offset_map = {
-                1: {"x": 0.01, "y": -0.01}, 2: {"x": 0.02, "y": -0.01}, 3: {"x": 0.03, "y": -0.01},
-                4: {"x": -0.01, "y": -0.01}, 5: {"x": -0.02, "y": -0.01}, 6: {"x": -0.03, "y": -0.01},
-                7: {"x": 0.04, "y": 0.01}, 8: {"x": -0.04, "y": 0.01},
-                9: {"x": 0.02, "y": 0.03}, 10: {"x": -0.02, "y": 0.03},
-            }
-            offset = offset_map.get(landmark_index, {"x": 0, "y": 0})
-            return {"x": nose["x"] + offset["x"], "y": nose["y"] + offset["y"], "z": 0, "visibility": 0.99}
-    
-    if 17 <= landmark_index <= 22:
-        wrist_key = "15" if landmark_index in [17, 19, 21] else "16"
-        if wrist_key in guide_pose:
-            wrist = guide_pose[wrist_key]
-            finger_offset_map = {
-                17: {"x": -0.02, "y": 0.02}, 18: {"x": 0.02, "y": 0.02},
-                19: {"x": -0.04, "y": 0.01}, 20: {"x": 0.04, "y": 0.01},
-                21: {"x": -0.01, "y": 0.03}, 22: {"x": 0.01, "y": 0.03},
-            }
-            offset = finger_offset_map.get(landmark_index, {"x": 0, "y": 0})
-            return {"x": wrist["x"] + offset["x"], "y": wrist["y"] + offset["y"], "z": 0, "visibility": 0.99}
-    
-    if 29 <= landmark_index <= 32:
-        ankle_key = "27" if landmark_index in [29, 31] else "28"
-        if ankle_key in guide_pose:
-            ankle = guide_pose[ankle_key]
-            foot_offset_map = {
-                29: {"x": -0.02, "y": 0.02}, 30: {"x": 0.02, "y": 0.02},
-                31: {"x": -0.02, "y": 0.03}, 32: {"x": 0.02, "y": 0.03},
-            }
-            offset = foot_offset_map.get(landmark_index, {"x": 0, "y": 0})
-            return {"x": ankle["x"] + offset["x"], "y": ankle["y"] + offset["y"], "z": 0, "visibility": 0.99}
-    
-    return {"x": 0.5, "y": 0.5, "z": 0, "visibility": 0.5}
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+운동 생성 백그라운드 작업 큐
+
+POST /exercises/generate/jobs 로 제출된 작업을 exercise_jobs 컬렉션에 저장하고,
+제한된 수의 비동기 워커가 Mongo에서 find_one_and_update로 한 건씩 가져가 처리합니다.
+(프로세스 메모리에 작업 목록을 두지 않으므로 대기 작업 수와 무관하게 모두 처리되고,
+ 여러 프로세스의 워커가 같은 컬렉션을 나눠 처리해도 한 작업은 한 워커만 실행)
+
+- 가져간 작업에는 워커 소유자(owner)와 임대 만료 시각(lease_expires_at)을 기록하고,
+  실행 중에는 주기적으로 임대를 연장 (heartbeat, 임대를 잃으면 실행 중단)
+- 임대가 만료된 running 작업 = 실행하던 프로세스가 종료됨 → 다른 워커가 다시 가져감
+- 새 작업 제출 시 같은 프로세스의 워커를 깨우고, 다른 프로세스 워커는 폴링 주기마다 확인
+
+작업 상태: queued → running → succeeded | failed
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from bson import ObjectId
+from pymongo import ASCENDING, ReturnDocument
+
+from app.config import settings
+from app.database import get_database
+from app.services import exercise_generation_service
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = (JOB_SUCCEEDED, JOB_FAILED)
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없음"""
+
+
+class ExerciseJobQueue:
+    def __init__(
+        self,
+        worker_count: int,
+        max_queue_size: int,
+        max_attempts: int,
+        lease_seconds: float,
+        poll_seconds: float,
+    ):
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        # 이 프로세스 워커들의 소유자 ID (재시작하면 새 ID)
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wakeup: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        # 작업 상태 변경 알림 (같은 프로세스의 구독자별 Event, 작업 ID → 대기 중인 Event들)
+        self._status_events: Dict[str, Set[asyncio.Event]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """
+        워커 시작
+        재시작 전 미완료 작업은 따로 복구하지 않음 (queued는 그대로, 종료된 프로세스의 running은 임대 만료 후 재실행)
+        """
+        if self.is_running:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"exercise-job-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"Exercise job queue started: {self.worker_count} workers (owner={self.owner_id})")
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        # 정상 종료 시 실행 중이던 작업은 임대 만료를 기다리지 않고 바로 대기 상태로
+        try:
+            db = await get_database()
+            await db.exercise_jobs.update_many(
+                {"status": JOB_RUNNING, "owner": self.owner_id},
+                {"$set": {"status": JOB_QUEUED, "owner": None, "lease_expires_at": None,
+                          "updated_at": datetime.utcnow()}}
+            )
+        except Exception as e:
+            logger.warning(f"Could not release running exercise jobs: {e}")
+
+    async def submit(self, user_id: ObjectId, params: Dict) -> Dict:
+        """작업 등록 후 즉시 반환 (실제 생성은 워커가 수행)"""
+        if not self.is_running:
+            raise RuntimeError("Exercise job queue is not running.")
+
+        db = await get_database()
+        # 대기 작업 수 제한 (status_created_at 인덱스로 개수 확인, 동시 제출 시 약간 넘을 수 있음)
+        if await db.exercise_jobs.count_documents({"status": JOB_QUEUED}, limit=self.max_queue_size) >= self.max_queue_size:
+            raise JobQueueFullError()
+
+        now = datetime.utcnow()
+        job_doc = {
+            "user_id": user_id,
+            "status": JOB_QUEUED,
+            "params": params,
+            "exercise_id": None,
+            "error": None,
+            "attempts": 0,
+            "owner": None,
+            "lease_expires_at": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        result = await db.exercise_jobs.insert_one(job_doc)
+        job_doc["_id"] = result.inserted_id
+
+        self._wakeup.set()
+        return job_doc
+
+    async def get_job(self, job_id: str, user_id: ObjectId) -> Optional[Dict]:
+        db = await get_database()
+        return await db.exercise_jobs.find_one({"_id": ObjectId(job_id), "user_id": user_id})
+
+    async def wait_for_update(self, job_id: str, timeout: float) -> None:
+        """
+        상태 변경 알림 또는 timeout까지 대기 (다른 프로세스 워커는 timeout 후 재조회로 감지)
+        구독자마다 Event를 따로 두므로 한 구독자가 깨어나도 다른 구독자의 알림은 지워지지 않음
+        """
+        event = asyncio.Event()
+        waiters = self._status_events.setdefault(job_id, set())
+        waiters.add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # 구독자가 모두 떠나면 작업 항목 제거 (종료 상태에 도달하지 않은 작업도 남지 않도록)
+            waiters.discard(event)
+            if not waiters and self._status_events.get(job_id) is waiters:
+                del self._status_events[job_id]
+
+    def _notify(self, job_id: str) -> None:
+        for event in self._status_events.get(job_id, ()):
+            event.set()
+
+    async def _set_status(self, db, job_id: str, status: str, **fields) -> None:
+        """이 워커가 소유한 작업만 갱신 (임대가 만료돼 다른 워커가 가져간 작업은 덮어쓰지 않음)"""
+        fields.update({"status": status, "updated_at": datetime.utcnow()})
+        if status in TERMINAL_STATUSES:
+            fields["lease_expires_at"] = None
+        result = await db.exercise_jobs.update_one(
+            {"_id": ObjectId(job_id), "owner": self.owner_id},
+            {"$set": fields}
+        )
+        if result.matched_count == 0:
+            logger.warning(f"Exercise job {job_id} lease was lost; {status} not recorded")
+        self._notify(job_id)
+
+    async def _claim(self, db) -> Optional[Dict]:
+        """대기 작업 또는 임대가 만료된 실행 중 작업 1개를 가져감 (오래된 작업부터)"""
+        now = datetime.utcnow()
+        return await db.exercise_jobs.find_one_and_update(
+            {"$or": [
+                {"status": JOB_QUEUED},
+                {"status": JOB_RUNNING, "lease_expires_at": {"$not": {"$gt": now}}},
+            ]},
+            {
+                "$set": {
+                    "status": JOB_RUNNING,
+                    "owner": self.owner_id,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "started_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _heartbeat(self, db, job_id: str) -> None:
+        """
+        실행 중인 작업의 임대 연장 (임대 기간의 1/3마다), 임대를 잃으면 반환
+        연장 중 Mongo 오류는 로그만 남기고 다음 주기에 다시 시도 (한 번 실패로 연장을 멈추지 않음)
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                result = await db.exercise_jobs.update_one(
+                    {"_id": ObjectId(job_id), "owner": self.owner_id, "status": JOB_RUNNING},
+                    {"$set": {"lease_expires_at": datetime.utcnow() + timedelta(seconds=self.lease_seconds)}}
+                )
+            except Exception as e:
+                logger.warning(f"Exercise job {job_id} lease renewal failed: {e}")
+                continue
+            if result.matched_count == 0:
+                return
+
+    async def _wait_for_work(self) -> None:
+        """새 작업 알림 또는 폴링 주기까지 대기"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker(self, worker_index: int) -> None:
+        while True:
+            # 가져가기 전에 알림을 지워야 그 사이에 제출된 작업 알림을 놓치지 않음
+            self._wakeup.clear()
+            try:
+                db = await get_database()
+                job = await self._claim(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Exercise job claim failed in worker {worker_index}: {e}")
+                job = None
+
+            if not job:
+                await self._wait_for_work()
+                continue
+
+            job_id = str(job["_id"])
+            run = asyncio.create_task(self._run_job(db, job))
+            heartbeat = asyncio.create_task(self._heartbeat(db, job_id))
+            try:
+                await asyncio.wait({run, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+                if not run.done():
+                    # 임대를 잃음 = 다른 워커가 다시 가져가 실행하므로 이 실행은 중단
+                    logger.warning(f"Exercise job {job_id} lease was lost; stopping it in worker {worker_index}")
+                    run.cancel()
+                    await asyncio.gather(run, return_exceptions=True)
+                elif not run.cancelled() and run.exception():
+                    e = run.exception()
+                    logger.error(f"Exercise job {job_id} crashed in worker {worker_index}: {e}", exc_info=e)
+            finally:
+                heartbeat.cancel()
+                run.cancel()
+
+    async def _run_job(self, db, job: Dict) -> None:
+        job_id = str(job["_id"])
+        self._notify(job_id)
+
+        if job["attempts"] > self.max_attempts:
+            await self._set_status(db, job_id, JOB_FAILED, error="최대 재시도 횟수를 초과했습니다.",
+                                   finished_at=datetime.utcnow())
+            return
+
+        try:
+            user = await db.users.find_one({"_id": job["user_id"]}, {"body_condition": 1})
+            if not user:
+                raise ValueError("사용자를 찾을 수 없습니다.")
+
+            params = job["params"]
+            generated_exercise = await exercise_generation_service.generate_personalized_exercise(
+                user_body_condition=user.get("body_condition", {}),
+                exercise_type=params["exercise_type"],
+                intensity=params["intensity"],
+                duration_minutes=params["duration_minutes"],
+                db=db
+            )
+            exercise_doc = exercise_generation_service.build_generated_exercise_doc(
+                job["user_id"], generated_exercise
+            )
+            result = await db.generated_exercises.insert_one(exercise_doc)
+
+        except Exception as e:
+            logger.error(f"Exercise job {job_id} failed: {e}")
+            await self._set_status(db, job_id, JOB_FAILED, error=str(e), finished_at=datetime.utcnow())
+            return
+
+        await self._set_status(db, job_id, JOB_SUCCEEDED, exercise_id=result.inserted_id,
+                               finished_at=datetime.utcnow())
+
+
+exercise_job_queue = ExerciseJobQueue(
+    worker_count=settings.EXERCISE_JOB_WORKERS,
+    max_queue_size=settings.EXERCISE_JOB_QUEUE_SIZE,
+    max_attempts=settings.EXERCISE_JOB_MAX_ATTEMPTS,
+    lease_seconds=settings.EXERCISE_JOB_LEASE_SECONDS,
+    poll_seconds=settings.EXERCISE_JOB_POLL_SECONDS,
+)
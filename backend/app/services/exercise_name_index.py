@@ -0,0 +1,292 @@
+"""
+운동 이름 퍼지 매칭 인덱스 (내장 포즈 라이브러리 / 동작 템플릿)
+
+LLM이 만든 운동 이름("벽 짚고 팔굽혀펴기 변형", "앉아서 무릎 펴기" 등)은
+get_exercise_specific_poses의 키워드와 정확히 맞지 않아 AI 포즈 생성으로 넘어가는 경우가 많습니다.
+대표 이름 + 별칭의 문자 n-gram 인덱스로 가장 비슷한 내장 포즈를 찾고,
+유사도가 임계값(EXERCISE_NAME_MATCH_THRESHOLD) 이상이면 LLM 호출 없이 내장 포즈를 사용합니다.
+
+- 이름은 normalize_exercise_name으로 정규화 후 2/3-gram (앞뒤 경계 포함)
+- n-gram마다 IDF 가중치 (여러 별칭에 흔한 "기$", "펴기" 같은 n-gram은 가중치가 낮음)
+- 유사도: 별칭 쪽 재현율을 더 중시하는 F2 점수
+  (별칭이 이름에 거의 다 포함되면 "변형", "천천히" 같은 수식어가 붙어도 높은 점수)
+- 이름에 자세 단어("누워서", "앉아서", "서서" 등)가 있으면 자세가 다른 포즈는 후보에서 제외
+  ("누워서 다리 옆으로 들기"가 서서 하는 hip_abduction으로 매칭되지 않도록)
+- 프로세스 시작 시 한 번 생성, 매칭 결과/적중률은 로그와 관리자 API로 확인 (별칭 조정용)
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.services.pose_library import get_library_guide_poses, get_pose_library
+from app.services.pose_synthesizer import MOTION_TEMPLATES, get_template_guide_poses
+from app.utils.exercise_names import normalize_exercise_name
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZES = (2, 3)
+F_BETA = 2.0
+RECENT_MISS_SIZE = 100
+
+# 포즈 키 (포즈 라이브러리 세트 또는 동작 템플릿) → 대표 이름 + 별칭
+EXERCISE_NAME_ALIASES: Dict[str, List[str]] = {
+    "pushup": ["팔굽혀펴기", "무릎 대고 팔굽혀펴기", "니 푸시업", "push up"],
+    "wall_pushup": ["벽 팔굽혀펴기", "벽 짚고 팔굽혀펴기", "벽 밀기", "월 푸시업", "wall push up"],
+    "arm_raise": ["팔 들어올리기", "팔 올리기", "양팔 들기", "팔 앞으로 들기", "숄더 레이즈", "arm raise"],
+    "squat": ["스쿼트", "벽 스쿼트", "의자 스쿼트", "하프 스쿼트", "앉았다 일어서기", "squat"],
+    "lunge": ["런지", "제자리 런지", "스플릿 스쿼트", "lunge"],
+    "leg_raise": ["다리 들기", "누워서 다리 들기", "다리 들어올리기", "다리 뻗어 들기", "레그 레이즈", "straight leg raise"],
+    "calf_raise": ["까치발 들기", "발뒤꿈치 들기", "발꿈치 들기", "카프 레이즈", "종아리 운동", "calf raise"],
+    "plank": ["플랭크", "무릎 플랭크", "엎드려 버티기", "plank"],
+    "neck": ["목 스트레칭", "목 돌리기", "목 옆으로 기울이기", "턱 당기기", "경추 스트레칭", "neck stretch"],
+    "wrist": ["손목 돌리기", "손목 스트레칭", "손목 굽히기", "손목 펴기", "wrist stretch"],
+    "ankle": ["발목 돌리기", "발목 펌프", "발목 스트레칭", "발목 굽히기", "ankle pump"],
+    "shoulder": ["어깨 돌리기", "어깨 으쓱", "어깨 으쓱하기", "어깨 스트레칭", "견갑골 모으기", "shoulder roll"],
+    "sitting": ["의자에 앉아 다리 뻗기", "앉아서 무릎 펴기", "앉아서 다리 펴기", "의자 운동", "seated knee extension"],
+    "stretching": ["전신 스트레칭", "스트레칭", "기지개 켜기", "full body stretch"],
+    "foam_roller": ["폼롤러", "폼롤러 마사지", "폼롤러 스트레칭", "foam roller"],
+    "side_bend": ["옆구리 늘리기", "옆구리 스트레칭", "사이드 벤드", "side bend"],
+    "knee_raise": ["무릎 들어올리기", "제자리 걷기", "니 레이즈", "마칭", "knee raise", "marching"],
+    "hip_abduction": ["다리 옆으로 들기", "서서 다리 벌리기", "고관절 외전", "hip abduction"],
+    "hip_hinge": ["힙 힌지", "굿모닝", "hip hinge", "good morning"],
+    "glute_bridge": ["브릿지", "힙 브릿지", "누워서 엉덩이 들기", "엉덩이 들어올리기", "glute bridge"],
+    "bird_dog": ["버드독", "네발 기기 팔다리 뻗기", "bird dog"],
+}
+
+# 자세 단어 (정규화 후 부분 일치) → 자세
+POSTURE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "lying": ("누워", "누운", "엎드려", "엎드린", "옆으로누", "네발", "lying", "supine", "prone"),
+    "sitting": ("앉아", "앉은", "sitting", "seated"),
+    "standing": ("서서", "선자세", "standing"),
+}
+
+# 특정 자세에서만 하는 포즈 키 → 자세 (없는 키는 어느 자세로도 가능 - 목/손목/어깨 등)
+POSE_POSTURES: Dict[str, str] = {
+    "pushup": "lying",
+    "plank": "lying",
+    "leg_raise": "lying",
+    "glute_bridge": "lying",
+    "bird_dog": "lying",
+    "foam_roller": "lying",
+    "sitting": "sitting",
+    "squat": "standing",
+    "lunge": "standing",
+    "calf_raise": "standing",
+    "wall_pushup": "standing",
+    "knee_raise": "standing",
+    "hip_abduction": "standing",
+    "hip_hinge": "standing",
+    "side_bend": "standing",
+}
+
+
+def detect_posture(exercise_name: str) -> Optional[str]:
+    """이름의 자세 단어로 자세 추정 (없거나 여러 자세가 섞여 있으면 None)"""
+    normalized = normalize_exercise_name(exercise_name)
+    postures = {
+        posture
+        for posture, keywords in POSTURE_KEYWORDS.items()
+        if any(keyword in normalized for keyword in keywords)
+    }
+    return postures.pop() if len(postures) == 1 else None
+
+
+def posture_compatible(pose_key: str, posture: Optional[str]) -> bool:
+    """이름의 자세(posture)와 포즈 키의 자세가 어긋나지 않는지"""
+    pose_posture = POSE_POSTURES.get(pose_key)
+    return posture is None or pose_posture is None or pose_posture == posture
+
+
+def get_pose_key_guide_poses(pose_key: str) -> List[Dict[str, Dict[str, float]]]:
+    """포즈 키 (동작 템플릿 또는 포즈 라이브러리 세트) → guide_poses"""
+    if pose_key in MOTION_TEMPLATES:
+        return get_template_guide_poses(pose_key)
+    return get_library_guide_poses(pose_key)
+
+
+def char_ngrams(normalized_name: str) -> Set[str]:
+    """정규화된 이름의 문자 n-gram (앞뒤 경계 ^, $ 포함)"""
+    padded = f"^{normalized_name}$"
+    return {
+        padded[i:i + n]
+        for n in NGRAM_SIZES
+        for i in range(len(padded) - n + 1)
+    }
+
+
+@dataclass
+class NameMatch:
+    pose_key: str
+    alias: str
+    score: float
+
+
+@dataclass
+class _Entry:
+    pose_key: str
+    alias: str
+    grams: Set[str]
+    weight: float  # n-gram IDF 합계
+
+
+class ExerciseNameIndex:
+    """별칭 n-gram 역색인 (생성 후 읽기 전용)"""
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        self.entries: List[_Entry] = []
+        seen = set()
+        for pose_key, names in aliases.items():
+            for name in names:
+                normalized = normalize_exercise_name(name)
+                if normalized and (pose_key, normalized) not in seen:
+                    seen.add((pose_key, normalized))
+                    self.entries.append(_Entry(pose_key, name, char_ngrams(normalized), 0.0))
+
+        document_frequency: Dict[str, int] = {}
+        for entry in self.entries:
+            for gram in entry.grams:
+                document_frequency[gram] = document_frequency.get(gram, 0) + 1
+
+        total = len(self.entries)
+        self.idf = {gram: math.log(1 + total / count) for gram, count in document_frequency.items()}
+        # 인덱스에 없는 n-gram (이름에만 있는 수식어)은 가장 드문 n-gram과 같은 가중치
+        self.unknown_idf = math.log(1 + total)
+
+        self.postings: Dict[str, List[int]] = {}
+        for entry_index, entry in enumerate(self.entries):
+            entry.weight = sum(self.idf[gram] for gram in entry.grams)
+            for gram in entry.grams:
+                self.postings.setdefault(gram, []).append(entry_index)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def match(self, exercise_name: str) -> Optional[NameMatch]:
+        """
+        가장 비슷한 별칭 (임계값 적용 전 점수 그대로 반환, n-gram이 하나도 안 겹치면 None)
+        이름의 자세와 어긋나는 포즈의 별칭은 후보에서 제외
+        """
+        normalized = normalize_exercise_name(exercise_name)
+        if not normalized:
+            return None
+        posture = detect_posture(exercise_name)
+
+        grams = char_ngrams(normalized)
+        query_weight = sum(self.idf.get(gram, self.unknown_idf) for gram in grams)
+
+        overlap: Dict[int, float] = {}
+        for gram in grams:
+            for entry_index in self.postings.get(gram, ()):
+                if not posture_compatible(self.entries[entry_index].pose_key, posture):
+                    continue
+                overlap[entry_index] = overlap.get(entry_index, 0.0) + self.idf[gram]
+        if not overlap:
+            return None
+
+        beta2 = F_BETA ** 2
+        best_index, best_score = -1, 0.0
+        for entry_index, shared in overlap.items():
+            entry = self.entries[entry_index]
+            precision = shared / query_weight
+            recall = shared / entry.weight
+            score = (1 + beta2) * precision * recall / (beta2 * precision + recall)
+            if score > best_score:
+                best_index, best_score = entry_index, score
+
+        entry = self.entries[best_index]
+        return NameMatch(entry.pose_key, entry.alias, round(best_score, 3))
+
+
+_index: Optional[ExerciseNameIndex] = None
+_index_lock = threading.Lock()
+
+_stats = {
+    "lookups": 0,
+    "hits": 0,
+    "misses": 0,
+}
+_recent_misses: Deque[Dict] = deque(maxlen=RECENT_MISS_SIZE)
+
+
+def _available_aliases() -> Dict[str, List[str]]:
+    """실제로 포즈가 있는 키만 (라이브러리에서 세트가 빠져도 인덱스가 깨지지 않도록)"""
+    library = get_pose_library()
+    return {
+        pose_key: names
+        for pose_key, names in EXERCISE_NAME_ALIASES.items()
+        if pose_key in library or pose_key in MOTION_TEMPLATES
+    }
+
+
+def build_exercise_name_index() -> ExerciseNameIndex:
+    """인덱스 (재)생성 - 프로세스 시작 시 호출"""
+    global _index
+    with _index_lock:
+        _index = ExerciseNameIndex(_available_aliases())
+    logger.info(f"Exercise name index built: {len(_index)} aliases")
+    return _index
+
+
+def get_exercise_name_index() -> ExerciseNameIndex:
+    if _index is None:
+        return build_exercise_name_index()
+    return _index
+
+
+def match_exercise_name(exercise_name: str) -> Optional[NameMatch]:
+    """
+    임계값 이상으로 매칭되는 내장 포즈 (없으면 None)
+    매칭 결과는 적중률 통계와 로그에 기록
+    """
+    match = get_exercise_name_index().match(exercise_name)
+    _stats["lookups"] += 1
+
+    if match and match.score >= settings.EXERCISE_NAME_MATCH_THRESHOLD:
+        _stats["hits"] += 1
+        logger.info(
+            f"Exercise name index hit: '{exercise_name}' → {match.pose_key} "
+            f"('{match.alias}', score={match.score}) hit_rate={_hit_rate():.3f}"
+        )
+        return match
+
+    _stats["misses"] += 1
+    _recent_misses.append({
+        "exercise_name": exercise_name,
+        "best_pose_key": match.pose_key if match else None,
+        "best_alias": match.alias if match else None,
+        "score": match.score if match else 0.0,
+    })
+    logger.info(
+        f"Exercise name index miss: '{exercise_name}' "
+        f"(best={match.pose_key if match else None}, score={match.score if match else 0.0}) "
+        f"hit_rate={_hit_rate():.3f}"
+    )
+    return None
+
+
+def get_matched_guide_poses(exercise_name: str) -> Optional[List[Dict[str, Dict[str, float]]]]:
+    """이름이 내장 포즈와 매칭되면 그 guide_poses, 아니면 None"""
+    match = match_exercise_name(exercise_name)
+    if match is None:
+        return None
+    return get_pose_key_guide_poses(match.pose_key)
+
+
+def _hit_rate() -> float:
+    return _stats["hits"] / _stats["lookups"] if _stats["lookups"] else 0.0
+
+
+def get_name_index_stats() -> Dict:
+    """적중률 + 최근 미스 (별칭 조정용, 점수가 임계값에 가까운 미스가 별칭 추가 후보)"""
+    return {
+        **_stats,
+        "hit_rate": round(_hit_rate(), 3),
+        "threshold": settings.EXERCISE_NAME_MATCH_THRESHOLD,
+        "aliases": len(_index) if _index is not None else 0,
+        "recent_misses": list(_recent_misses),
+    }
@@ -0,0 +1,106 @@
+"""
+운동 ID → 운동 문서 (my_exercises / generated_exercises 통합 조회)
+
+운동 ID는 내 운동(my_exercises) 또는 추천/생성 운동(generated_exercises) 중 한 곳에 있습니다.
+두 컬렉션을 차례로 find_one 하는 대신 $unionWith 집계 한 번으로 찾고,
+운동 완료 처리는 find_one_and_update로 조회와 수행 횟수 갱신을 한 번에 합니다.
+
+- 두 컬렉션에 같은 ID가 있으면 my_exercises 우선 (기존 조회 순서와 동일)
+- 호출하는 쪽에서 app.projections의 projection을 넘겨 필요한 필드만 읽음
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app import projections
+from app.database import get_database
+
+MY_EXERCISES = "my_exercises"
+GENERATED_EXERCISES = "generated_exercises"
+
+
+@dataclass
+class ResolvedExercise:
+    exercise_id: ObjectId
+    source: str  # MY_EXERCISES | GENERATED_EXERCISES
+    doc: Dict[str, Any]
+
+    @property
+    def is_saved(self) -> bool:
+        return self.source == MY_EXERCISES
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.doc.get("name")
+
+    @property
+    def intensity(self) -> str:
+        """운동 강도 (없으면 customization_params.intensity, 그것도 없으면 medium)"""
+        return (
+            self.doc.get("intensity")
+            or (self.doc.get("customization_params") or {}).get("intensity")
+            or "medium"
+        )
+
+
+def _source_pipeline(source: str, priority: int, match: Dict[str, Any], projection: Dict[str, int]) -> list:
+    return [
+        {"$match": match},
+        {"$project": {**projection, "_priority": {"$literal": priority}, "_source": {"$literal": source}}},
+    ]
+
+
+async def resolve_exercise(
+    exercise_id: ObjectId,
+    user_id: ObjectId,
+    projection: Dict[str, int] = projections.EXERCISE_DETAIL,
+) -> Optional[ResolvedExercise]:
+    """사용자의 운동 1개 (두 컬렉션을 한 번의 집계로 조회, 없으면 None)"""
+    db = await get_database()
+    match = {"_id": exercise_id, "user_id": user_id}
+    pipeline = _source_pipeline(MY_EXERCISES, 0, match, projection) + [
+        {"$unionWith": {
+            "coll": GENERATED_EXERCISES,
+            "pipeline": _source_pipeline(GENERATED_EXERCISES, 1, match, projection),
+        }},
+        {"$sort": {"_priority": 1}},
+        {"$limit": 1},
+    ]
+    docs = await db[MY_EXERCISES].aggregate(pipeline).to_list(length=1)
+    if not docs:
+        return None
+
+    doc = docs[0]
+    doc.pop("_priority", None)
+    source = doc.pop("_source")
+    return ResolvedExercise(exercise_id=exercise_id, source=source, doc=doc)
+
+
+async def resolve_exercise_for_completion(exercise_id: ObjectId, user_id: ObjectId) -> Optional[ResolvedExercise]:
+    """
+    운동 완료 처리용 조회 (EXERCISE_COMPLETION 필드)
+    내 운동이면 조회와 동시에 last_performed_at / total_performed_count 갱신
+    """
+    db = await get_database()
+    match = {"_id": exercise_id, "user_id": user_id}
+
+    doc = await db[MY_EXERCISES].find_one_and_update(
+        match,
+        {
+            "$set": {"last_performed_at": datetime.utcnow()},
+            "$inc": {"total_performed_count": 1},
+        },
+        projection=projections.EXERCISE_COMPLETION,
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc:
+        return ResolvedExercise(exercise_id=exercise_id, source=MY_EXERCISES, doc=doc)
+
+    doc = await db[GENERATED_EXERCISES].find_one(match, projections.EXERCISE_COMPLETION)
+    if doc:
+        return ResolvedExercise(exercise_id=exercise_id, source=GENERATED_EXERCISES, doc=doc)
+    return None
@@ -0,0 +1,363 @@
+"""
+OpenAI 호출 게이트웨이
+
+모든 LLM 호출은 chat_completion()을 통해 나갑니다.
+- LLM_BACKEND=standin 이면 오프라인 대역(llm_standin)으로 요청
+- 하나의 httpx 커넥션 풀을 공유
+- 용도(purpose)별 동시 실행 수 제한 + 호출 timeout
+- 데드라인 전파: llm_deadline() 블록 안의 호출은 남은 시간 안에서만 대기/재시도
+- 일시적 오류(timeout, 연결 오류, 429, 5xx)는 지터를 둔 지수 백오프로 재시도
+- 연속 실패 시 서킷 브레이커가 열려 즉시 LLMUnavailableError 발생
+  → 각 서비스의 기존 except 블록(기본 운동/기본 포즈/기본 피드백)으로 바로 넘어감
+- 호출 지점별 지연시간/재시도 지표 (토큰/비용은 llm_usage에서 집계)
+"""
+
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+
+from app.config import settings
+from app.services.llm_usage import record_llm_call
+
+logger = logging.getLogger(__name__)
+
+
+# LLM 대역 서버가 응답 종류를 고를 때 사용 (OpenAI는 무시)
+PURPOSE_HEADER = "X-LLM-Purpose"
+
+
+class LLMUnavailableError(Exception):
+    """서킷 브레이커가 열려 있거나 데드라인이 지나 LLM을 호출하지 않음"""
+
+
+@dataclass(frozen=True)
+class PurposePolicy:
+    concurrency: int
+    timeout_seconds: float
+
+
+# 용도별 정책 (정의되지 않은 용도는 default 사용)
+PURPOSE_POLICIES: Dict[str, PurposePolicy] = {
+    "exercise": PurposePolicy(concurrency=4, timeout_seconds=30.0),
+    "recommendations": PurposePolicy(concurrency=4, timeout_seconds=30.0),
+    "poses": PurposePolicy(concurrency=4, timeout_seconds=40.0),
+    "feedback": PurposePolicy(concurrency=16, timeout_seconds=5.0),
+    "body_analysis": PurposePolicy(concurrency=4, timeout_seconds=20.0),
+    "default": PurposePolicy(concurrency=4, timeout_seconds=30.0),
+}
+
+_RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+
+# --- 공유 클라이언트 ---
+
+_limits = httpx.Limits(
+    max_connections=settings.LLM_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+)
+_timeout = httpx.Timeout(60.0, connect=5.0)
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    if settings.LLM_BACKEND == "standin" and not settings.OPENAI_BASE_URL:
+        # 오프라인 LLM 대역을 같은 프로세스에서 실행 (네트워크 없음)
+        from app.services.llm_standin import StandinConfig, create_standin_app
+
+        standin_app = create_standin_app(StandinConfig(
+            latency_median_ms=settings.LLM_STANDIN_LATENCY_MEDIAN_MS,
+            latency_sigma=settings.LLM_STANDIN_LATENCY_SIGMA,
+            failure_rate=settings.LLM_STANDIN_FAILURE_RATE,
+            seed=settings.LLM_STANDIN_SEED,
+        ))
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=standin_app), limits=_limits, timeout=_timeout)
+    return httpx.AsyncClient(limits=_limits, timeout=_timeout)
+
+
+def _base_url() -> Optional[str]:
+    if settings.OPENAI_BASE_URL:
+        return settings.OPENAI_BASE_URL
+    if settings.LLM_BACKEND == "standin":
+        return "http://llm-standin/v1"
+    return None
+
+
+_http_client = _build_http_client()
+
+# 재시도/timeout은 게이트웨이가 직접 관리하므로 SDK 재시도는 끔
+client = AsyncOpenAI(
+    api_key=settings.OPENAI_API_KEY or "standin",
+    base_url=_base_url(),
+    http_client=_http_client,
+    max_retries=0,
+)
+
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _policy(purpose: str) -> PurposePolicy:
+    return PURPOSE_POLICIES.get(purpose, PURPOSE_POLICIES["default"])
+
+
+def _semaphore(purpose: str) -> asyncio.Semaphore:
+    key = purpose if purpose in PURPOSE_POLICIES else "default"
+    semaphore = _semaphores.get(key)
+    if semaphore is None:
+        semaphore = _semaphores[key] = asyncio.Semaphore(_policy(key).concurrency)
+    return semaphore
+
+
+# --- 데드라인 전파 ---
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("llm_deadline", default=None)
+
+
+@contextmanager
+def llm_deadline(seconds: float):
+    """
+    블록 안의 LLM 호출에 데드라인 설정 (이미 더 짧은 데드라인이 있으면 그대로 유지)
+    asyncio 태스크는 생성 시점의 컨텍스트를 복사하므로 하위 태스크에도 전파됨
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+# --- 서킷 브레이커 ---
+
+class CircuitBreaker:
+    """연속 실패 N회 → open (reset_seconds 동안 호출 차단) → half-open (1회 시험 호출)"""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        # half-open 시험 호출 시작 시각 (취소 등으로 결과가 안 오면 reset_seconds 후 다시 시험)
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        if state == "half_open" and (
+            self._trial_started_at is None or now - self._trial_started_at >= self.reset_seconds
+        ):
+            self._trial_started_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._trial_started_at = None
+        if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(f"LLM circuit opened after {self.consecutive_failures} consecutive failures")
+            self.opened_at = time.monotonic()
+
+
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+    reset_seconds=settings.LLM_CIRCUIT_RESET_SECONDS,
+)
+
+
+# --- 지표 ---
+
+def _empty_metrics() -> Dict[str, float]:
+    return {
+        "calls": 0,
+        "successes": 0,
+        "failures": 0,
+        "retries": 0,
+        "short_circuited": 0,
+        "total_latency_ms": 0.0,
+        "max_latency_ms": 0.0,
+    }
+
+
+_metrics: Dict[str, Dict[str, float]] = {}
+
+
+def _record(call_site: str, **values) -> None:
+    metrics = _metrics.setdefault(call_site, _empty_metrics())
+    for key, value in values.items():
+        if key == "latency_ms":
+            metrics["total_latency_ms"] += value
+            metrics["max_latency_ms"] = max(metrics["max_latency_ms"], value)
+        else:
+            metrics[key] += value
+
+
+def get_gateway_stats() -> Dict:
+    call_sites = {}
+    for call_site, metrics in _metrics.items():
+        completed = metrics["successes"] + metrics["failures"]
+        call_sites[call_site] = {
+            **metrics,
+            "avg_latency_ms": round(metrics["total_latency_ms"] / completed, 1) if completed else 0.0,
+        }
+    return {
+        "circuit": {
+            "state": circuit_breaker.state,
+            "consecutive_failures": circuit_breaker.consecutive_failures,
+        },
+        "call_sites": call_sites,
+    }
+
+
+# --- 호출 ---
+
+def _prompt_chars(messages) -> int:
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += len(content)
+        elif isinstance(content, list):
+            total += sum(len(item.get("text", "")) for item in content if isinstance(item, dict))
+    return total
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """full jitter 지수 백오프"""
+    cap = settings.LLM_RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+    return random.uniform(0, min(cap, settings.LLM_RETRY_MAX_DELAY_SECONDS))
+
+
+async def chat_completion(purpose: str, call_site: Optional[str] = None, **kwargs):
+    """
+    chat.completions.create 대체
+
+    Args:
+        purpose: 동시 실행 수/timeout 정책 키 (PURPOSE_POLICIES)
+        call_site: 지표 집계용 이름 (기본값 purpose)
+        **kwargs: chat.completions.create 인자
+
+    Raises:
+        LLMUnavailableError: 서킷 open 또는 데드라인 초과
+        openai.APIError 등: 재시도 후에도 실패
+    """
+    call_site = call_site or purpose
+    policy = _policy(purpose)
+    extra_headers = {PURPOSE_HEADER: purpose, **(kwargs.pop("extra_headers", None) or {})}
+    model = kwargs.get("model", "")
+    prompt_chars = _prompt_chars(kwargs.get("messages", []))
+    requested_max_tokens = kwargs.get("max_tokens") or 0
+    _record(call_site, calls=1)
+
+    attempt = 0
+    while True:
+        if not circuit_breaker.allow():
+            _record(call_site, short_circuited=1)
+            raise LLMUnavailableError("LLM circuit is open")
+
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            _record(call_site, failures=1)
+            raise LLMUnavailableError("LLM deadline exceeded")
+        timeout = policy.timeout_seconds if remaining is None else min(policy.timeout_seconds, remaining)
+
+        semaphore = _semaphore(purpose)
+        waited_from = time.monotonic()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # 동시 실행 한도 대기 중 데드라인 초과 - 업스트림 장애가 아니므로 서킷에는 반영하지 않음
+            _record(call_site, failures=1)
+            raise LLMUnavailableError("LLM concurrency wait exceeded deadline")
+
+        started = time.monotonic()
+        try:
+            try:
+                # 세마포어 대기 시간도 데드라인에 포함
+                response = await client.chat.completions.create(
+                    timeout=max(timeout - (started - waited_from), 0.1),
+                    extra_headers=extra_headers,
+                    **kwargs
+                )
+            finally:
+                semaphore.release()
+        except _RETRYABLE_ERRORS as e:
+            circuit_breaker.record_failure()
+            latency_ms = (time.monotonic() - started) * 1000
+            record_llm_call(call_site, model, latency_ms, prompt_chars=prompt_chars,
+                            requested_max_tokens=requested_max_tokens, error=True)
+            backoff = _backoff_seconds(attempt)
+            remaining = remaining_time()
+            can_retry = (
+                attempt < settings.LLM_MAX_RETRIES
+                and (remaining is None or remaining > backoff)
+            )
+            if not can_retry:
+                _record(call_site, failures=1, latency_ms=latency_ms)
+                raise
+            logger.warning(f"LLM call '{call_site}' failed ({type(e).__name__}), retrying in {backoff:.2f}s")
+            _record(call_site, retries=1)
+            attempt += 1
+            await asyncio.sleep(backoff)
+            continue
+        except Exception:
+            # 4xx 등 재시도해도 소용없는 오류 - 서버는 응답했으므로 서킷은 정상으로 간주
+            circuit_breaker.record_success()
+            latency_ms = (time.monotonic() - started) * 1000
+            record_llm_call(call_site, model, latency_ms, prompt_chars=prompt_chars,
+                            requested_max_tokens=requested_max_tokens, error=True)
+            _record(call_site, failures=1, latency_ms=latency_ms)
+            raise
+
+        circuit_breaker.record_success()
+        latency_ms = (time.monotonic() - started) * 1000
+        usage = getattr(response, "usage", None)
+        record_llm_call(
+            call_site,
+            getattr(response, "model", None) or model,
+            latency_ms,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            prompt_chars=prompt_chars,
+            requested_max_tokens=requested_max_tokens,
+        )
+        _record(call_site, successes=1, latency_ms=latency_ms)
+        return response
+
+
+async def close() -> None:
+    await _http_client.aclose()
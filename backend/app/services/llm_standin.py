@@ -0,0 +1,381 @@
+"""
+오프라인 LLM 대역 서버 (OpenAI chat-completions 호환)
+
+벤치마크/부하 테스트를 OpenAI 키나 네트워크 없이 재현 가능하게 돌리기 위한 서버입니다.
+요청 종류(추천, 단일 운동, 포즈, 피드백, 비전)별로 스키마에 맞는 응답을 생성하고,
+지연시간(로그정규분포)과 실패율을 설정할 수 있습니다.
+
+사용 방법:
+    1. 백엔드 프로세스 안에서 사용 (네트워크 없음)
+       LLM_BACKEND=standin
+    2. 별도 서버로 실행
+       python -m app.services.llm_standin --port 8090 --latency-ms 800 --failure-rate 0.05
+       LLM_BACKEND=standin OPENAI_BASE_URL=http://localhost:8090/v1
+
+같은 seed와 같은 요청 순서이면 응답과 지연시간이 항상 같습니다.
+(난수는 seed + 요청 본문 + 같은 본문의 등장 횟수로 정해지므로 동시 요청 순서와 무관)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.services.pose_synthesizer import MOTION_TEMPLATES
+
+
+@dataclass
+class StandinConfig:
+    latency_median_ms: float = 800.0
+    latency_sigma: float = 0.5
+    failure_rate: float = 0.0
+    seed: int = 0
+
+
+PURPOSE_HEADER = "X-LLM-Purpose"
+
+# --- 응답 생성용 데이터 ---
+
+_CANNED_EXERCISES = [
+    {
+        "name": "벽 스쿼트",
+        "pose_library_key": "squat",
+        "target_parts": ["무릎", "허벅지", "엉덩이"],
+        "intensity": "low",
+        "duration_minutes": 10,
+        "sets": 3,
+        "repetitions": 8,
+    },
+    {
+        "name": "의자에 앉아 다리 뻗기",
+        "pose_library_key": "sitting",
+        "target_parts": ["무릎", "허벅지"],
+        "intensity": "low",
+        "duration_minutes": 10,
+        "sets": 3,
+        "repetitions": 12,
+    },
+    {
+        "name": "목 스트레칭",
+        "pose_library_key": "neck",
+        "target_parts": ["목", "어깨"],
+        "intensity": "stretching",
+        "duration_minutes": 5,
+        "sets": 2,
+        "repetitions": 5,
+    },
+    {
+        "name": "벽 팔굽혀펴기",
+        "pose_library_key": "wall_pushup",
+        "target_parts": ["가슴", "어깨", "팔"],
+        "intensity": "medium",
+        "duration_minutes": 8,
+        "sets": 3,
+        "repetitions": 10,
+    },
+    {
+        "name": "손목 돌리기",
+        "pose_library_key": "wrist",
+        "target_parts": ["손목"],
+        "intensity": "low",
+        "duration_minutes": 5,
+        "sets": 2,
+        "repetitions": 10,
+    },
+    {
+        "name": "누워서 다리 들기",
+        "target_parts": ["복부", "허벅지"],
+        "intensity": "medium",
+        "duration_minutes": 10,
+        "sets": 3,
+        "repetitions": 10,
+    },
+    {
+        "name": "까치발 들기",
+        "pose_library_key": "calf_raise",
+        "target_parts": ["종아리", "발목"],
+        "intensity": "low",
+        "duration_minutes": 8,
+        "sets": 3,
+        "repetitions": 15,
+    },
+    {
+        "name": "고양이 소 자세",
+        "target_parts": ["허리", "등"],
+        "intensity": "stretching",
+        "duration_minutes": 6,
+        "sets": 2,
+        "repetitions": 8,
+    },
+    {
+        "name": "브릿지 운동",
+        "target_parts": ["엉덩이", "허리"],
+        "intensity": "medium",
+        "duration_minutes": 10,
+        "sets": 3,
+        "repetitions": 12,
+    },
+]
+
+_FEEDBACK_SENTENCES = [
+    "무릎을 조금 더 천천히 구부려주세요.",
+    "팔을 조금 더 펴주세요.",
+    "허리를 곧게 세워주세요.",
+    "어깨에 힘을 빼고 편하게 유지해주세요.",
+    "엉덩이를 조금 더 뒤로 빼주세요.",
+]
+
+_BODY_PARTS = ["왼쪽 무릎", "오른쪽 무릎", "왼쪽 어깨", "오른쪽 어깨", "허리", "오른쪽 발목", "목"]
+
+# 포즈 응답에 사용할 동작 템플릿 + 운동 이름 키워드 (없으면 기본 동작)
+_MOTION_SOURCES = [
+    ("glute_bridge", ("브릿지", "엉덩이 들")),
+    ("bird_dog", ("버드독", "네 발", "고양이")),
+    ("side_bend", ("옆구리", "허리")),
+    ("hip_hinge", ("힌지", "굿모닝")),
+    ("hip_abduction", ("다리 옆", "외전")),
+    ("knee_raise", ("무릎", "걷기")),
+]
+_DEFAULT_MOTION = {
+    "view": "front",
+    "keyframes": [
+        {},
+        {"shoulder_flexion": 90, "knee": 20, "hip_flexion": 20},
+        {"shoulder_flexion": 150, "knee": 45, "hip_flexion": 45},
+        {"shoulder_flexion": 90, "knee": 20, "hip_flexion": 20},
+        {},
+    ],
+}
+
+
+# --- 요청 분류 ---
+
+def _message_text(messages: List[Dict]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(item.get("text", "") for item in content if isinstance(item, dict))
+    return "\n".join(parts)
+
+
+def _has_image(messages: List[Dict]) -> bool:
+    return any(
+        isinstance(message.get("content"), list)
+        and any(isinstance(item, dict) and item.get("type") == "image_url" for item in message["content"])
+        for message in messages
+    )
+
+
+def classify_request(messages: List[Dict], purpose_header: Optional[str] = None) -> str:
+    """게이트웨이가 보낸 용도 헤더 우선, 없으면 프롬프트 내용으로 추정"""
+    if purpose_header:
+        return purpose_header
+    if _has_image(messages):
+        return "body_analysis"
+    text = _message_text(messages)
+    if "관절 각도 키프레임" in text and "recommendations" not in text:
+        return "poses"
+    if "recommendations" in text:
+        return "recommendations"
+    if "운동 코치" in text:
+        return "feedback"
+    return "exercise"
+
+
+# --- 응답 본문 생성 ---
+
+def _recommendations(rng: random.Random, text: str) -> str:
+    excluded = set()
+    match = re.search(r"절대 포함하지 마세요:\*\*\n- (.+)", text)
+    if match:
+        excluded = {name.strip() for name in match.group(1).split(",")}
+
+    # combined 모드 프롬프트면 운동별 포즈(라이브러리 키 또는 관절 각도 키프레임)도 포함
+    combined = "pose_library_key" in text
+
+    candidates = [e for e in _CANNED_EXERCISES if e["name"] not in excluded] or _CANNED_EXERCISES
+    chosen = rng.sample(candidates, k=min(4, len(candidates)))
+    recommendations = []
+    for exercise in chosen:
+        pose_fields = {}
+        if combined:
+            if "pose_library_key" in exercise:
+                pose_fields["pose_library_key"] = exercise["pose_library_key"]
+            else:
+                pose_fields["motion"] = _motion(rng, exercise["name"])
+        recommendations.append({
+            **{k: v for k, v in exercise.items() if k != "pose_library_key"},
+            **pose_fields,
+            "description": f"{exercise['name']}은(는) {', '.join(exercise['target_parts'])} 부위를 안전하게 강화합니다.",
+            "instructions": [
+                "1단계: 바른 자세로 시작 자세를 잡으세요",
+                "2단계: 천천히 동작을 수행하세요",
+                "3단계: 숨을 내쉬며 원래 자세로 돌아오세요",
+                "4단계: 시작 자세로 돌아와 잠시 휴식하세요",
+            ],
+            "safety_warnings": ["통증이 느껴지면 즉시 중단하세요", "천천히 움직이며 무리하지 마세요"],
+            "recommendation_reason": f"현재 신체 상태를 고려했을 때 {exercise['name']}은(는) 부담이 적어 추천합니다.",
+        })
+    return json.dumps({"recommendations": recommendations}, ensure_ascii=False)
+
+
+def _motion(rng: random.Random, exercise_name: str) -> Dict:
+    """운동 이름에 맞는 관절 각도 키프레임 (요청마다 각도를 조금씩 다르게)"""
+    source = next(
+        (name for name, keywords in _MOTION_SOURCES if any(k in exercise_name for k in keywords)),
+        None,
+    )
+    template = MOTION_TEMPLATES[source] if source else _DEFAULT_MOTION
+    return {
+        "view": template["view"],
+        "keyframes": [
+            {joint: round(angle + rng.uniform(-3, 3), 1) for joint, angle in frame.items()}
+            for frame in template["keyframes"]
+        ],
+    }
+
+
+def _exercise(rng: random.Random, text: str) -> str:
+    exercise = rng.choice(_CANNED_EXERCISES)
+    reps = {"low": 8, "medium": 10, "high": 12}
+    intensity = re.search(r"강도: (low|medium|high)", text)
+    return json.dumps({
+        "name": exercise["name"],
+        "description": f"{exercise['name']}으로 {', '.join(exercise['target_parts'])}을(를) 부드럽게 강화합니다.",
+        "instructions": [
+            "1단계: 바른 자세로 서서 시작하세요",
+            "2단계: 천천히 동작을 수행하세요",
+            "3단계: 호흡을 규칙적으로 유지하세요",
+        ],
+        "repetitions": reps.get(intensity.group(1) if intensity else "medium", 10),
+        "sets": 3,
+        "target_parts": exercise["target_parts"],
+        "safety_warnings": ["통증이 느껴지면 즉시 중단하세요", "무리하지 마세요"],
+    }, ensure_ascii=False)
+
+
+def _poses(rng: random.Random, text: str) -> str:
+    match = re.search(r"\*\*운동 이름:\*\*\s*(.+)", text)
+    exercise_name = match.group(1).strip().lower() if match else ""
+    return json.dumps(_motion(rng, exercise_name), ensure_ascii=False)
+
+
+def _feedback(rng: random.Random, text: str) -> str:
+    return rng.choice(_FEEDBACK_SENTENCES)
+
+
+def _body_analysis(rng: random.Random, text: str) -> str:
+    injured_parts = rng.sample(_BODY_PARTS, k=rng.randint(0, 2))
+    return json.dumps({
+        "injured_parts": injured_parts,
+        "suspected_conditions": [f"{part} 보호대 착용 의심됨" for part in injured_parts],
+        "confidence": rng.choice(["high", "medium", "low"]),
+        "recommendations": ["정확한 진단을 위해 수동 확인 권장"],
+    }, ensure_ascii=False)
+
+
+RESPONDERS = {
+    "recommendations": _recommendations,
+    "exercise": _exercise,
+    "poses": _poses,
+    "feedback": _feedback,
+    "body_analysis": _body_analysis,
+}
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, math.ceil(len(text) / 3))
+
+
+# --- 앱 ---
+
+def create_standin_app(config: StandinConfig) -> FastAPI:
+    app = FastAPI(title="LLM Stand-in", docs_url=None, redoc_url=None)
+    seen_bodies: Counter = Counter()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        raw_body = await request.body()
+        body = json.loads(raw_body)
+        messages = body.get("messages", [])
+
+        body_hash = hashlib.sha256(raw_body).hexdigest()
+        occurrence = seen_bodies[body_hash]
+        seen_bodies[body_hash] += 1
+        rng = random.Random(f"{config.seed}:{body_hash}:{occurrence}")
+
+        if config.latency_median_ms > 0:
+            latency_ms = rng.lognormvariate(math.log(config.latency_median_ms), config.latency_sigma)
+            await asyncio.sleep(latency_ms / 1000)
+
+        if rng.random() < config.failure_rate:
+            status_code = rng.choice([429, 500, 503])
+            return JSONResponse(
+                status_code=status_code,
+                content={"error": {"message": "stand-in injected failure", "type": "server_error", "code": None}},
+            )
+
+        purpose = classify_request(messages, request.headers.get(PURPOSE_HEADER))
+        text = _message_text(messages)
+        content = RESPONDERS.get(purpose, _exercise)(rng, text)
+
+        prompt_tokens = _estimate_tokens(text)
+        completion_tokens = _estimate_tokens(content)
+        return {
+            "id": f"chatcmpl-standin-{body_hash[:12]}-{occurrence}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    return app
+
+
+def _main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="오프라인 LLM 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=StandinConfig.latency_median_ms, help="지연시간 중앙값 (ms)")
+    parser.add_argument("--latency-sigma", type=float, default=StandinConfig.latency_sigma, help="로그정규분포 sigma")
+    parser.add_argument("--failure-rate", type=float, default=StandinConfig.failure_rate, help="실패 응답 비율 (0-1)")
+    parser.add_argument("--seed", type=int, default=StandinConfig.seed)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency_median_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_standin_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    _main()
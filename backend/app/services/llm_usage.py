@@ -0,0 +1,209 @@
+"""
+LLM 토큰/비용 사용량 집계
+
+게이트웨이의 모든 OpenAI 호출(재시도 포함)을 기록합니다.
+- 프로세스 메모리: 호출 지점/모델별 누적 합계 + 최근 지연시간 샘플 (p95 계산용)
+- Mongo llm_usage 컬렉션: 일정 주기마다 구간별 합계 문서로 저장 (보존 기간 후 TTL 삭제)
+
+프롬프트 크기(문자 수)와 요청한 max_tokens도 함께 기록해
+어느 경로를 캐시하거나 줄여야 하는지 판단할 수 있게 합니다.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import get_llm_usage_collection
+
+logger = logging.getLogger(__name__)
+
+# 1M 토큰당 USD 가격 (input, output)
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+LATENCY_SAMPLE_SIZE = 1000
+
+UsageKey = Tuple[str, str]  # (call_site, model)
+
+
+def estimate_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    input_price, output_price = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4o-mini"])
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def _empty_totals() -> Dict[str, float]:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "prompt_chars": 0,
+        "requested_max_tokens": 0,
+        "total_latency_ms": 0.0,
+        "max_latency_ms": 0.0,
+    }
+
+
+def _add(totals: Dict[str, float], record: Dict[str, float]) -> None:
+    for key, value in record.items():
+        if key == "latency_ms":
+            totals["total_latency_ms"] += value
+            totals["max_latency_ms"] = max(totals["max_latency_ms"], value)
+        else:
+            totals[key] += value
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# 프로세스 시작 후 누적
+_totals: Dict[UsageKey, Dict[str, float]] = {}
+_latency_samples: Dict[UsageKey, Deque[float]] = {}
+# 마지막 flush 이후 구간 합계
+_pending: Dict[UsageKey, Dict[str, float]] = {}
+_window_start = datetime.utcnow()
+_started_at = datetime.utcnow()
+
+
+def record_llm_call(
+    call_site: str,
+    model: str,
+    latency_ms: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    prompt_chars: int = 0,
+    requested_max_tokens: int = 0,
+    error: bool = False,
+) -> None:
+    """LLM 호출 1건 기록 (게이트웨이에서 호출)"""
+    key = (call_site, model)
+    record = {
+        "calls": 1,
+        "errors": 1 if error else 0,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "prompt_chars": prompt_chars,
+        "requested_max_tokens": requested_max_tokens,
+        "latency_ms": latency_ms,
+    }
+    _add(_totals.setdefault(key, _empty_totals()), record)
+    _add(_pending.setdefault(key, _empty_totals()), record)
+    _latency_samples.setdefault(key, deque(maxlen=LATENCY_SAMPLE_SIZE)).append(latency_ms)
+
+
+def _summarize(totals: Dict[str, float], model: str, samples: Optional[List[float]] = None) -> Dict:
+    calls = totals["calls"]
+    summary = {
+        **totals,
+        "avg_prompt_tokens": round(totals["prompt_tokens"] / calls, 1) if calls else 0.0,
+        "avg_prompt_chars": round(totals["prompt_chars"] / calls, 1) if calls else 0.0,
+        "avg_latency_ms": round(totals["total_latency_ms"] / calls, 1) if calls else 0.0,
+        "cost_usd": round(estimate_cost_usd(model, totals["prompt_tokens"], totals["completion_tokens"]), 6),
+    }
+    if samples is not None:
+        summary["p95_latency_ms"] = round(_percentile(samples, 95), 1)
+    return summary
+
+
+def get_usage_summary() -> Dict:
+    """프로세스 시작 후 호출 지점별 사용량 + 비용 + p95 지연시간"""
+    call_sites = []
+    for (call_site, model), totals in _totals.items():
+        samples = list(_latency_samples.get((call_site, model), []))
+        call_sites.append({"call_site": call_site, "model": model, **_summarize(totals, model, samples)})
+    call_sites.sort(key=lambda item: item["cost_usd"], reverse=True)
+    return {
+        "since": _started_at.isoformat(),
+        "total_cost_usd": round(sum(item["cost_usd"] for item in call_sites), 6),
+        "call_sites": call_sites,
+    }
+
+
+async def get_persisted_usage(hours: int) -> List[Dict]:
+    """Mongo에 저장된 최근 N시간 사용량 (모든 프로세스 합산, p95 제외)"""
+    collection = await get_llm_usage_collection()
+    since = datetime.utcnow() - timedelta(hours=hours)
+    pipeline = [
+        {"$match": {"window_start": {"$gte": since}}},
+        {"$group": {
+            "_id": {"call_site": "$call_site", "model": "$model"},
+            "calls": {"$sum": "$calls"},
+            "errors": {"$sum": "$errors"},
+            "prompt_tokens": {"$sum": "$prompt_tokens"},
+            "completion_tokens": {"$sum": "$completion_tokens"},
+            "prompt_chars": {"$sum": "$prompt_chars"},
+            "requested_max_tokens": {"$sum": "$requested_max_tokens"},
+            "total_latency_ms": {"$sum": "$total_latency_ms"},
+            "max_latency_ms": {"$max": "$max_latency_ms"},
+        }},
+    ]
+    results = []
+    async for doc in collection.aggregate(pipeline):
+        key = doc.pop("_id")
+        results.append({**key, **_summarize(doc, key["model"])})
+    results.sort(key=lambda item: item["cost_usd"], reverse=True)
+    return results
+
+
+async def flush_usage() -> int:
+    """마지막 flush 이후 구간 합계를 Mongo에 저장 (저장한 문서 수 반환)"""
+    global _pending, _window_start
+    if not _pending:
+        return 0
+
+    pending, window_start = _pending, _window_start
+    _pending, _window_start = {}, datetime.utcnow()
+
+    docs = [
+        {"call_site": call_site, "model": model, "window_start": window_start,
+         "window_end": _window_start, **totals}
+        for (call_site, model), totals in pending.items()
+    ]
+    try:
+        collection = await get_llm_usage_collection()
+        await collection.insert_many(docs, ordered=False)
+    except Exception as e:
+        # 저장 실패 시 다음 flush에서 다시 시도
+        logger.warning(f"LLM usage flush failed: {e}")
+        for key, totals in pending.items():
+            merged = _pending.setdefault(key, _empty_totals())
+            for field, value in totals.items():
+                merged[field] = max(merged[field], value) if field == "max_latency_ms" else merged[field] + value
+        _window_start = window_start
+        return 0
+    return len(docs)
+
+
+_flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.LLM_USAGE_FLUSH_SECONDS)
+        await flush_usage()
+
+
+def start_usage_flusher() -> None:
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_loop(), name="llm-usage-flusher")
+
+
+async def stop_usage_flusher() -> None:
+    """주기 flush 중단 + 남은 사용량 저장"""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        await asyncio.gather(_flush_task, return_exceptions=True)
+        _flush_task = None
+    await flush_usage()
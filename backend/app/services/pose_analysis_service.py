@@ -1,18 +1,17 @@
 import numpy as np
 from typing import Dict, List, Any
-from openai import AsyncOpenAI
 
 from ..config import settings
+from . import llm_gateway
+from .single_flight import get_single_flight, request_key
 from ..utils.pose_calculator import (
     calculate_angle,
     get_landmark_coords,
 )
 
 
-# OpenAI 클라이언트 초기화
-client = AsyncOpenAI(
-    api_key=settings.OPENAI_API_KEY
-)
+# 동시에 들어온 동일 피드백 요청은 OpenAI를 한 번만 호출
+feedback_flight = get_single_flight("feedback")
 
 
 async def analyze_pose(
@@ -380,20 +379,27 @@ async def generate_ai_feedback(
         return "자세를 조금 더 정확하게 유지해주세요."
     
     max_error_joint = max(relevant_errors.items(), key=lambda x: x[1]["diff"])[0]
+    # 각도는 1도 단위로 (같은 자세의 요청이 같은 프롬프트가 되어 동시 요청을 한 번만 호출)
+    current_angle = round(angle_errors[max_error_joint]['current'])
+    target_angle = round(angle_errors[max_error_joint]['target'])
     
     # 간단한 프롬프트 생성 (토큰 절약)
     prompt = f"""
 운동: {exercise_name}
 문제 관절: {translate_joint_name(max_error_joint)}
-현재 각도: {angle_errors[max_error_joint]['current']}도
-목표 각도: {angle_errors[max_error_joint]['target']}도
+현재 각도: {current_angle}도
+목표 각도: {target_angle}도
 
 한 문장으로 간단하고 구체적인 교정 피드백을 작성해주세요.
 예: "손목을 조금 더 구부려주세요", "팔을 더 펴주세요"
 """
     
+    # 프롬프트가 같은 동시 요청은 한 번만 호출 (키 = 실제 요청 내용)
+    flight_key = request_key("gpt-4o-mini", prompt)
+    
     try:
-        response = await client.chat.completions.create(
+        response = await feedback_flight.do(flight_key, lambda: llm_gateway.chat_completion(
+            "feedback",
             model="gpt-4o-mini",
             messages=[
                 {
@@ -407,7 +413,7 @@ async def generate_ai_feedback(
             ],
             temperature=0.7,
             max_tokens=100
-        )
+        ))
         
         feedback = response.choices[0].message.content.strip()
         
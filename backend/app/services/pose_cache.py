@@ -0,0 +1,155 @@
+"""
+AI 생성 가이드 포즈 캐시 (2단계)
+
+1. 프로세스 메모리 LRU (항목마다 만료 시각, 최대 POSE_CACHE_MEMORY_TTL_SECONDS)
+2. Mongo pose_cache 컬렉션 (expires_at TTL 인덱스 - app.indexes에 선언)
+
+키는 정규화된 운동 이름이며, 검증/보정(repair_pose_frames)을 통과한 프레임만 저장합니다.
+메모리 항목은 Mongo 만료 시각과 메모리 TTL 중 이른 시각에 만료되므로
+다른 프로세스에서 무효화하거나 Mongo에서 만료된 포즈도 메모리 TTL 이내에 반영됩니다.
+"""
+
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import get_pose_cache_collection
+from app.utils.exercise_names import normalize_exercise_name
+
+logger = logging.getLogger(__name__)
+
+GuidePoses = List[Dict[str, Dict[str, float]]]
+
+# 키 → (프레임, 메모리 만료 시각)
+_memory_cache: "OrderedDict[str, Tuple[GuidePoses, datetime]]" = OrderedDict()
+
+_stats = {
+    "memory_hits": 0,
+    "mongo_hits": 0,
+    "misses": 0,
+    "stores": 0,
+    "invalidations": 0,
+}
+
+
+def _remember(key: str, frames: GuidePoses, expires_at: datetime) -> None:
+    memory_expires_at = min(
+        expires_at,
+        datetime.utcnow() + timedelta(seconds=settings.POSE_CACHE_MEMORY_TTL_SECONDS),
+    )
+    _memory_cache[key] = (frames, memory_expires_at)
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > settings.POSE_CACHE_MAX_ENTRIES:
+        _memory_cache.popitem(last=False)
+
+
+async def _get_collection():
+    """DB 미연결 시(스크립트 등) None 반환 → 메모리 캐시만 사용"""
+    try:
+        return await get_pose_cache_collection()
+    except RuntimeError:
+        return None
+
+
+async def get_cached_poses(exercise_name: str) -> Optional[GuidePoses]:
+    """캐시된 AI 포즈 조회 (메모리 → Mongo 순)"""
+    key = normalize_exercise_name(exercise_name)
+    if not key:
+        return None
+
+    entry = _memory_cache.get(key)
+    if entry is not None:
+        frames, memory_expires_at = entry
+        if memory_expires_at > datetime.utcnow():
+            _memory_cache.move_to_end(key)
+            _stats["memory_hits"] += 1
+            return frames
+        del _memory_cache[key]
+
+    collection = await _get_collection()
+    if collection is not None:
+        try:
+            doc = await collection.find_one(
+                {"_id": key, "expires_at": {"$gt": datetime.utcnow()}},
+                {"frames": 1, "expires_at": 1},
+            )
+        except Exception as e:
+            logger.warning(f"Pose cache lookup failed: {e}")
+            doc = None
+
+        if doc and doc.get("frames"):
+            _remember(key, doc["frames"], doc["expires_at"])
+            _stats["mongo_hits"] += 1
+            return doc["frames"]
+
+    _stats["misses"] += 1
+    return None
+
+
+async def store_poses(exercise_name: str, frames: GuidePoses) -> None:
+    """검증을 통과한 AI 포즈 저장 (메모리 + Mongo)"""
+    key = normalize_exercise_name(exercise_name)
+    if not key or not frames:
+        return
+
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=settings.POSE_CACHE_TTL_DAYS)
+    _remember(key, frames, expires_at)
+    _stats["stores"] += 1
+
+    collection = await _get_collection()
+    if collection is None:
+        return
+
+    try:
+        await collection.update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    "exercise_name": exercise_name,
+                    "frames": frames,
+                    "frame_count": len(frames),
+                    "created_at": now,
+                    "expires_at": expires_at,
+                }
+            },
+            upsert=True,
+        )
+    except Exception as e:
+        logger.warning(f"Pose cache store failed: {e}")
+
+
+async def invalidate_poses(exercise_name: Optional[str] = None) -> int:
+    """
+    캐시 무효화
+    - exercise_name 지정 시 해당 운동만, 없으면 전체 삭제
+    """
+    collection = await _get_collection()
+
+    if exercise_name is None:
+        removed = len(_memory_cache)
+        _memory_cache.clear()
+        if collection is not None:
+            result = await collection.delete_many({})
+            removed = max(removed, result.deleted_count)
+    else:
+        key = normalize_exercise_name(exercise_name)
+        removed = 1 if _memory_cache.pop(key, None) is not None else 0
+        if collection is not None:
+            result = await collection.delete_one({"_id": key})
+            removed = max(removed, result.deleted_count)
+
+    _stats["invalidations"] += removed
+    return removed
+
+
+def get_pose_cache_stats() -> Dict:
+    hits = _stats["memory_hits"] + _stats["mongo_hits"]
+    lookups = hits + _stats["misses"]
+    return {
+        **_stats,
+        "memory_entries": len(_memory_cache),
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+    }
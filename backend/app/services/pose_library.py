@@ -0,0 +1,249 @@
+"""
+내장 가이드 포즈 라이브러리
+
+가이드 포즈 데이터는 파이썬 코드가 아닌 버전 관리되는 데이터 번들
+(app/data/pose_library.npz)에 저장됩니다.
+번들은 프로세스당 한 번만 로드되며, 모든 배열은 읽기 전용으로 공유됩니다.
+
+번들 구조:
+    format_version: 번들 포맷 버전 (int)
+    revision:       라이브러리 리비전 (포즈 추가/수정 시 증가)
+    names:          포즈 세트 이름 (P,)
+    frame_offsets:  포즈 세트별 프레임 시작 위치 (P+1,)
+    coords:         랜드마크 좌표 (F, 33, 3) - 없는 값은 NaN
+    present:        랜드마크 존재 여부 (F, 33)
+
+포즈 추가 (코드 수정 없이):
+    python -m app.services.pose_library export poses.json
+    python -m app.services.pose_library import poses.json
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+NUM_LANDMARKS = 33
+FORMAT_VERSION = 1
+
+DEFAULT_BUNDLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "pose_library.npz",
+)
+
+
+class PoseLibrary:
+    """읽기 전용 포즈 라이브러리 (이름 인덱스 + 공유 배열 뷰)"""
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        frame_offsets: np.ndarray,
+        coords: np.ndarray,
+        present: np.ndarray,
+        revision: int = 1,
+    ):
+        for array in (names, frame_offsets, coords, present):
+            array.setflags(write=False)
+
+        self.names = names
+        self.frame_offsets = frame_offsets
+        self.coords = coords
+        self.present = present
+        self.revision = int(revision)
+
+        # 이름 → (시작, 끝) 프레임 인덱스
+        self._index: Dict[str, slice] = {
+            str(name): slice(int(frame_offsets[i]), int(frame_offsets[i + 1]))
+            for i, name in enumerate(names)
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def pose_names(self) -> List[str]:
+        return list(self._index.keys())
+
+    def frames(self, name: str) -> np.ndarray:
+        """포즈 세트의 좌표 배열 (F, 33, 3) - 공유되는 읽기 전용 뷰"""
+        return self.coords[self._index[name]]
+
+    def presence(self, name: str) -> np.ndarray:
+        """포즈 세트의 랜드마크 존재 마스크 (F, 33) - 읽기 전용 뷰"""
+        return self.present[self._index[name]]
+
+    def guide_poses(self, name: str) -> List[Dict[str, Dict[str, float]]]:
+        """
+        기존 guide_poses 형식({"0": {"x":..,"y":..}, ...})으로 변환
+        (Mongo 저장/API 응답용이므로 매 호출마다 새 dict를 반환)
+        """
+        coords = self.frames(name)
+        present = self.presence(name)
+        return [
+            frame_to_guide_pose(coords[i], present[i])
+            for i in range(coords.shape[0])
+        ]
+
+
+def frame_to_guide_pose(coords: np.ndarray, present: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """(33, 3) 좌표 + 존재 마스크 → guide_pose dict"""
+    pose = {}
+    for idx in np.flatnonzero(present):
+        x, y, z = coords[idx]
+        landmark = {"x": float(x), "y": float(y)}
+        if not np.isnan(z):
+            landmark["z"] = float(z)
+        pose[str(int(idx))] = landmark
+    return pose
+
+
+def guide_pose_to_frame(guide_pose: Dict[str, Dict[str, float]]):
+    """guide_pose dict → ((33, 3) 좌표, (33,) 존재 마스크)"""
+    coords = np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float64)
+    present = np.zeros(NUM_LANDMARKS, dtype=bool)
+    for key, landmark in guide_pose.items():
+        idx = int(key)
+        if not 0 <= idx < NUM_LANDMARKS or not isinstance(landmark, dict):
+            continue
+        coords[idx, 0] = landmark.get("x", np.nan)
+        coords[idx, 1] = landmark.get("y", np.nan)
+        coords[idx, 2] = landmark.get("z", np.nan)
+        present[idx] = True
+    return coords, present
+
+
+# --- 로딩 ---
+
+_library: Optional[PoseLibrary] = None
+_library_lock = threading.Lock()
+
+
+def load_pose_library(path: str = DEFAULT_BUNDLE_PATH) -> PoseLibrary:
+    """번들 파일을 읽어 PoseLibrary 생성"""
+    with np.load(path, allow_pickle=False) as bundle:
+        format_version = int(bundle["format_version"])
+        if format_version != FORMAT_VERSION:
+            raise ValueError(
+                f"지원하지 않는 포즈 번들 포맷입니다: {format_version} (expected {FORMAT_VERSION})"
+            )
+        return PoseLibrary(
+            names=bundle["names"],
+            frame_offsets=bundle["frame_offsets"],
+            coords=bundle["coords"],
+            present=bundle["present"],
+            revision=int(bundle["revision"]),
+        )
+
+
+def get_pose_library() -> PoseLibrary:
+    """프로세스 전역 포즈 라이브러리 (최초 1회만 로드)"""
+    global _library
+    if _library is None:
+        with _library_lock:
+            if _library is None:
+                _library = load_pose_library()
+                print(f"✅ 포즈 라이브러리 로드 완료: {len(_library)}개 세트 (rev {_library.revision})")
+    return _library
+
+
+def get_library_guide_poses(name: str) -> List[Dict[str, Dict[str, float]]]:
+    return get_pose_library().guide_poses(name)
+
+
+# --- 번들 저장 / 편집 ---
+
+def save_pose_bundle(
+    pose_sets: Dict[str, List[Dict[str, Dict[str, float]]]],
+    path: str = DEFAULT_BUNDLE_PATH,
+    revision: int = 1,
+) -> None:
+    """guide_poses 형식의 포즈 세트들을 번들 파일로 저장 (원자적 교체)"""
+    names = list(pose_sets.keys())
+    offsets = [0]
+    coords_list = []
+    present_list = []
+    for name in names:
+        frames = pose_sets[name]
+        if not frames:
+            raise ValueError(f"포즈 세트 '{name}'에 프레임이 없습니다.")
+        for frame in frames:
+            coords, present = guide_pose_to_frame(frame)
+            coords_list.append(coords)
+            present_list.append(present)
+        offsets.append(offsets[-1] + len(frames))
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+    os.close(fd)
+    try:
+        # 압축하지 않음 - 로딩 시 압축 해제 비용 없음
+        np.savez(
+            tmp_path,
+            format_version=np.array(FORMAT_VERSION, dtype=np.int32),
+            revision=np.array(revision, dtype=np.int32),
+            names=np.array(names, dtype=np.str_),
+            frame_offsets=np.array(offsets, dtype=np.int32),
+            coords=np.stack(coords_list).astype(np.float64),
+            present=np.stack(present_list),
+        )
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def export_pose_sets(library: PoseLibrary) -> Dict[str, List[Dict[str, Dict[str, float]]]]:
+    return {name: library.guide_poses(name) for name in library.pose_names()}
+
+
+def _main(argv: List[str]) -> int:
+    usage = (
+        "사용법:\n"
+        "  python -m app.services.pose_library list\n"
+        "  python -m app.services.pose_library export <out.json>\n"
+        "  python -m app.services.pose_library import <in.json>   (같은 이름은 교체, 새 이름은 추가)"
+    )
+    if not argv:
+        print(usage)
+        return 1
+
+    command = argv[0]
+    library = load_pose_library()
+
+    if command == "list":
+        print(f"revision: {library.revision}")
+        for name in library.pose_names():
+            print(f"  - {name}: {library.frames(name).shape[0]}개 프레임")
+        return 0
+
+    if command == "export" and len(argv) == 2:
+        with open(argv[1], "w", encoding="utf-8") as f:
+            json.dump(export_pose_sets(library), f, ensure_ascii=False, indent=2)
+        print(f"✅ {len(library)}개 포즈 세트 내보내기 완료: {argv[1]}")
+        return 0
+
+    if command == "import" and len(argv) == 2:
+        with open(argv[1], encoding="utf-8") as f:
+            incoming = json.load(f)
+        pose_sets = export_pose_sets(library)
+        pose_sets.update(incoming)
+        save_pose_bundle(pose_sets, revision=library.revision + 1)
+        print(f"✅ {len(incoming)}개 포즈 세트 반영 완료 (rev {library.revision + 1})")
+        return 0
+
+    print(usage)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
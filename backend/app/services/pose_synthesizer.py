@@ -0,0 +1,377 @@
+"""
+관절 각도 기반 포즈 합성 (순운동학)
+
+표준 신체 모델(키 1.0 기준 분절 길이)에 관절 각도를 적용해
+MediaPipe 33개 랜드마크 포즈를 로컬에서 계산합니다.
+- 운동은 관절 각도 키프레임 몇 개로 표현 (직접 작성한 템플릿 또는 LLM이 숫자 몇 개로 생성)
+- 분절 길이는 고정, 각도는 관절 가동 범위로 제한 → 만들어진 포즈는 항상 해부학적으로 타당
+- 프레임당 1ms 미만의 로컬 계산 (LLM에는 33개 랜드마크 좌표 대신 숫자 몇 개만 요청)
+
+신체 좌표계: x 화면 오른쪽, y 아래, z 카메라 쪽이 음수 (MediaPipe와 동일)
+왼쪽 랜드마크(11, 13, 15, ...)는 기존 포즈와 같이 화면 왼쪽(x < 0.5)에 위치
+
+관절 각도 (도 단위, 생략하면 0 = 차렷 자세):
+    body_pitch              몸 전체를 앞으로 기울임 (90 = 엎드린 수평, -90 = 누운 수평)
+    trunk_flexion           상체 앞으로 굽히기
+    trunk_side_bend         상체 옆으로 굽히기 (+ = 화면 오른쪽)
+    neck_flexion            고개 숙이기
+    neck_side_bend          고개 옆으로 기울이기 (+ = 화면 오른쪽)
+    {side}_shoulder_flexion    팔 앞으로 들기 (180 = 머리 위)
+    {side}_shoulder_abduction  팔 옆으로 들기
+    {side}_elbow               팔꿈치 굽히기
+    {side}_hip_flexion         다리 앞으로 들기
+    {side}_hip_abduction       다리 옆으로 벌리기
+    {side}_knee                무릎 굽히기
+    {side}_ankle               발끝 내리기 (까치발)
+side는 left/right이며, side 없이 쓰면 (예: "knee") 양쪽에 같은 값이 적용됩니다.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.pose_library import NUM_LANDMARKS, frame_to_guide_pose
+
+GuidePose = Dict[str, Dict[str, float]]
+JointAngles = Dict[str, float]
+
+SIDES = ("left", "right")
+VIEWS = ("front", "side")
+
+# 관절 가동 범위 (도)
+JOINT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "body_pitch": (-120.0, 120.0),
+    "trunk_flexion": (-30.0, 100.0),
+    "trunk_side_bend": (-40.0, 40.0),
+    "neck_flexion": (-50.0, 60.0),
+    "neck_side_bend": (-40.0, 40.0),
+    "shoulder_flexion": (-50.0, 180.0),
+    "shoulder_abduction": (0.0, 180.0),
+    "elbow": (0.0, 150.0),
+    "hip_flexion": (-30.0, 130.0),
+    "hip_abduction": (-20.0, 50.0),
+    "knee": (0.0, 150.0),
+    "ankle": (-20.0, 50.0),
+}
+BILATERAL_JOINTS = (
+    "shoulder_flexion", "shoulder_abduction", "elbow",
+    "hip_flexion", "hip_abduction", "knee", "ankle",
+)
+JOINT_PARAMETERS = [name for name in JOINT_LIMITS if name not in BILATERAL_JOINTS] + [
+    f"{side}_{joint}" for side in SIDES for joint in BILATERAL_JOINTS
+]
+
+# 표준 신체 모델 분절 길이 (키 = 1.0, 인체 측정 평균 비율)
+SEGMENT_LENGTHS: Dict[str, float] = {
+    "torso": 0.29,  # 엉덩이 중심 → 어깨 중심
+    "shoulder_width": 0.26,
+    "hip_width": 0.19,
+    "neck": 0.10,  # 어깨 중심 → 머리 중심
+    "head_depth": 0.06,  # 머리 중심 → 코 (앞쪽)
+    "upper_arm": 0.186,
+    "forearm": 0.146,
+    "hand": 0.08,
+    "thigh": 0.245,
+    "shank": 0.246,
+    "heel": 0.04,
+    "foot": 0.13,
+}
+
+FOOT_NEUTRAL_ANGLE = 80.0  # 서 있을 때 정강이와 발 사이 각도 (발끝이 약간 아래)
+BODY_SCALE = 0.9  # 키 1.0 → 화면 높이 비율 (최대값, 화면을 넘으면 줄임)
+FLOOR_Y = 0.97  # 가장 낮은 랜드마크가 닿는 바닥 위치
+FRAME_MARGIN = 0.03
+
+_LATERAL = np.array([1.0, 0.0, 0.0])
+_DOWN = np.array([0.0, 1.0, 0.0])
+_FORWARD = np.array([0.0, 0.0, -1.0])
+
+
+def _rotation(axis: np.ndarray, degrees: float) -> np.ndarray:
+    """단위 벡터 axis 기준 회전 행렬 (Rodrigues)"""
+    theta = math.radians(degrees)
+    x, y, z = axis
+    k = np.array([
+        [0.0, -z, y],
+        [z, 0.0, -x],
+        [-y, x, 0.0],
+    ])
+    return np.eye(3) + math.sin(theta) * k + (1 - math.cos(theta)) * (k @ k)
+
+
+def _bend(direction: np.ndarray, hints: Tuple[np.ndarray, ...], degrees: float) -> np.ndarray:
+    """direction을 hint 방향으로 degrees만큼 회전 (hint가 평행하면 다음 hint 사용)"""
+    for hint in hints:
+        perpendicular = hint - float(hint @ direction) * direction
+        norm = math.sqrt(float(perpendicular @ perpendicular))
+        if norm > 1e-6:
+            theta = math.radians(degrees)
+            return math.cos(theta) * direction + math.sin(theta) / norm * perpendicular
+    return direction
+
+
+def _flex(frame: np.ndarray, degrees: float) -> np.ndarray:
+    """좌표축 (열: lateral, down, forward)을 앞으로 굽힘 (위쪽이 forward 쪽으로)"""
+    return _rotation(frame[:, 0], degrees) @ frame
+
+
+def _side_bend(frame: np.ndarray, degrees: float) -> np.ndarray:
+    """좌표축을 옆으로 굽힘 (위쪽이 lateral 쪽으로)"""
+    return _rotation(-frame[:, 2], degrees) @ frame
+
+
+def _limb_direction(frame: np.ndarray, outward: float, flexion: float, abduction: float) -> np.ndarray:
+    """기준 좌표축에서 굽힘(앞)/벌림(옆) 각도로 팔다리 방향 계산 (0, 0 = 아래)"""
+    lateral, down, forward = frame[:, 0], frame[:, 1], frame[:, 2]
+    f, a = math.radians(flexion), math.radians(abduction)
+    return outward * math.sin(a) * lateral + math.cos(a) * math.cos(f) * down + math.cos(a) * math.sin(f) * forward
+
+
+def clamp_joint_angles(angles: Dict[str, Any]) -> Tuple[JointAngles, int]:
+    """
+    키프레임 각도 정리 (side 없는 관절은 양쪽으로 확장, 모르는 키/숫자가 아닌 값은 무시)
+    Returns: (관절 각도, 가동 범위로 잘린 값 개수)
+    """
+    resolved: JointAngles = {}
+    clamped = 0
+    if not isinstance(angles, dict):
+        return resolved, clamped
+
+    def put(name: str, joint: str, value: Any) -> None:
+        nonlocal clamped
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return
+        if not np.isfinite(value):
+            return
+        low, high = JOINT_LIMITS[joint]
+        if not low <= value <= high:
+            clamped += 1
+            value = min(max(value, low), high)
+        resolved[name] = value
+
+    # side 없는 값 먼저, side별 값이 덮어씀
+    for name, value in angles.items():
+        if name in BILATERAL_JOINTS:
+            for side in SIDES:
+                put(f"{side}_{name}", name, value)
+        elif name in JOINT_LIMITS:
+            put(name, name, value)
+    for name, value in angles.items():
+        side, _, joint = str(name).partition("_")
+        if side in SIDES and joint in BILATERAL_JOINTS:
+            put(name, joint, value)
+    return resolved, clamped
+
+
+def _body_points(angles: JointAngles) -> np.ndarray:
+    """관절 각도 → 신체 좌표계 랜드마크 (33, 3), 엉덩이 중심이 원점"""
+    angle = lambda name: angles.get(name, 0.0)
+    seg = SEGMENT_LENGTHS
+    points = np.zeros((NUM_LANDMARKS, 3))
+
+    base = np.column_stack([_LATERAL, _DOWN, _FORWARD])
+    body = _flex(base, angle("body_pitch"))
+    torso = _side_bend(_flex(body, angle("trunk_flexion")), angle("trunk_side_bend"))
+    head = _side_bend(_flex(torso, angle("neck_flexion")), angle("neck_side_bend"))
+
+    shoulder_center = -seg["torso"] * torso[:, 1]
+    head_center = shoulder_center - seg["neck"] * head[:, 1]
+
+    # 얼굴 (0-10): 코, 눈, 귀, 입
+    head_lateral, head_up, head_forward = head[:, 0], -head[:, 1], head[:, 2]
+    face_front = head_center + seg["head_depth"] * head_forward
+    points[0] = face_front
+    for outward, (inner, eye, outer, ear, mouth) in ((-1, (1, 2, 3, 7, 9)), (1, (4, 5, 6, 8, 10))):
+        side_axis = outward * head_lateral
+        points[inner] = face_front + 0.012 * side_axis + 0.015 * head_up
+        points[eye] = face_front + 0.022 * side_axis + 0.015 * head_up
+        points[outer] = face_front + 0.032 * side_axis + 0.015 * head_up
+        points[ear] = head_center + 0.045 * side_axis
+        points[mouth] = face_front + 0.012 * side_axis - 0.025 * head_up
+
+    for side, outward in (("left", -1.0), ("right", 1.0)):
+        # 팔 (상체 좌표축 기준)
+        shoulder, elbow, wrist, pinky, index, thumb = (
+            (11, 13, 15, 17, 19, 21) if side == "left" else (12, 14, 16, 18, 20, 22)
+        )
+        points[shoulder] = shoulder_center + outward * seg["shoulder_width"] / 2 * torso[:, 0]
+        upper_arm = _limb_direction(
+            torso, outward, angle(f"{side}_shoulder_flexion"), angle(f"{side}_shoulder_abduction")
+        )
+        forearm = _bend(upper_arm, (torso[:, 2], -torso[:, 1]), angle(f"{side}_elbow"))
+        points[elbow] = points[shoulder] + seg["upper_arm"] * upper_arm
+        points[wrist] = points[elbow] + seg["forearm"] * forearm
+        hand_side = _bend(forearm, (outward * torso[:, 0], torso[:, 2]), 90.0)
+        points[pinky] = points[wrist] + 0.8 * seg["hand"] * forearm + 0.02 * hand_side
+        points[index] = points[wrist] + seg["hand"] * forearm - 0.015 * hand_side
+        points[thumb] = points[wrist] + 0.55 * seg["hand"] * forearm - 0.03 * hand_side
+
+        # 다리 (골반 = 몸 전체 좌표축 기준)
+        hip, knee, ankle, heel, toe = (23, 25, 27, 29, 31) if side == "left" else (24, 26, 28, 30, 32)
+        points[hip] = outward * seg["hip_width"] / 2 * body[:, 0]
+        hip_flexion = math.radians(angle(f"{side}_hip_flexion"))
+        thigh = _limb_direction(body, outward, angle(f"{side}_hip_flexion"), angle(f"{side}_hip_abduction"))
+        # 무릎은 허벅지 앞쪽의 반대로 굽고, 발은 정강이 앞쪽을 향함
+        thigh_front = -math.sin(hip_flexion) * body[:, 1] + math.cos(hip_flexion) * body[:, 2]
+        shank = _bend(thigh, (-thigh_front,), angle(f"{side}_knee"))
+        shank_front = _bend(thigh, (-thigh_front,), angle(f"{side}_knee") - 90.0)
+        foot = _bend(shank, (shank_front,), FOOT_NEUTRAL_ANGLE - angle(f"{side}_ankle"))
+        points[knee] = points[hip] + seg["thigh"] * thigh
+        points[ankle] = points[knee] + seg["shank"] * shank
+        points[heel] = points[ankle] + 0.6 * seg["heel"] * shank - 0.8 * seg["heel"] * foot
+        points[toe] = points[ankle] + seg["foot"] * foot
+
+    return points
+
+
+def synthesize_pose_array(keyframes: List[Dict[str, Any]], view: str = "front") -> np.ndarray:
+    """
+    관절 각도 키프레임 → 화면 좌표 (F, 33, 3)
+    - front: 정면 (엉덩이 중심을 x=0.5에), side: 측면 (앞쪽이 화면 오른쪽)
+    - 모든 프레임에 같은 배율 적용, 프레임마다 가장 낮은 랜드마크를 바닥에 맞춤
+    """
+    if not keyframes:
+        return np.zeros((0, NUM_LANDMARKS, 3))
+
+    body = np.stack([_body_points(clamp_joint_angles(frame)[0]) for frame in keyframes])
+    if view == "side":
+        # 측면에서 보면 앞(-z)이 화면 x, 좌우(x)가 깊이
+        image = np.stack([-body[..., 2], body[..., 1], body[..., 0]], axis=-1)
+    else:
+        image = body.copy()
+
+    usable = 1.0 - 2 * FRAME_MARGIN
+    heights = image[..., 1].max(axis=1) - image[..., 1].min(axis=1)
+    if view == "side":
+        half_width = (image[..., 0].max() - image[..., 0].min()) / 2
+    else:
+        half_width = np.abs(image[..., 0]).max()
+    scale = min(
+        BODY_SCALE,
+        (FLOOR_Y - FRAME_MARGIN) / max(heights.max(), 1e-6),
+        usable / 2 / max(half_width, 1e-6),
+    )
+
+    image *= scale
+    if view == "side":
+        image[..., 0] += 0.5 - (image[..., 0].max() + image[..., 0].min()) / 2
+    else:
+        image[..., 0] += 0.5
+    image[..., 1] += FLOOR_Y - image[..., 1].max(axis=1, keepdims=True)
+    image[..., :2] = np.clip(image[..., :2], 0.0, 1.0)
+    return image
+
+
+def synthesize_guide_poses(keyframes: List[Dict[str, Any]], view: str = "front") -> List[GuidePose]:
+    """관절 각도 키프레임 → guide_poses 형식"""
+    coords = np.round(synthesize_pose_array(keyframes, view), 4)
+    present = np.ones(NUM_LANDMARKS, dtype=bool)
+    return [frame_to_guide_pose(frame, present) for frame in coords]
+
+
+def parse_motion(data: Any, min_frames: int = 3) -> Optional[Tuple[List[JointAngles], str, int]]:
+    """
+    LLM 응답의 동작 객체 {"view": "front", "keyframes": [{관절: 각도}, ...]} 검증
+    Returns: (키프레임, view, 가동 범위로 잘린 값 개수) 또는 프레임이 부족하면 None
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("keyframes"), list):
+        return None
+    view = data.get("view") if data.get("view") in VIEWS else "front"
+
+    keyframes, clamped = [], 0
+    for raw in data["keyframes"]:
+        if not isinstance(raw, dict):
+            continue
+        angles, count = clamp_joint_angles(raw)
+        keyframes.append(angles)
+        clamped += count
+
+    # 모든 프레임이 같으면 동작이 없는 응답
+    if len(keyframes) < min_frames or all(frame == keyframes[0] for frame in keyframes):
+        return None
+    return keyframes, view, clamped
+
+
+def describe_joint_parameters() -> str:
+    """LLM 프롬프트용 관절 각도 설명"""
+    lines = [
+        f"- {name}: {int(low)} ~ {int(high)}"
+        for name, (low, high) in JOINT_LIMITS.items()
+    ]
+    return "\n".join(lines)
+
+
+# --- 직접 작성한 동작 템플릿 (내장 포즈 라이브러리에 없는 동작) ---
+
+MOTION_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "side_bend": {
+        "view": "front",
+        "keyframes": [
+            {},
+            {"trunk_side_bend": -25, "right_shoulder_abduction": 160, "right_elbow": 20},
+            {},
+            {"trunk_side_bend": 25, "left_shoulder_abduction": 160, "left_elbow": 20},
+            {},
+        ],
+    },
+    "knee_raise": {
+        "view": "front",
+        "keyframes": [
+            {},
+            {"left_hip_flexion": 80, "left_knee": 90, "right_shoulder_flexion": 30, "right_elbow": 60},
+            {},
+            {"right_hip_flexion": 80, "right_knee": 90, "left_shoulder_flexion": 30, "left_elbow": 60},
+            {},
+        ],
+    },
+    "hip_abduction": {
+        "view": "front",
+        "keyframes": [
+            {"shoulder_abduction": 20},
+            {"shoulder_abduction": 20, "right_hip_abduction": 35, "trunk_side_bend": -5},
+            {"shoulder_abduction": 20},
+            {"shoulder_abduction": 20, "left_hip_abduction": 35, "trunk_side_bend": 5},
+            {"shoulder_abduction": 20},
+        ],
+    },
+    "hip_hinge": {
+        "view": "side",
+        "keyframes": [
+            {},
+            {"trunk_flexion": 35, "knee": 10, "shoulder_flexion": 35},
+            {"trunk_flexion": 70, "knee": 20, "shoulder_flexion": 70, "neck_flexion": -20},
+            {"trunk_flexion": 35, "knee": 10, "shoulder_flexion": 35},
+            {},
+        ],
+    },
+    "glute_bridge": {
+        "view": "side",
+        "keyframes": [
+            {"body_pitch": -90, "hip_flexion": 45, "knee": 130, "shoulder_flexion": -10},
+            {"body_pitch": -102, "hip_flexion": 22, "knee": 122, "shoulder_flexion": -10},
+            {"body_pitch": -115, "hip_flexion": 0, "knee": 115, "shoulder_flexion": -10},
+            {"body_pitch": -102, "hip_flexion": 22, "knee": 122, "shoulder_flexion": -10},
+            {"body_pitch": -90, "hip_flexion": 45, "knee": 130, "shoulder_flexion": -10},
+        ],
+    },
+    "bird_dog": {
+        "view": "side",
+        "keyframes": [
+            {"body_pitch": 75, "hip_flexion": 75, "knee": 90, "ankle": 50, "shoulder_flexion": 75},
+            {"body_pitch": 75, "hip_flexion": 75, "knee": 90, "ankle": 50, "shoulder_flexion": 75,
+             "left_shoulder_flexion": 180, "right_hip_flexion": 0, "right_knee": 0},
+            {"body_pitch": 75, "hip_flexion": 75, "knee": 90, "ankle": 50, "shoulder_flexion": 75},
+            {"body_pitch": 75, "hip_flexion": 75, "knee": 90, "ankle": 50, "shoulder_flexion": 75,
+             "right_shoulder_flexion": 180, "left_hip_flexion": 0, "left_knee": 0},
+            {"body_pitch": 75, "hip_flexion": 75, "knee": 90, "ankle": 50, "shoulder_flexion": 75},
+        ],
+    },
+}
+
+
+def get_template_guide_poses(name: str) -> List[GuidePose]:
+    template = MOTION_TEMPLATES[name]
+    return synthesize_guide_poses(template["keyframes"], template["view"])
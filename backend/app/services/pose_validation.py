@@ -0,0 +1,287 @@
+"""
+AI 생성 포즈 프레임 검증/보정 (NumPy 벡터화)
+
+모든 프레임을 (F, 33, 3) 배열 하나로 변환해 범위, 필수 랜드마크, 해부학적 순서
+(코 < 어깨 < 엉덩이 < 발목, y좌표)를 한 번에 검사합니다.
+해부학적 순서는 몸통이 서 있는 프레임에만 적용합니다 (누운/엎드린 자세는 y 순서가 성립하지 않음).
+작은 오류는 버리지 않고 보정합니다.
+- 범위를 살짝 벗어난 좌표 → 0-1로 자르기
+- 빠진 몸통/팔다리 랜드마크 → 앞뒤 프레임 보간, 없으면 좌우 대칭 위치
+- 빠진 발 랜드마크 → interpolate_missing_landmark (발목 기준)
+- 순서가 살짝 어긋난 경우 (서 있는 프레임) → 최소 간격만큼 밀어 순서 맞춤
+보정 범위를 넘는 프레임만 버립니다.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.pose_library import NUM_LANDMARKS, frame_to_guide_pose
+
+GuidePose = Dict[str, Dict[str, float]]
+
+# validate_pose_frame 필수 랜드마크
+REQUIRED_LANDMARKS = np.array([0, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28, 31, 32])
+# 앞뒤 프레임/대칭으로 채우는 랜드마크 (코, 어깨, 팔, 엉덩이, 다리)
+CORE_LANDMARKS = np.array([0, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28])
+# interpolate_missing_landmark로 채우는 랜드마크 (발끝 - 발목 기준)
+PERIPHERAL_REQUIRED_LANDMARKS = (31, 32)
+MIRROR_PAIRS = [(11, 12), (13, 14), (15, 16), (23, 24), (25, 26), (27, 28)]
+
+RANGE_TOLERANCE = 0.05  # 이 정도까지 범위를 벗어난 좌표는 잘라서 보정
+ORDER_TOLERANCE = 0.03  # 이 정도까지 순서가 어긋난 경우 보정
+ORDER_MARGIN = 0.01  # 보정 후 부위 간 최소 y 간격
+
+
+@dataclass
+class PoseRepairReport:
+    total: int = 0
+    valid: int = 0
+    repaired: int = 0
+    dropped: int = 0
+    clamped_landmarks: int = 0
+    filled_landmarks: int = 0
+    reordered_frames: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def interpolate_missing_landmark(landmark_index: int, guide_pose: GuidePose) -> Dict:
+    """guide_pose에 없는 랜드마크를 주변 랜드마크 기반으로 보간"""
+    if 1 <= landmark_index <= 10:
+        if "0" in guide_pose:
+            nose = guide_pose["0"]
+            offset_map = {
+                1: {"x": 0.01, "y": -0.01}, 2: {"x": 0.02, "y": -0.01}, 3: {"x": 0.03, "y": -0.01},
+                4: {"x": -0.01, "y": -0.01}, 5: {"x": -0.02, "y": -0.01}, 6: {"x": -0.03, "y": -0.01},
+                7: {"x": 0.04, "y": 0.01}, 8: {"x": -0.04, "y": 0.01},
+                9: {"x": 0.02, "y": 0.03}, 10: {"x": -0.02, "y": 0.03},
+            }
+            offset = offset_map.get(landmark_index, {"x": 0, "y": 0})
+            return {"x": nose["x"] + offset["x"], "y": nose["y"] + offset["y"], "z": 0, "visibility": 0.99}
+
+    if 17 <= landmark_index <= 22:
+        wrist_key = "15" if landmark_index in [17, 19, 21] else "16"
+        if wrist_key in guide_pose:
+            wrist = guide_pose[wrist_key]
+            finger_offset_map = {
+                17: {"x": -0.02, "y": 0.02}, 18: {"x": 0.02, "y": 0.02},
+                19: {"x": -0.04, "y": 0.01}, 20: {"x": 0.04, "y": 0.01},
+                21: {"x": -0.01, "y": 0.03}, 22: {"x": 0.01, "y": 0.03},
+            }
+            offset = finger_offset_map.get(landmark_index, {"x": 0, "y": 0})
+            return {"x": wrist["x"] + offset["x"], "y": wrist["y"] + offset["y"], "z": 0, "visibility": 0.99}
+
+    if 29 <= landmark_index <= 32:
+        ankle_key = "27" if landmark_index in [29, 31] else "28"
+        if ankle_key in guide_pose:
+            ankle = guide_pose[ankle_key]
+            foot_offset_map = {
+                29: {"x": -0.02, "y": 0.02}, 30: {"x": 0.02, "y": 0.02},
+                31: {"x": -0.02, "y": 0.03}, 32: {"x": 0.02, "y": 0.03},
+            }
+            offset = foot_offset_map.get(landmark_index, {"x": 0, "y": 0})
+            return {"x": ankle["x"] + offset["x"], "y": ankle["y"] + offset["y"], "z": 0, "visibility": 0.99}
+
+    return {"x": 0.5, "y": 0.5, "z": 0, "visibility": 0.5}
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def frames_to_array(frames: List[GuidePose]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    guide_pose 리스트 → ((F, 33, 3) 좌표, (F, 33) 존재 마스크)
+    LLM 출력이므로 잘못된 키/값은 없는 랜드마크로 처리
+    """
+    coords = np.full((len(frames), NUM_LANDMARKS, 3), np.nan, dtype=np.float64)
+    for frame_index, frame in enumerate(frames):
+        if not isinstance(frame, dict):
+            continue
+        for key, landmark in frame.items():
+            try:
+                idx = int(key)
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= idx < NUM_LANDMARKS or not isinstance(landmark, dict):
+                continue
+            coords[frame_index, idx] = [
+                _to_float(landmark.get("x")),
+                _to_float(landmark.get("y")),
+                _to_float(landmark.get("z")),
+            ]
+    present = ~np.isnan(coords[:, :, :2]).any(axis=2)
+    return coords, present
+
+
+def _body_heights(coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """프레임별 (코, 어깨 중앙, 엉덩이 중앙, 발목 중앙) y좌표"""
+    y = coords[:, :, 1]
+    return y[:, 0], (y[:, 11] + y[:, 12]) / 2, (y[:, 23] + y[:, 24]) / 2, (y[:, 27] + y[:, 28]) / 2
+
+
+def _upright(coords: np.ndarray) -> np.ndarray:
+    """프레임별 몸통이 서 있는지 (F,) - 어깨 중앙→엉덩이 중앙의 세로 길이가 가로 길이 이상"""
+    shoulder = (coords[:, 11, :2] + coords[:, 12, :2]) / 2
+    hip = (coords[:, 23, :2] + coords[:, 24, :2]) / 2
+    with np.errstate(invalid="ignore"):
+        return np.abs(hip[:, 1] - shoulder[:, 1]) >= np.abs(hip[:, 0] - shoulder[:, 0])
+
+
+def validate_frames(coords: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """
+    프레임별 유효 여부 (F,) - 보정 없이 검사만
+    필수 랜드마크 존재 + 0-1 범위 + (서 있는 프레임만) 코 < 어깨 < 엉덩이 < 발목
+    """
+    if coords.shape[0] == 0:
+        return np.zeros(0, dtype=bool)
+
+    required_xy = coords[:, REQUIRED_LANDMARKS, :2]
+    complete = present[:, REQUIRED_LANDMARKS].all(axis=1)
+    with np.errstate(invalid="ignore"):
+        in_range = ((required_xy >= 0.0) & (required_xy <= 1.0)).all(axis=(1, 2))
+        nose, shoulder, hip, ankle = _body_heights(coords)
+        ordered = (nose < shoulder) & (shoulder < hip) & (hip < ankle)
+    return complete & in_range & (ordered | ~_upright(coords))
+
+
+def _fill_from_neighbor_frames(coords: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """빠진 몸통/팔다리 랜드마크를 앞뒤 프레임 선형 보간으로 채움 (제자리 수정), 프레임별 채운 수 반환"""
+    filled = np.zeros(coords.shape[0], dtype=np.int64)
+    frame_index = np.arange(coords.shape[0])
+    for landmark in CORE_LANDMARKS:
+        has = present[:, landmark]
+        if has.all() or not has.any():
+            continue
+        missing = ~has
+        for axis in (0, 1):
+            coords[missing, landmark, axis] = np.interp(
+                frame_index[missing], frame_index[has], coords[has, landmark, axis]
+            )
+        present[missing, landmark] = True
+        filled += missing
+    return filled
+
+
+def _fill_from_mirror(coords: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """한쪽만 있는 좌우 랜드마크를 몸 중심 기준 대칭 위치로 채움 (제자리 수정), 프레임별 채운 수 반환"""
+    filled = np.zeros(coords.shape[0], dtype=np.int64)
+    core_present = present[:, CORE_LANDMARKS]
+    # 몸통/팔다리 랜드마크가 하나도 없는 프레임은 중심을 구할 수 없으므로 채우지 않음
+    has_core = core_present.any(axis=1)
+    center_x = np.full(coords.shape[0], np.nan)
+    center_x[has_core] = (
+        np.where(core_present, coords[:, CORE_LANDMARKS, 0], 0.0)[has_core].sum(axis=1)
+        / core_present[has_core].sum(axis=1)
+    )
+    for left, right in MIRROR_PAIRS:
+        for target, source in ((left, right), (right, left)):
+            fill = ~present[:, target] & present[:, source] & has_core
+            if not fill.any():
+                continue
+            coords[fill, target, 0] = 2 * center_x[fill] - coords[fill, source, 0]
+            coords[fill, target, 1] = coords[fill, source, 1]
+            present[fill, target] = True
+            filled += fill
+    return filled
+
+
+def _fix_order(coords: np.ndarray, keep: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    코 < 어깨 < 엉덩이 < 발목 순서가 조금 어긋난 프레임을 보정 (제자리 수정)
+    엉덩이를 고정하고 엉덩이에서 먼 쪽으로 (엉덩이 → 어깨 → 코, 엉덩이 → 발목) 차례로 옮기므로
+    뒤 단계가 앞 단계에서 맞춘 순서를 다시 깨지 않음
+    Returns: (보정 가능한 프레임 마스크, 보정한 프레임 마스크)
+    """
+    reordered = np.zeros(coords.shape[0], dtype=bool)
+    fixable = keep.copy()
+    upright = _upright(coords)
+
+    # (위쪽 부위, 아래쪽 부위, 옮길 랜드마크, 옮길 방향: -1 = 위로)
+    steps = [
+        ([23, 24], [27, 28], [27, 28, 31, 32], 1),  # 발목/발끝을 엉덩이 아래로
+        ([11, 12], [23, 24], [0, 11, 12], -1),  # 어깨(와 코)를 엉덩이 위로
+        ([0], [11, 12], [0], -1),  # 코를 어깨 위로
+    ]
+    for upper, lower, moved, direction in steps:
+        upper_y = coords[:, upper, 1].mean(axis=1)
+        lower_y = coords[:, lower, 1].mean(axis=1)
+        gap = lower_y - upper_y
+        with np.errstate(invalid="ignore"):
+            needs_fix = fixable & upright & (gap < ORDER_MARGIN)
+            too_far = needs_fix & (gap < -ORDER_TOLERANCE)
+        fixable &= ~too_far
+        needs_fix &= ~too_far
+        if not needs_fix.any():
+            continue
+        shift = (ORDER_MARGIN - gap[needs_fix])[:, None]
+        coords[np.ix_(needs_fix, moved, [1])] += (direction * shift)[:, :, None]
+        reordered |= needs_fix
+
+    return fixable, reordered
+
+
+def repair_pose_frames(frames: List[GuidePose]) -> Tuple[List[GuidePose], PoseRepairReport]:
+    """
+    AI 포즈 프레임 검증 + 보정
+
+    Returns:
+        (유효하거나 보정된 프레임 리스트 - 원래 순서 유지, 보고서)
+    """
+    report = PoseRepairReport(total=len(frames))
+    coords, present = frames_to_array(frames)
+    if coords.shape[0] == 0:
+        return [], report
+
+    originally_valid = validate_frames(coords, present)
+
+    # 1. 범위: 조금 벗어난 좌표는 자르고, 많이 벗어난 프레임은 제외
+    xy = coords[:, :, :2]
+    with np.errstate(invalid="ignore"):
+        outside = present[:, :, None] & ((xy < 0.0) | (xy > 1.0))
+        far_outside = present[:, :, None] & ((xy < -RANGE_TOLERANCE) | (xy > 1.0 + RANGE_TOLERANCE))
+    keep = ~far_outside.any(axis=(1, 2))
+    clamped = outside.any(axis=2).sum(axis=1)
+    coords[:, :, :2] = np.where(present[:, :, None], np.clip(xy, 0.0, 1.0), xy)
+
+    # 2. 빠진 랜드마크 채우기 (보정 대상 프레임만 사용)
+    filled = np.zeros(coords.shape[0], dtype=np.int64)
+    kept_coords, kept_present = coords[keep], present[keep]
+    filled[keep] += _fill_from_neighbor_frames(kept_coords, kept_present)
+    filled[keep] += _fill_from_mirror(kept_coords, kept_present)
+    coords[keep], present[keep] = kept_coords, kept_present
+
+    for frame_index in np.flatnonzero(keep):
+        for landmark in PERIPHERAL_REQUIRED_LANDMARKS:
+            if present[frame_index, landmark]:
+                continue
+            pose = frame_to_guide_pose(coords[frame_index], present[frame_index])
+            point = interpolate_missing_landmark(landmark, pose)
+            coords[frame_index, landmark, :2] = [point["x"], point["y"]]
+            present[frame_index, landmark] = True
+            filled[frame_index] += 1
+
+    # 3. 해부학적 순서 보정
+    keep, reordered = _fix_order(coords, keep)
+    coords[:, :, :2] = np.where(present[:, :, None], np.clip(coords[:, :, :2], 0.0, 1.0), coords[:, :, :2])
+
+    # 4. 최종 검사
+    valid = keep & validate_frames(coords, present)
+    report.valid = int((valid & originally_valid).sum())
+    report.repaired = int((valid & ~originally_valid).sum())
+    report.dropped = int((~valid).sum())
+    # 보정 수는 최종적으로 남은 프레임 기준
+    report.clamped_landmarks = int(clamped[valid].sum())
+    report.filled_landmarks = int(filled[valid].sum())
+    report.reordered_frames = int((reordered & valid).sum())
+
+    repaired_frames = [
+        frame_to_guide_pose(coords[i], present[i]) for i in np.flatnonzero(valid)
+    ]
+    return repaired_frames, report
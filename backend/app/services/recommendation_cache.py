@@ -0,0 +1,298 @@
+"""
+운동 추천 캐시 (신체 상태 지문 기반)
+
+추천 입력은 body_condition(부상 부위, 통증 수준, 제한 사항)뿐이므로,
+정규화한 지문이 같은 사용자끼리 추천 결과를 공유합니다.
+
+1. 프로세스 메모리 LRU (항목마다 만료 시각, 최대 RECOMMENDATION_CACHE_MEMORY_TTL_SECONDS)
+2. Mongo recommendation_cache 컬렉션 (expires_at TTL 인덱스 - app.indexes에 선언)
+
+- 지문: 정렬/정규화된 부상 부위 + 통증 구간 + 정렬/정규화된 제한 사항
+- 운동 풀: 같은 지문으로 생성된 추천을 이름 기준으로 모아 최대 N개 유지
+- 저장 항목은 guide_poses까지만 (silhouette_animation은 조회 시 다시 생성)
+- 사용자가 최근에 받은 운동은 제외하고 남은 운동 중 무작위로 반환,
+  남은 운동이 최소 개수 미만이면 캐시 미스
+- 자주 나오는 지문은 app.scripts.precompute_recommendations로 미리 큰 풀을 만들어 둘 수 있음
+  (온라인 저장은 미리 만든 풀을 줄이거나 만료를 앞당기지 않음 - 병합은 Mongo 업데이트 파이프라인에서
+   현재 문서 기준으로 수행하므로 다른 프로세스의 메모리 캐시가 오래돼도 풀이 줄어들지 않음)
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import random
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from app.config import settings
+from app.database import get_recommendation_cache_collection
+from app.utils.exercise_names import normalize_exercise_name
+
+logger = logging.getLogger(__name__)
+
+Recommendation = Dict[str, Any]
+
+# 캐시에 저장하지 않는 필드 (크기가 크고 guide_poses로 다시 만들 수 있음)
+_EXCLUDED_FIELDS = ("silhouette_animation", "exercise_id")
+
+# 지문 → (운동 풀, 메모리 만료 시각)
+_memory_cache: "OrderedDict[str, Tuple[List[Recommendation], datetime]]" = OrderedDict()
+
+_stats = {
+    "memory_hits": 0,
+    "mongo_hits": 0,
+    "misses": 0,
+    "exhausted": 0,  # 캐시는 있지만 제외 후 남은 운동이 부족한 경우
+    "stores": 0,
+}
+
+
+def _normalize_text(value: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", str(value)).lower().split())
+
+
+def pain_bucket(pain_level: Any) -> int:
+    """통증 수준 0-10 → 구간 (0: 0-2, 1: 3-5, 2: 6-7, 3: 8-10)"""
+    try:
+        level = int(pain_level or 0)
+    except (TypeError, ValueError):
+        level = 0
+    if level <= 2:
+        return 0
+    if level <= 5:
+        return 1
+    if level <= 7:
+        return 2
+    return 3
+
+
+def body_condition_profile(body_condition: Dict) -> Dict[str, Any]:
+    """지문 계산에 쓰이는 정규화된 신체 상태"""
+    return {
+        "injured_parts": sorted({_normalize_text(p) for p in body_condition.get("injured_parts") or [] if p}),
+        "pain_bucket": pain_bucket(body_condition.get("pain_level")),
+        "limitations": sorted({_normalize_text(l) for l in body_condition.get("limitations") or [] if l}),
+    }
+
+
+def body_condition_fingerprint(body_condition: Dict) -> str:
+    profile = body_condition_profile(body_condition)
+    payload = json.dumps(profile, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _remember(key: str, pool: List[Recommendation], expires_at: datetime) -> None:
+    memory_expires_at = min(
+        expires_at,
+        datetime.utcnow() + timedelta(seconds=settings.RECOMMENDATION_CACHE_MEMORY_TTL_SECONDS),
+    )
+    _memory_cache[key] = (pool, memory_expires_at)
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > settings.RECOMMENDATION_CACHE_MAX_ENTRIES:
+        _memory_cache.popitem(last=False)
+
+
+async def _get_collection():
+    """DB 미연결 시(스크립트 등) None 반환 → 메모리 캐시만 사용"""
+    try:
+        return await get_recommendation_cache_collection()
+    except RuntimeError:
+        return None
+
+
+async def _load_pool(key: str, record_stats: bool = True) -> Optional[List[Recommendation]]:
+    entry = _memory_cache.get(key)
+    if entry is not None:
+        pool, memory_expires_at = entry
+        if memory_expires_at > datetime.utcnow():
+            _memory_cache.move_to_end(key)
+            if record_stats:
+                _stats["memory_hits"] += 1
+            return pool
+        del _memory_cache[key]
+
+    collection = await _get_collection()
+    if collection is None:
+        return None
+    try:
+        doc = await collection.find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.utcnow()}},
+            {"recommendations": 1, "expires_at": 1},
+        )
+    except Exception as e:
+        logger.warning(f"Recommendation cache lookup failed: {e}")
+        return None
+
+    if doc and doc.get("recommendations"):
+        _remember(key, doc["recommendations"], doc["expires_at"])
+        if record_stats:
+            _stats["mongo_hits"] += 1
+        return doc["recommendations"]
+    return None
+
+
+async def get_cached_recommendations(
+    body_condition: Dict,
+    exclude_exercises: Optional[List[str]] = None,
+) -> Optional[List[Recommendation]]:
+    """
+    캐시된 추천 조회
+    - 최근 받은 운동(exclude_exercises)을 제외하고 최대 RECOMMENDATION_CACHE_RESULT_COUNT개를 무작위 선택
+    - 남은 운동이 RECOMMENDATION_CACHE_MIN_RESULTS개 미만이면 None (LLM으로 새로 생성)
+    - 반환값은 복사본 (guide_poses 포함, silhouette_animation 제외)
+    """
+    key = body_condition_fingerprint(body_condition)
+    pool = await _load_pool(key)
+    if not pool:
+        _stats["misses"] += 1
+        return None
+
+    excluded = {normalize_exercise_name(name) for name in exclude_exercises or []}
+    available = [rec for rec in pool if normalize_exercise_name(rec.get("name", "")) not in excluded]
+    if len(available) < settings.RECOMMENDATION_CACHE_MIN_RESULTS:
+        _stats["exhausted"] += 1
+        return None
+
+    count = min(settings.RECOMMENDATION_CACHE_RESULT_COUNT, len(available))
+    return [
+        {k: v for k, v in rec.items() if k != "name_key"}
+        for rec in copy.deepcopy(random.sample(available, count))
+    ]
+
+
+async def store_recommendations(
+    body_condition: Dict,
+    recommendations: List[Recommendation],
+    pool_size: Optional[int] = None,
+    ttl_hours: Optional[int] = None,
+    precomputed: bool = False,
+) -> int:
+    """
+    새로 생성한 추천을 지문별 운동 풀에 추가 (같은 이름은 최신 것으로 교체)
+    - 풀 크기는 기존 풀보다 줄어들지 않고, 만료 시각은 앞당겨지지 않음
+    
+    Returns:
+        저장 후 풀에 있는 운동 수
+    """
+    entries = [
+        {
+            **{k: v for k, v in rec.items() if k not in _EXCLUDED_FIELDS},
+            "name_key": normalize_exercise_name(rec["name"]),
+        }
+        for rec in recommendations
+        if rec.get("name") and rec.get("guide_poses")
+    ]
+    if not entries:
+        return 0
+
+    key = body_condition_fingerprint(body_condition)
+    limit = pool_size or settings.RECOMMENDATION_CACHE_POOL_SIZE
+    now = datetime.utcnow()
+    expires_at = now + timedelta(hours=ttl_hours or settings.RECOMMENDATION_CACHE_TTL_HOURS)
+    _stats["stores"] += 1
+
+    collection = await _get_collection()
+    if collection is None:
+        # DB 없이 실행(스크립트 등): 메모리 풀에만 병합
+        existing = await _load_pool(key, record_stats=False) or []
+        pool = _merge_pools(entries, existing, limit)
+        _remember(key, pool, expires_at)
+        return len(pool)
+
+    try:
+        doc = await collection.find_one_and_update(
+            {"_id": key},
+            _merge_pipeline(body_condition, entries, limit, now, expires_at, precomputed),
+            projection={"recommendations": 1, "expires_at": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except Exception as e:
+        logger.warning(f"Recommendation cache store failed: {e}")
+        return len(entries)
+
+    _remember(key, doc["recommendations"], doc["expires_at"])
+    return len(doc["recommendations"])
+
+
+def _merge_pools(entries: List[Recommendation], existing: List[Recommendation], limit: int) -> List[Recommendation]:
+    """새 운동을 앞에, 같은 이름의 기존 운동은 제외 (기존 풀보다 줄어들지 않음)"""
+    new_keys = {rec["name_key"] for rec in entries}
+    pool = entries + [
+        rec for rec in existing
+        if (rec.get("name_key") or normalize_exercise_name(rec.get("name", ""))) not in new_keys
+    ]
+    return pool[:max(limit, len(existing))]
+
+
+def _merge_pipeline(
+    body_condition: Dict,
+    entries: List[Recommendation],
+    limit: int,
+    now: datetime,
+    expires_at: datetime,
+    precomputed: bool,
+) -> List[Dict[str, Any]]:
+    """
+    _merge_pools와 같은 병합을 현재 Mongo 문서 기준으로 수행하는 업데이트 파이프라인
+    (풀 크기는 max(limit, 기존 크기), 만료 시각은 늦은 쪽)
+    """
+    new_keys = [rec["name_key"] for rec in entries]
+    fields: Dict[str, Any] = {
+        "recommendations": {"$let": {
+            "vars": {"old": {"$ifNull": ["$recommendations", []]}},
+            "in": {"$slice": [
+                {"$concatArrays": [
+                    {"$literal": entries},
+                    {"$filter": {
+                        "input": "$$old",
+                        "as": "rec",
+                        "cond": {"$not": [{"$in": [
+                            {"$ifNull": ["$$rec.name_key", "$$rec.name"]},
+                            {"$literal": new_keys},
+                        ]}]},
+                    }},
+                ]},
+                {"$max": [limit, {"$size": "$$old"}]},
+            ]},
+        }},
+        "profile": {"$literal": body_condition_profile(body_condition)},
+        "updated_at": now,
+        "expires_at": {"$max": ["$expires_at", expires_at]},
+        "created_at": {"$ifNull": ["$created_at", now]},
+    }
+    if precomputed:
+        fields["precomputed_at"] = now
+    return [{"$set": fields}]
+
+
+async def get_pool_names(body_condition: Dict) -> List[str]:
+    """지문별 운동 풀에 있는 운동 이름 (미리 생성 시 중복 방지용)"""
+    pool = await _load_pool(body_condition_fingerprint(body_condition), record_stats=False) or []
+    return [rec["name"] for rec in pool if rec.get("name")]
+
+
+async def invalidate_recommendations() -> int:
+    """추천 캐시 전체 삭제"""
+    removed = len(_memory_cache)
+    _memory_cache.clear()
+    collection = await _get_collection()
+    if collection is not None:
+        result = await collection.delete_many({})
+        removed = max(removed, result.deleted_count)
+    return removed
+
+
+def get_recommendation_cache_stats() -> Dict:
+    hits = _stats["memory_hits"] + _stats["mongo_hits"] - _stats["exhausted"]
+    lookups = _stats["memory_hits"] + _stats["mongo_hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "memory_entries": len(_memory_cache),
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+    }
@@ -0,0 +1,328 @@
+"""
+운동 기록 집계 (daily_stats 일별 롤업 + user_stats 누적 통계)
+
+records에 기록이 추가/삭제될 때마다 (user_id, day) 문서 1개를 $inc로 갱신해
+주간/월간/연간 통계가 원본 기록 대신 최대 366개의 작은 문서만 읽도록 합니다.
+(캘린더, 추이 그래프 등도 같은 롤업을 사용)
+
+같은 시점에 사용자별 user_stats 문서 1개도 갱신합니다 (누적 통계 조회는 문서 1개만 읽음).
+- *_ever: 기록이 추가될 때만 증가, 기록을 삭제해도 줄지 않음 (UserCumulativeStats)
+- current_*: 현재 남아 있는 기록 기준, 삭제 시 감소
+
+daily_stats 문서:
+    {
+        "user_id": ObjectId, "day": "YYYY-MM-DD" (UTC),
+        "count": 3, "duration_minutes": 45, "calories_burned": 280, "score_sum": 241,
+        "exercises": {"<exercise_id>": {"name": "벽 스쿼트", "count": 2}, ...},
+        "updated_at": datetime
+    }
+
+- 롤업 갱신 실패는 로그만 남기고 기록 저장/삭제 요청은 실패시키지 않음
+  (어긋난 롤업은 python -m app.scripts.backfill_daily_stats,
+   누적 통계는 python -m app.scripts.backfill_user_stats 로 다시 계산)
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+
+from app.database import get_daily_stats_collection, get_records_collection, get_user_stats_collection
+
+logger = logging.getLogger(__name__)
+
+DAY_FORMAT = "%Y-%m-%d"
+BACKFILL_BATCH_SIZE = 500
+
+
+def day_key(moment: datetime) -> str:
+    """기록 시각(UTC) → 롤업 키 "YYYY-MM-DD" """
+    return moment.strftime(DAY_FORMAT)
+
+
+def _record_increments(record: Dict[str, Any], sign: int) -> Dict[str, Any]:
+    """기록 1개가 일별 문서에 더하는(빼는) 값"""
+    increments = {
+        "count": sign,
+        "duration_minutes": sign * (record.get("duration_minutes") or 0),
+        "calories_burned": sign * (record.get("calories_burned") or 0),
+        "score_sum": sign * (record.get("score") or 0),
+    }
+    if record.get("exercise_id") is not None:
+        increments[f"exercises.{record['exercise_id']}.count"] = sign
+    return increments
+
+
+async def on_record_created(record: Dict[str, Any]) -> None:
+    """records.insert_one 직후 호출 (해당 날짜 문서가 없으면 생성)"""
+    try:
+        collection = await get_daily_stats_collection()
+        update: Dict[str, Any] = {
+            "$inc": _record_increments(record, 1),
+            "$set": {"updated_at": datetime.utcnow()},
+        }
+        if record.get("exercise_id") is not None:
+            update["$set"][f"exercises.{record['exercise_id']}.name"] = record.get("exercise_name")
+        await collection.update_one(
+            {"user_id": record["user_id"], "day": day_key(record["completed_at"])},
+            update,
+            upsert=True,
+        )
+    except Exception as e:
+        logger.error(f"daily_stats update failed (create {record.get('_id')}): {e}")
+
+    try:
+        collection = await get_user_stats_collection()
+        duration = record.get("duration_minutes") or 0
+        await collection.update_one(
+            {"user_id": record["user_id"]},
+            {
+                "$inc": {
+                    "total_workouts_ever": 1,
+                    "total_duration_minutes_ever": duration,
+                    "total_calories_burned_ever": record.get("calories_burned") or 0,
+                    "current_total_workouts": 1,
+                    "current_total_duration": duration,
+                    "current_score_sum": record.get("score") or 0,
+                },
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+            upsert=True,
+        )
+    except Exception as e:
+        logger.error(f"user_stats update failed (create {record.get('_id')}): {e}")
+
+
+async def on_record_deleted(record: Dict[str, Any]) -> None:
+    """records.delete_one 성공 후 호출 (그날 기록이 모두 지워지면 문서도 삭제)"""
+    try:
+        collection = await get_daily_stats_collection()
+        key = {"user_id": record["user_id"], "day": day_key(record["completed_at"])}
+        await collection.update_one(
+            key,
+            {
+                "$inc": _record_increments(record, -1),
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+        )
+        await collection.delete_one({**key, "count": {"$lte": 0}})
+    except Exception as e:
+        logger.error(f"daily_stats update failed (delete {record.get('_id')}): {e}")
+
+    # 누적(*_ever) 값은 그대로 두고 현재 기록 기준 값만 감소
+    try:
+        collection = await get_user_stats_collection()
+        await collection.update_one(
+            {"user_id": record["user_id"]},
+            {
+                "$inc": {
+                    "current_total_workouts": -1,
+                    "current_total_duration": -(record.get("duration_minutes") or 0),
+                    "current_score_sum": -(record.get("score") or 0),
+                },
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+        )
+    except Exception as e:
+        logger.error(f"user_stats update failed (delete {record.get('_id')}): {e}")
+
+
+async def get_daily_stats(user_id: ObjectId, start_day: str, end_day: Optional[str] = None) -> List[Dict[str, Any]]:
+    """기간 내 일별 문서 (날짜순, end_day 포함)"""
+    collection = await get_daily_stats_collection()
+    day_filter: Dict[str, str] = {"$gte": start_day}
+    if end_day:
+        day_filter["$lte"] = end_day
+    cursor = collection.find(
+        {"user_id": user_id, "day": day_filter},
+        {"_id": 0, "user_id": 0, "updated_at": 0},
+    ).sort("day", 1)
+    return await cursor.to_list(length=None)
+
+
+def summarize_daily_stats(days: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    일별 문서 → 기간 합계 / 가장 많이 한 운동 / 일별 분석
+    (records 라우터의 RecordStatisticsResponse 필드와 같은 형태, period 제외)
+    """
+    total_exercises = sum(day.get("count", 0) for day in days)
+    exercise_counts: Dict[str, Dict[str, Any]] = {}
+    daily_breakdown = []
+
+    for day in days:
+        count = day.get("count", 0)
+        if count <= 0:
+            continue
+        for exercise_id, exercise in (day.get("exercises") or {}).items():
+            entry = exercise_counts.setdefault(exercise_id, {"name": exercise.get("name"), "count": 0})
+            entry["count"] += exercise.get("count", 0)
+        daily_breakdown.append({
+            "date": day["day"],
+            "exercise_count": count,
+            "duration_minutes": day.get("duration_minutes", 0),
+            "average_score": round(day.get("score_sum", 0) / count, 1),
+        })
+
+    most_frequent = None
+    if exercise_counts:
+        # 횟수가 같으면 운동 ID 순 (집계 파이프라인과 같은 기준)
+        exercise_id = min(exercise_counts, key=lambda k: (-exercise_counts[k]["count"], k))
+        if exercise_counts[exercise_id]["count"] > 0:
+            most_frequent = {"exercise_id": exercise_id, **exercise_counts[exercise_id]}
+
+    return {
+        "total_exercises": total_exercises,
+        "total_duration_minutes": sum(day.get("duration_minutes", 0) for day in days),
+        "total_calories_burned": sum(day.get("calories_burned", 0) for day in days),
+        "average_score": round(sum(day.get("score_sum", 0) for day in days) / total_exercises, 1)
+        if total_exercises else 0,
+        "most_frequent_exercise": most_frequent,
+        "daily_breakdown": daily_breakdown,
+    }
+
+
+async def get_cumulative_stats(user_id: ObjectId) -> Dict[str, Any]:
+    """누적 통계 (CumulativeStatsResponse 형태, 기록이 없으면 모두 0)"""
+    collection = await get_user_stats_collection()
+    stats = await collection.find_one({"user_id": user_id}) or {}
+    current_workouts = stats.get("current_total_workouts", 0)
+    return {
+        "total_workouts_ever": stats.get("total_workouts_ever", 0),
+        "total_duration_minutes_ever": stats.get("total_duration_minutes_ever", 0),
+        "total_calories_burned_ever": stats.get("total_calories_burned_ever", 0),
+        "current_total_workouts": current_workouts,
+        "current_total_duration": stats.get("current_total_duration", 0),
+        "current_average_score": round(stats.get("current_score_sum", 0) / current_workouts, 1)
+        if current_workouts > 0 else 0.0,
+    }
+
+
+def _backfill_pipeline(user_id: Optional[ObjectId]) -> List[Dict[str, Any]]:
+    """records → (user_id, day, exercise_id)별 합계 (user_id, day 순)"""
+    pipeline: List[Dict[str, Any]] = []
+    if user_id is not None:
+        pipeline.append({"$match": {"user_id": user_id}})
+    pipeline += [
+        {"$group": {
+            "_id": {
+                "user_id": "$user_id",
+                "day": {"$dateToString": {"format": DAY_FORMAT, "date": "$completed_at"}},
+                "exercise_id": "$exercise_id",
+            },
+            "name": {"$first": "$exercise_name"},
+            "count": {"$sum": 1},
+            "duration_minutes": {"$sum": {"$ifNull": ["$duration_minutes", 0]}},
+            "calories_burned": {"$sum": {"$ifNull": ["$calories_burned", 0]}},
+            "score_sum": {"$sum": {"$ifNull": ["$score", 0]}},
+        }},
+        {"$sort": {"_id.user_id": 1, "_id.day": 1}},
+    ]
+    return pipeline
+
+
+async def rebuild_daily_stats(user_id: Optional[ObjectId] = None) -> int:
+    """
+    원본 records에서 daily_stats 재계산 (user_id가 없으면 전체 사용자)
+    기록이 없어진 날짜의 문서는 삭제, 쓴 문서 수 반환
+    쓰기가 적은 시간에 실행 (재계산 중 추가된 기록의 $inc가 덮어써질 수 있음)
+    """
+    records = await get_records_collection()
+    collection = await get_daily_stats_collection()
+
+    rebuilt_at = datetime.utcnow()
+    operations: List[ReplaceOne] = []
+    written = 0
+    current_key = None
+    current: Optional[Dict[str, Any]] = None
+
+    async def flush(force: bool = False) -> None:
+        nonlocal operations, written
+        if operations and (force or len(operations) >= BACKFILL_BATCH_SIZE):
+            await collection.bulk_write(operations, ordered=False)
+            written += len(operations)
+            operations = []
+
+    async for group in records.aggregate(_backfill_pipeline(user_id), allowDiskUse=True):
+        key = (group["_id"]["user_id"], group["_id"]["day"])
+        if key != current_key:
+            if current is not None:
+                operations.append(ReplaceOne({"user_id": current["user_id"], "day": current["day"]}, current, upsert=True))
+                await flush()
+            current_key = key
+            current = {
+                "user_id": key[0], "day": key[1],
+                "count": 0, "duration_minutes": 0, "calories_burned": 0, "score_sum": 0,
+                "exercises": {}, "updated_at": rebuilt_at,
+            }
+        for field in ("count", "duration_minutes", "calories_burned", "score_sum"):
+            current[field] += group[field]
+        if group["_id"].get("exercise_id") is not None:
+            current["exercises"][str(group["_id"]["exercise_id"])] = {"name": group.get("name"), "count": group["count"]}
+
+    if current is not None:
+        operations.append(ReplaceOne({"user_id": current["user_id"], "day": current["day"]}, current, upsert=True))
+    await flush(force=True)
+
+    # 이번 재계산에서 쓰지 않은 문서 = 기록이 모두 삭제된 날짜
+    stale_filter: Dict[str, Any] = {"updated_at": {"$lt": rebuilt_at}}
+    if user_id is not None:
+        stale_filter["user_id"] = user_id
+    await collection.delete_many(stale_filter)
+
+    logger.info(f"daily_stats rebuilt: {written} documents (user={user_id or 'all'})")
+    return written
+
+
+async def rebuild_user_stats(user_id: Optional[ObjectId] = None) -> int:
+    """
+    원본 records에서 user_stats 재계산 (user_id가 없으면 전체 사용자), 갱신한 사용자 수 반환
+    current_*는 현재 기록으로 덮어쓰고, *_ever는 기존 값과 비교해 큰 값을 유지
+    (이미 삭제된 기록은 알 수 없으므로 도입 전 누적값은 현재 기록 기준이 하한)
+    """
+    records = await get_records_collection()
+    collection = await get_user_stats_collection()
+
+    pipeline: List[Dict[str, Any]] = []
+    if user_id is not None:
+        pipeline.append({"$match": {"user_id": user_id}})
+    pipeline.append({"$group": {
+        "_id": "$user_id",
+        "count": {"$sum": 1},
+        "duration_minutes": {"$sum": {"$ifNull": ["$duration_minutes", 0]}},
+        "calories_burned": {"$sum": {"$ifNull": ["$calories_burned", 0]}},
+        "score_sum": {"$sum": {"$ifNull": ["$score", 0]}},
+    }})
+
+    operations: List[UpdateOne] = []
+    updated = 0
+    async for group in records.aggregate(pipeline, allowDiskUse=True):
+        operations.append(UpdateOne(
+            {"user_id": group["_id"]},
+            {
+                "$set": {
+                    "current_total_workouts": group["count"],
+                    "current_total_duration": group["duration_minutes"],
+                    "current_score_sum": group["score_sum"],
+                    "updated_at": datetime.utcnow(),
+                },
+                "$max": {
+                    "total_workouts_ever": group["count"],
+                    "total_duration_minutes_ever": group["duration_minutes"],
+                    "total_calories_burned_ever": group["calories_burned"],
+                },
+            },
+            upsert=True,
+        ))
+        if len(operations) >= BACKFILL_BATCH_SIZE:
+            await collection.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+        updated += len(operations)
+
+    logger.info(f"user_stats rebuilt: {updated} users (user={user_id or 'all'})")
+    return updated
@@ -0,0 +1,125 @@
+"""
+운동 기록 점수 이력 (score_history) 별도 저장
+
+실시간 자세 분석 점수 배열은 운동 시간에 비례해 길어지므로 records 문서에 넣지 않고
+record_score_histories 컬렉션에 기록 ID(_id)로 따로 저장합니다. records에는 샘플 수만 남아
+목록/통계 조회가 읽는 기록 문서 크기가 일정하게 유지되고, 이력은 기록 상세 조회에서만 읽습니다.
+
+record_score_histories 문서:
+    {
+        "_id": 기록 ObjectId, "user_id": ObjectId, "sample_count": 1800,
+        "scores": Binary (uint8, 0~100 점수 1개당 1바이트, SCORE_HISTORY_MAX_SAMPLES 이하일 때만),
+        "buckets": {"min": Binary, "mean": Binary, "max": Binary} (SCORE_HISTORY_BUCKETS개 구간),
+        "created_at": datetime
+    }
+
+- 클라이언트가 점수만 보내고 시각은 보내지 않으므로 시각 정보는 저장하지 않음 (샘플 순서만 유지)
+- 너무 긴 이력은 원본 없이 구간 요약(min/mean/max)만 저장
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from bson import Binary, ObjectId
+
+from app.config import settings
+from app.database import get_score_histories_collection
+
+logger = logging.getLogger(__name__)
+
+BUCKET_FIELDS = ("min", "mean", "max")
+
+
+def numeric_scores(values: Any) -> List[float]:
+    """검증 없이 받은 점수 배열(pose_analysis_summary, 이전 기록)에서 숫자만 남김"""
+    if not isinstance(values, list):
+        return []
+    return [
+        value for value in values
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+    ]
+
+
+def normalize_scores(values: Any) -> List[int]:
+    """숫자만 남겨 0~100 정수로 반올림/자름 (저장 형식과 같은 값)"""
+    scores = numeric_scores(values)
+    return np.clip(np.rint(scores), 0, 100).astype(int).tolist() if scores else []
+
+
+def encode_scores(scores: np.ndarray) -> Binary:
+    """점수 배열 → uint8 바이트 (0~100으로 반올림/자름)"""
+    return Binary(np.clip(np.rint(scores), 0, 100).astype(np.uint8).tobytes())
+
+
+def decode_scores(data: bytes) -> List[int]:
+    return np.frombuffer(bytes(data), dtype=np.uint8).tolist()
+
+
+def downsample_scores(scores: np.ndarray, bucket_count: int) -> Dict[str, np.ndarray]:
+    """점수 배열을 최대 bucket_count개의 연속 구간으로 나눠 구간별 min/mean/max"""
+    buckets = np.array_split(scores, min(bucket_count, len(scores)))
+    return {
+        "min": np.array([bucket.min() for bucket in buckets]),
+        "mean": np.array([bucket.mean() for bucket in buckets]),
+        "max": np.array([bucket.max() for bucket in buckets]),
+    }
+
+
+def build_score_history_doc(record_id: ObjectId, user_id: ObjectId, scores: List[int]) -> Dict[str, Any]:
+    values = np.asarray(scores, dtype=np.float64)
+    doc: Dict[str, Any] = {
+        "_id": record_id,
+        "user_id": user_id,
+        "sample_count": len(values),
+        "buckets": {
+            field: encode_scores(bucket_values)
+            for field, bucket_values in downsample_scores(values, settings.SCORE_HISTORY_BUCKETS).items()
+        },
+        "created_at": datetime.utcnow(),
+    }
+    if len(values) <= settings.SCORE_HISTORY_MAX_SAMPLES:
+        doc["scores"] = encode_scores(values)
+    return doc
+
+
+async def save_score_history(record_id: ObjectId, user_id: ObjectId, scores: Optional[List[int]]) -> int:
+    """
+    기록의 점수 이력 저장 (비어 있으면 저장하지 않음), 저장한 샘플 수 반환
+    records.insert_one 이후 호출 - 실패해도 기록은 남기고 로그만 (상세 조회는 이력 없이 응답)
+    """
+    if not scores:
+        return 0
+    try:
+        collection = await get_score_histories_collection()
+        doc = build_score_history_doc(record_id, user_id, scores)
+        await collection.replace_one({"_id": record_id}, doc, upsert=True)
+        return doc["sample_count"]
+    except Exception as e:
+        logger.error(f"score history save failed ({record_id}): {e}")
+        return 0
+
+
+def decode_score_history(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """저장 문서 → {"score_history": [...] 또는 None, "score_history_buckets": {"min": [...], ...}}"""
+    buckets = doc.get("buckets") or {}
+    return {
+        "score_history": decode_scores(doc["scores"]) if doc.get("scores") is not None else None,
+        "score_history_buckets": {field: decode_scores(buckets[field]) for field in BUCKET_FIELDS if field in buckets},
+    }
+
+
+async def get_score_history(record_id: ObjectId) -> Optional[Dict[str, Any]]:
+    collection = await get_score_histories_collection()
+    doc = await collection.find_one({"_id": record_id})
+    return decode_score_history(doc) if doc else None
+
+
+async def delete_score_history(record_id: ObjectId) -> None:
+    try:
+        collection = await get_score_histories_collection()
+        await collection.delete_one({"_id": record_id})
+    except Exception as e:
+        logger.error(f"score history delete failed ({record_id}): {e}")
@@ -0,0 +1,79 @@
+"""
+동일 LLM 요청 중복 제거 (single-flight)
+
+같은 키의 요청이 이미 진행 중이면 새로 호출하지 않고 진행 중인 결과를 함께 기다립니다.
+- 결과는 첫 호출자에게는 원본, 합류한 호출자에게는 복사본을 반환 (호출자별 수정이 섞이지 않도록)
+- 한 호출자가 취소되어도 공유 작업은 취소되지 않음
+- 완료 즉시 키가 제거되므로 캐시가 아님 (동시에 진행 중인 요청만 합침)
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(*parts: Any) -> str:
+    """요청 구성 요소(프롬프트, 모델 등)로 안정적인 해시 키 생성"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result)
+
+        self.calls += 1
+        task = asyncio.ensure_future(fn())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 기다리던 호출자가 모두 취소된 경우에도 예외 미확인 경고가 나지 않도록
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """호출 지점별 single-flight 그룹 (없으면 생성)"""
+    group = _groups.get(name)
+    if group is None:
+        group = _groups[name] = SingleFlight(name)
+    return group
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    stats = {name: group.stats() for name, group in _groups.items()}
+    total_calls = sum(s["calls"] for s in stats.values())
+    total_coalesced = sum(s["coalesced"] for s in stats.values())
+    return {
+        "groups": stats,
+        "total_calls": total_calls,
+        "total_coalesced": total_coalesced,
+    }
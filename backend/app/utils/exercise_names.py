@@ -0,0 +1,99 @@
+import re
+import unicodedata
+from typing import Dict, List
+
+# 영어/한글 표기 변형 → 대표 표기 (긴 표현부터 치환)
+EXERCISE_NAME_VARIANTS = {
+    "wall push-up": "벽팔굽혀펴기",
+    "wall pushup": "벽팔굽혀펴기",
+    "wall push up": "벽팔굽혀펴기",
+    "push-up": "팔굽혀펴기",
+    "push up": "팔굽혀펴기",
+    "pushup": "팔굽혀펴기",
+    "푸시업": "팔굽혀펴기",
+    "푸쉬업": "팔굽혀펴기",
+    "calf raise": "카프레이즈",
+    "leg raise": "레그레이즈",
+    "foam roller": "폼롤러",
+    "stretching": "스트레칭",
+    "stretch": "스트레칭",
+    "스트레치": "스트레칭",
+    "squat": "스쿼트",
+    "lunge": "런지",
+    "plank": "플랭크",
+    "bridge": "브릿지",
+    "브리지": "브릿지",
+    "seated": "앉아서",
+    "sitting": "앉아서",
+    "chair": "의자",
+    "wall": "벽",
+    "neck": "목",
+    "shoulder": "어깨",
+    "wrist": "손목",
+    "ankle": "발목",
+    "knee": "무릎",
+    "elbow": "팔꿈치",
+    "hip": "엉덩이",
+    "extension": "펴기",
+}
+
+_PUNCTUATION_RE = re.compile(r"[\s\-_/.,·~!?()\[\]{}'\"]+")
+
+# 영어 표기는 단어 단위로만 치환 ("hip"이 "ship"에 매칭되지 않도록), 복수형(-s/-es)도 같은 표기로
+_VARIANT_PATTERNS = [
+    (re.compile(rf"\b{re.escape(variant)}(?:e?s)?\b") if variant.isascii() else re.compile(re.escape(variant)), canonical)
+    for variant, canonical in EXERCISE_NAME_VARIANTS.items()
+]
+
+
+def normalize_exercise_name(name: str) -> str:
+    """
+    운동 이름 정규화 (캐시 키 / 이름 매칭용)
+
+    - 유니코드 NFKC 정규화 + 소문자
+    - 영어/한글 표기 변형을 대표 표기로 통일
+    - 공백/구두점 제거 ("벽 스쿼트" == "벽스쿼트" == "Wall Squat")
+    """
+    if not name:
+        return ""
+
+    normalized = unicodedata.normalize("NFKC", name).lower().strip()
+    normalized = re.sub(r"\s+", " ", normalized)
+
+    for pattern, canonical in _VARIANT_PATTERNS:
+        normalized = pattern.sub(canonical, normalized)
+
+    return _PUNCTUATION_RE.sub("", normalized)
+
+
+def search_exercise_name(name: str) -> str:
+    """
+    운동 이름 검색 키 (기록 검색/자동완성용)
+
+    - 유니코드 NFKC 정규화 + 소문자 + 공백/구두점 제거
+    - 표기 변형은 치환하지 않음: 부분 검색어("squ", "wa")는 치환되지 않으므로
+      저장 값도 원래 표기를 유지해야 "Squat" 기록이 "squ"로 검색됨
+      (표기 변형 통일은 normalize_exercise_name - 캐시 키/포즈 매칭용)
+    """
+    if not name:
+        return ""
+    return _PUNCTUATION_RE.sub("", unicodedata.normalize("NFKC", name).lower())
+
+
+def name_bigrams(normalized_name: str) -> List[str]:
+    """
+    검색 키의 문자 2-gram (부분 검색용, 한 글자 이름은 그대로)
+    한국어는 Mongo 텍스트 인덱스가 단어 안을 나누지 못해 2-gram 배열 + 멀티키 인덱스로 부분 검색
+    """
+    if len(normalized_name) < 2:
+        return [normalized_name] if normalized_name else []
+    return sorted({normalized_name[i:i + 2] for i in range(len(normalized_name) - 1)})
+
+
+def exercise_name_search_fields(name: str) -> Dict[str, object]:
+    """운동 기록에 함께 저장하는 검색용 필드 (검색 키 + 2-gram)"""
+    key = search_exercise_name(name or "")
+    return {
+        "exercise_name_search": key,
+        "exercise_name_grams": name_bigrams(key),
+    }
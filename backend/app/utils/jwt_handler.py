@@ -2,8 +2,9 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional  # ← Optional 추가!
 from jose import JWTError, jwt
 import numpy as np 
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import secrets
 
 from ..config import settings
 
@@ -84,6 +85,24 @@ async def get_current_user(
         )
 
 
+async def verify_admin_key(x_admin_key: Optional[str] = Header(None)) -> None:
+    """
+    관리자 API 접근 확인 (Dependency)
+    X-Admin-Key 헤더가 ADMIN_API_KEY 설정값과 일치해야 합니다.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 API가 비활성화되어 있습니다."
+        )
+    
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 없습니다."
+        )
+
+
 def calculate_angle(point1: np.ndarray, point2: np.ndarray, point3: np.ndarray) -> float:
     """
     세 점으로 이루어진 각도 계산 (point2가 꼭짓점)
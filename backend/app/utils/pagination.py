@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+# 키셋 페이지네이션 커서: 마지막 항목의 (completed_at, _id)를 base64로 감싼 불투명 문자열
+# 정렬은 항상 (completed_at, _id) 내림차순 → records.user_completed_at 인덱스 범위 스캔
+
+
+def encode_cursor(completed_at: datetime, record_id: ObjectId) -> str:
+    payload = json.dumps({"t": completed_at.isoformat(), "id": str(record_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """커서 → (completed_at, _id), 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+
+def after_cursor_filter(cursor: str) -> Dict[str, Any]:
+    """커서 다음 항목 조건 (내림차순 기준 커서보다 뒤)"""
+    completed_at, record_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {"completed_at": {"$lt": completed_at}},
+            {"completed_at": completed_at, "_id": {"$lt": record_id}},
+        ]
+    }
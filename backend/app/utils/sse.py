@@ -0,0 +1,15 @@
+import json
+from typing import Any
+
+# Server-Sent Events 응답 헤더 (프록시 버퍼링 방지)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """SSE 이벤트 한 건을 text/event-stream 형식 문자열로 변환"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+from bson import ObjectId
+
+# app.config는 import 시 필수 환경 변수를 읽으므로 app을 import하기 전에 설정 (Mongo/OpenAI에는 연결하지 않음)
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("LLM_BACKEND", "standin")
+
+
+@pytest.fixture
+def user_id() -> ObjectId:
+    return ObjectId()
+
+
+@pytest.fixture
+def api(monkeypatch, user_id):
+    """
+    가짜 DB를 쓰는 TestClient를 만드는 함수 (get_database / get_current_user 의존성 교체)
+    전체 개수는 통계 롤업이 아닌 records에서 계산 (롤업 컬렉션은 get_database를 거치지 않음)
+    """
+    from fastapi.testclient import TestClient
+
+    from app.config import settings
+    from app.database import get_database
+    from app.main import app
+    from app.utils.jwt_handler import get_current_user
+
+    monkeypatch.setattr(settings, "RECORD_STATS_SOURCE", "records")
+
+    def make_client(db) -> TestClient:
+        async def override_database():
+            return db
+
+        async def override_current_user():
+            return {"user_id": str(user_id), "email": "user@example.com"}
+
+        app.dependency_overrides[get_database] = override_database
+        app.dependency_overrides[get_current_user] = override_current_user
+        return TestClient(app)
+
+    yield make_client
+    app.dependency_overrides.clear()
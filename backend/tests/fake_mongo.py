@@ -0,0 +1,122 @@
+"""
+테스트용 가짜 Motor 컬렉션 (라우터가 쓰는 find/count_documents 조건만 해석, insert_one은 목록에 추가)
+
+지원 연산자: 같음(None은 필드 없음 포함), $or, $and, $regex/$options, $all, $in, $lt, $lte, $gt, $gte, $exists
+find에 넘긴 projection은 projections 목록에 기록 (목록 projection 검사용)
+"""
+
+import re
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from bson import ObjectId
+
+_MISSING = object()
+
+
+def _get(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _match_operator(value: Any, op: str, arg: Any, condition: Dict[str, Any]) -> bool:
+    if op == "$regex":
+        flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+        return isinstance(value, str) and re.search(arg, value, flags) is not None
+    if op == "$options":
+        return True
+    if op == "$exists":
+        return (value is not _MISSING) == bool(arg)
+    if value is _MISSING:
+        return False
+    if op == "$all":
+        return isinstance(value, list) and all(item in value for item in arg)
+    if op == "$in":
+        return value in arg
+    if op == "$lt":
+        return value < arg
+    if op == "$lte":
+        return value <= arg
+    if op == "$gt":
+        return value > arg
+    if op == "$gte":
+        return value >= arg
+    raise NotImplementedError(op)
+
+
+def matches(doc: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict) and any(op.startswith("$") for op in condition):
+            value = _get(doc, key)
+            if not all(_match_operator(value, op, arg, condition) for op, arg in condition.items()):
+                return False
+        else:
+            value = _get(doc, key)
+            if condition is None:
+                if value is not _MISSING and value is not None:
+                    return False
+            elif value is _MISSING or value != condition:
+                return False
+    return True
+
+
+SortSpec = Union[str, Sequence[Tuple[str, int]]]
+
+
+class FakeCursor:
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self._docs = docs
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key_or_list: SortSpec, direction: int = 1) -> "FakeCursor":
+        keys = [(key_or_list, direction)] if isinstance(key_or_list, str) else list(key_or_list)
+        # 뒤 키부터 안정 정렬 (없는 값은 가장 작은 값으로)
+        for key, key_direction in reversed(keys):
+            present = [doc for doc in self._docs if _get(doc, key) not in (_MISSING, None)]
+            absent = [doc for doc in self._docs if _get(doc, key) in (_MISSING, None)]
+            present.sort(key=lambda doc: _get(doc, key), reverse=key_direction < 0)
+            self._docs = absent + present if key_direction > 0 else present + absent
+        return self
+
+    def skip(self, count: int) -> "FakeCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "FakeCursor":
+        self._limit = count
+        return self
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        docs = self._docs[self._skip:]
+        if self._limit:
+            docs = docs[:self._limit]
+        return [dict(doc) for doc in docs]
+
+
+class FakeCollection:
+    def __init__(self, docs: Optional[List[Dict[str, Any]]] = None):
+        self.docs: List[Dict[str, Any]] = list(docs or [])
+        self.projections: List[Optional[Dict[str, int]]] = []
+
+    def find(self, query: Dict[str, Any], projection: Optional[Dict[str, int]] = None) -> FakeCursor:
+        self.projections.append(projection)
+        return FakeCursor([doc for doc in self.docs if matches(doc, query)])
+
+    async def count_documents(self, query: Dict[str, Any]) -> int:
+        return sum(1 for doc in self.docs if matches(doc, query))
+
+    async def insert_one(self, doc: Dict[str, Any]) -> SimpleNamespace:
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
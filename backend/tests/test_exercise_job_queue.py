@@ -0,0 +1,92 @@
+"""
+운동 생성 작업 큐의 임대 연장 (heartbeat) 확인
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from app.services import exercise_job_queue as job_queue_module
+from app.services.exercise_job_queue import ExerciseJobQueue
+
+
+def make_queue() -> ExerciseJobQueue:
+    return ExerciseJobQueue(worker_count=1, max_queue_size=10, max_attempts=2, lease_seconds=0.03, poll_seconds=0.01)
+
+
+class LeaseCollection:
+    """update_one 결과를 순서대로 돌려줌 (Exception이면 발생)"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def update_one(self, query, update):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return SimpleNamespace(matched_count=result)
+
+
+def test_heartbeat_keeps_renewing_after_errors():
+    jobs = LeaseCollection([RuntimeError("network"), 1, RuntimeError("network"), 1, 0])
+    db = SimpleNamespace(exercise_jobs=jobs)
+
+    asyncio.run(asyncio.wait_for(make_queue()._heartbeat(db, str(ObjectId())), timeout=1))
+
+    assert jobs.calls == 5
+
+
+def test_worker_stops_job_when_lease_is_lost(monkeypatch):
+    queue = make_queue()
+    db = SimpleNamespace(exercise_jobs=LeaseCollection([0]))
+    job = {"_id": ObjectId(), "attempts": 1}
+    claims = [job]
+    state = {}
+
+    async def fake_get_database():
+        return db
+
+    async def fake_claim(db):
+        return claims.pop(0) if claims else None
+
+    async def slow_run_job(db, job):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(job_queue_module, "get_database", fake_get_database)
+    monkeypatch.setattr(queue, "_claim", fake_claim)
+    monkeypatch.setattr(queue, "_run_job", slow_run_job)
+
+    async def main():
+        queue._wakeup = asyncio.Event()
+        worker = asyncio.create_task(queue._worker(0))
+        await asyncio.sleep(0.1)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+    asyncio.run(main())
+
+    assert state == {"cancelled": True}
+
+
+def test_status_update_wakes_every_subscriber():
+    queue = make_queue()
+    job_id = str(ObjectId())
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        waiters = [asyncio.create_task(queue.wait_for_update(job_id, timeout=1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        started = loop.time()
+        queue._notify(job_id)
+        await asyncio.gather(*waiters)
+        return loop.time() - started
+
+    assert asyncio.run(main()) < 0.5
+    assert queue._status_events == {}
@@ -0,0 +1,48 @@
+"""
+TTL 인덱스 옵션 충돌 처리 (collMod 실패가 시작을 막지 않는지)
+"""
+
+import asyncio
+from typing import Optional
+
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+
+from app.indexes import INDEX_OPTIONS_CONFLICT, IndexSpec, _apply
+
+INDEX_NOT_FOUND = 27
+
+SPEC = IndexSpec("pose_cache", (("expires_at", ASCENDING),), "expires_at_ttl", expire_after_seconds=0)
+
+
+class ConflictingCollection:
+    async def create_index(self, keys, **options):
+        raise OperationFailure("Index already exists with different options", code=INDEX_OPTIONS_CONFLICT)
+
+
+class FakeDb:
+    def __init__(self, command_error: Optional[OperationFailure] = None):
+        self.command_error = command_error
+        self.commands = []
+
+    def __getitem__(self, name):
+        return ConflictingCollection()
+
+    async def command(self, *args, **kwargs):
+        self.commands.append((args, kwargs))
+        if self.command_error:
+            raise self.command_error
+        return {"ok": 1}
+
+
+def test_ttl_conflict_updates_expiry():
+    db = FakeDb()
+
+    assert asyncio.run(_apply(db, SPEC)) == "ttl_updated"
+    assert db.commands == [(("collMod", "pose_cache"), {"index": {"name": "expires_at_ttl", "expireAfterSeconds": 0}})]
+
+
+def test_ttl_conflict_with_renamed_index_fails_without_raising():
+    db = FakeDb(OperationFailure("cannot find index", code=INDEX_NOT_FOUND))
+
+    assert asyncio.run(_apply(db, SPEC)) == "failed"
@@ -0,0 +1,85 @@
+"""
+목록 엔드포인트가 무거운 필드(projections.HEAVY_FIELDS)를 읽지 않는지 확인
+
+get_database를 가짜 DB로 바꿔 각 엔드포인트가 find에 넘긴 projection을 기록하고 검사합니다.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import pytest
+from bson import ObjectId
+
+from app import projections
+from tests.fake_mongo import FakeCollection
+
+
+def make_db(user_id: ObjectId) -> SimpleNamespace:
+    return SimpleNamespace(
+        records=FakeCollection([{
+            "_id": ObjectId(),
+            "user_id": user_id,
+            "exercise_id": ObjectId(),
+            "exercise_name": "벽 스쿼트",
+            "exercise_name_search": "벽스쿼트",
+            "exercise_name_grams": ["벽스", "스쿼", "쿼트"],
+            "completed_at": datetime(2024, 1, 1),
+            "duration_minutes": 10,
+            "completed_sets": 3,
+            "completed_reps": 10,
+            "score": 80,
+            "calories_burned": 45,
+            "pain_level_after": 2,
+            # POST /records로 저장된 이전 기록 (요약 안에 점수 이력 배열)
+            "pose_analysis_summary": {"total_measurements": 3, "average_score": 80, "score_history": [70, 80, 90]},
+        }]),
+        my_exercises=FakeCollection([{
+            "_id": ObjectId(),
+            "user_id": user_id,
+            "name": "벽 스쿼트",
+            "description": "",
+            "duration_seconds": 600,
+            "intensity": "low",
+            "saved_at": datetime(2024, 1, 1),
+        }]),
+    )
+
+
+def assert_light_projection(projection: Optional[Dict[str, int]]) -> None:
+    # projection이 없으면 문서 전체를 읽음
+    assert projection, "목록 조회에 projection이 없습니다."
+    # 포함 방식만 허용 (제외 방식은 새로 추가된 필드까지 읽음)
+    assert all(value for key, value in projection.items() if key != "_id"), projection
+    # 상위 필드를 읽으면 그 안의 무거운 필드(pose_analysis_summary.score_history 등)도 함께 읽음
+    heavy = [
+        key for key in projection
+        if any(key == field or key.startswith(f"{field}.") or field.startswith(f"{key}.") for field in projections.HEAVY_FIELDS)
+    ]
+    assert not heavy, f"무거운 필드를 읽습니다: {heavy}"
+
+
+@pytest.mark.parametrize(
+    ("url", "collection"),
+    [
+        ("/api/v1/records/", "records"),
+        ("/api/v1/records/?exercise_name=스쿼트", "records"),
+        ("/api/v1/records/search?q=벽&match=prefix", "records"),
+        ("/api/v1/records/search?q=스쿼트&match=contains", "records"),
+        ("/api/v1/exercises/my-exercises", "my_exercises"),
+    ],
+)
+def test_list_endpoints_skip_heavy_fields(api, user_id, url, collection):
+    db = make_db(user_id)
+    response = api(db).get(url)
+
+    assert response.status_code == 200, response.text
+    recorded = getattr(db, collection).projections
+    assert recorded
+    for projection in recorded:
+        assert_light_projection(projection)
+
+
+@pytest.mark.parametrize("name", sorted(projections.LIST_PROJECTIONS))
+def test_list_projections_skip_heavy_fields(name):
+    assert_light_projection(projections.LIST_PROJECTIONS[name])
@@ -0,0 +1,46 @@
+"""
+자세 피드백 동시 요청 합치기 (키와 프롬프트가 같은 반올림 각도를 쓰는지)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.services import llm_gateway, pose_analysis_service
+
+
+def angle_errors(current: float, target: float) -> dict:
+    return {"left_knee": {"current": current, "target": target, "diff": abs(current - target)}}
+
+
+def run_concurrently(monkeypatch, *errors):
+    prompts = []
+
+    async def fake_chat_completion(purpose, **kwargs):
+        prompts.append(kwargs["messages"][1]["content"])
+        await asyncio.sleep(0.01)
+        message = SimpleNamespace(content=f"피드백 {len(prompts)}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(llm_gateway, "chat_completion", fake_chat_completion)
+
+    async def main():
+        return await asyncio.gather(*(
+            pose_analysis_service.generate_ai_feedback(error, {}, {}, "스쿼트", ["left_knee"])
+            for error in errors
+        ))
+
+    return asyncio.run(main()), prompts
+
+
+def test_same_rounded_angles_share_one_call(monkeypatch):
+    feedbacks, prompts = run_concurrently(monkeypatch, angle_errors(90.2, 120.4), angle_errors(89.9, 119.6))
+
+    assert len(prompts) == 1
+    assert "현재 각도: 90도" in prompts[0] and "목표 각도: 120도" in prompts[0]
+    assert feedbacks[0] == feedbacks[1]
+
+
+def test_different_angles_call_separately(monkeypatch):
+    _, prompts = run_concurrently(monkeypatch, angle_errors(90.2, 120.4), angle_errors(95.0, 120.4))
+
+    assert len(prompts) == 2
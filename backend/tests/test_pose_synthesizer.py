@@ -0,0 +1,76 @@
+"""
+관절 각도 포즈 합성 (parse_motion / synthesize_guide_poses) - 출력 형태와 관절 가동 범위
+"""
+
+import pytest
+
+from app.services.pose_library import NUM_LANDMARKS
+from app.services.pose_synthesizer import (
+    JOINT_LIMITS,
+    MOTION_TEMPLATES,
+    get_template_guide_poses,
+    parse_motion,
+    synthesize_guide_poses,
+)
+from app.services.pose_validation import frames_to_array, validate_frames
+
+
+def assert_guide_poses(frames, count):
+    assert len(frames) == count
+    for frame in frames:
+        assert sorted(frame, key=int) == [str(i) for i in range(NUM_LANDMARKS)]
+        for landmark in frame.values():
+            assert 0.0 <= landmark["x"] <= 1.0 and 0.0 <= landmark["y"] <= 1.0
+            assert "z" in landmark
+
+
+def test_parse_motion_clamps_angles_to_joint_limits():
+    motion = {
+        "view": "side",
+        "keyframes": [
+            {},
+            {"knee": 400, "left_elbow": -30, "trunk_flexion": 60, "unknown": 10, "hip_flexion": "x"},
+            {"knee": 90},
+        ],
+    }
+
+    keyframes, view, clamped = parse_motion(motion)
+
+    assert view == "side"
+    assert clamped == 3  # 양쪽 무릎 + 왼쪽 팔꿈치
+    assert keyframes[1] == {"left_knee": 150.0, "right_knee": 150.0, "left_elbow": 0.0, "trunk_flexion": 60.0}
+    for frame in keyframes:
+        for name, value in frame.items():
+            joint = name.partition("_")[2] if name.partition("_")[0] in ("left", "right") else name
+            low, high = JOINT_LIMITS[joint]
+            assert low <= value <= high
+
+
+@pytest.mark.parametrize(
+    "motion",
+    [
+        None,
+        {"keyframes": "squat"},
+        {"keyframes": [{"knee": 30}, {"knee": 60}]},  # 프레임 부족
+        {"keyframes": [{"knee": 30}, {"knee": 30}, {"knee": 30}]},  # 동작 없음
+    ],
+)
+def test_parse_motion_rejects_unusable_motion(motion):
+    assert parse_motion(motion) is None
+
+
+@pytest.mark.parametrize("view", ["front", "side"])
+def test_synthesized_poses_stay_in_frame_at_joint_limits(view):
+    extreme = {name: high for name, (low, high) in JOINT_LIMITS.items()}
+    keyframes = [{}, extreme, {name: low for name, (low, high) in JOINT_LIMITS.items()}]
+
+    assert_guide_poses(synthesize_guide_poses(keyframes, view), len(keyframes))
+
+
+@pytest.mark.parametrize("name", sorted(MOTION_TEMPLATES))
+def test_templates_produce_valid_frames(name):
+    frames = get_template_guide_poses(name)
+
+    assert_guide_poses(frames, len(MOTION_TEMPLATES[name]["keyframes"]))
+    coords, present = frames_to_array(frames)
+    assert validate_frames(coords, present).all()
@@ -0,0 +1,74 @@
+"""
+AI 포즈 프레임 보정 (repair_pose_frames) - NaN/숫자가 아닌 좌표와 범위를 벗어난 좌표
+"""
+
+import copy
+import math
+
+from app.services.pose_synthesizer import synthesize_guide_poses
+from app.services.pose_validation import frames_to_array, repair_pose_frames, validate_frames
+
+
+def standing_frames():
+    return synthesize_guide_poses([{}, {"knee": 20, "hip_flexion": 20}, {"knee": 40, "hip_flexion": 40}, {}])
+
+
+def assert_valid(frames):
+    coords, present = frames_to_array(frames)
+    assert validate_frames(coords, present).all()
+    for frame in frames:
+        for landmark in frame.values():
+            assert 0.0 <= landmark["x"] <= 1.0 and 0.0 <= landmark["y"] <= 1.0
+
+
+def test_valid_frames_pass_unchanged():
+    frames = standing_frames()
+
+    repaired, report = repair_pose_frames(frames)
+
+    assert repaired == frames
+    assert report.as_dict() == {
+        "total": 4, "valid": 4, "repaired": 0, "dropped": 0,
+        "clamped_landmarks": 0, "filled_landmarks": 0, "reordered_frames": 0,
+    }
+
+
+def test_nan_and_non_numeric_joints_are_filled_from_neighbor_frames():
+    frames = standing_frames()
+    broken = copy.deepcopy(frames)
+    broken[1]["25"]["x"] = math.nan  # 왼쪽 무릎
+    broken[2]["26"]["y"] = "abc"  # 오른쪽 무릎
+
+    repaired, report = repair_pose_frames(broken)
+
+    assert len(repaired) == 4
+    assert report.repaired == 2 and report.dropped == 0
+    assert report.filled_landmarks == 2
+    assert_valid(repaired)
+    # 앞뒤 프레임 사이 값으로 채움
+    assert min(frames[0]["25"]["x"], frames[2]["25"]["x"]) <= repaired[1]["25"]["x"] <= max(frames[0]["25"]["x"], frames[2]["25"]["x"])
+
+
+def test_slightly_out_of_range_joints_are_clamped():
+    frames = standing_frames()
+    frames[1]["15"]["x"] = 1.03
+    frames[2]["0"]["y"] = -0.02
+
+    repaired, report = repair_pose_frames(frames)
+
+    assert len(repaired) == 4
+    assert report.clamped_landmarks == 2
+    assert repaired[1]["15"]["x"] == 1.0
+    assert repaired[2]["0"]["y"] == 0.0
+    assert_valid(repaired)
+
+
+def test_far_out_of_range_frames_are_dropped():
+    frames = standing_frames()
+    frames[2]["27"]["y"] = 1.6
+
+    repaired, report = repair_pose_frames(frames)
+
+    assert len(repaired) == 3
+    assert report.dropped == 1 and report.valid == 3
+    assert repaired == [frames[0], frames[1], frames[3]]
@@ -0,0 +1,53 @@
+"""
+POST /records가 pose_analysis_summary 안의 점수 이력을 record_score_histories로 옮기는지 확인
+"""
+
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from app.routers import records
+from app.services import record_stats_service, score_history_service
+from app.services.exercise_resolver import MY_EXERCISES, ResolvedExercise
+from tests.fake_mongo import FakeCollection
+
+
+def test_create_record_moves_nested_score_history(api, user_id, monkeypatch):
+    exercise_id = ObjectId()
+    saved = {}
+
+    async def fake_resolve(exercise_oid, user_oid, projection):
+        return ResolvedExercise(exercise_id=exercise_oid, source=MY_EXERCISES, doc={"name": "벽 스쿼트", "intensity": "low"})
+
+    async def fake_save(record_id, user_oid, scores):
+        saved.update(record_id=record_id, user_id=user_oid, scores=scores)
+        return len(scores)
+
+    async def fake_on_record_created(record):
+        return None
+
+    monkeypatch.setattr(records, "resolve_exercise", fake_resolve)
+    monkeypatch.setattr(score_history_service, "save_score_history", fake_save)
+    monkeypatch.setattr(record_stats_service, "on_record_created", fake_on_record_created)
+
+    db = SimpleNamespace(records=FakeCollection())
+    response = api(db).post("/api/v1/records/", json={
+        "exercise_id": str(exercise_id),
+        "duration_minutes": 10,
+        "completed_sets": 3,
+        "completed_reps": 10,
+        "average_score": 80,
+        "pose_analysis_summary": {
+            "total_measurements": 4,
+            "score_history": [70, 85.6, "x", 120],
+            "average_score": 80,
+        },
+    })
+
+    assert response.status_code == 201, response.text
+    assert "score_history" not in response.json()["pose_analysis_summary"]
+
+    [stored] = db.records.docs
+    assert stored["pose_analysis_summary"] == {"total_measurements": 4, "average_score": 80}
+    assert stored["score_history_count"] == 3
+    assert saved == {"record_id": stored["_id"], "user_id": user_id, "scores": [70, 85.6, 120]}
@@ -0,0 +1,83 @@
+"""
+기록 목록 키셋 커서 (utils/pagination.py, GET /records cursor 모드)
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from app.utils.pagination import after_cursor_filter, decode_cursor, encode_cursor
+from tests.fake_mongo import FakeCollection, matches
+
+BASE_TIME = datetime(2024, 3, 1, 9, 30, 15, 123000)
+
+
+def make_record(user_id: ObjectId, completed_at: datetime) -> dict:
+    return {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "exercise_id": ObjectId(),
+        "exercise_name": "벽 스쿼트",
+        "completed_at": completed_at,
+        "duration_minutes": 10,
+        "completed_sets": 3,
+        "completed_reps": 10,
+        "score": 80,
+        "calories_burned": 45,
+        "pain_level_after": 2,
+    }
+
+
+def test_cursor_round_trip():
+    record_id = ObjectId()
+
+    cursor = encode_cursor(BASE_TIME, record_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (BASE_TIME, record_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(BASE_TIME, ObjectId())[:-4]])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_after_cursor_filter_breaks_completed_at_ties_by_id():
+    first, second = sorted([ObjectId(), ObjectId()], reverse=True)
+    query = after_cursor_filter(encode_cursor(BASE_TIME, first))
+
+    assert matches({"_id": second, "completed_at": BASE_TIME}, query)
+    assert not matches({"_id": first, "completed_at": BASE_TIME}, query)
+    assert matches({"_id": ObjectId(), "completed_at": BASE_TIME - timedelta(seconds=1)}, query)
+    assert not matches({"_id": ObjectId(), "completed_at": BASE_TIME + timedelta(seconds=1)}, query)
+
+
+def test_cursor_pages_cover_every_record_once(api, user_id):
+    # 같은 completed_at 기록 3개가 페이지 경계에 걸치도록
+    times = [BASE_TIME + timedelta(minutes=2), BASE_TIME, BASE_TIME, BASE_TIME, BASE_TIME - timedelta(minutes=5)]
+    docs = [make_record(user_id, completed_at) for completed_at in times]
+    docs.append(make_record(ObjectId(), BASE_TIME))  # 다른 사용자
+    client = api(SimpleNamespace(records=FakeCollection(docs)))
+
+    seen, cursor = [], None
+    for _ in range(10):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/records/", params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        seen += [record["record_id"] for record in body["records"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    expected = sorted(docs[:5], key=lambda doc: (doc["completed_at"], doc["_id"]), reverse=True)
+    assert seen == [str(doc["_id"]) for doc in expected]
+
+
+def test_invalid_cursor_returns_400(api):
+    response = api(SimpleNamespace(records=FakeCollection())).get("/api/v1/records/?cursor=not-a-cursor")
+
+    assert response.status_code == 400
@@ -0,0 +1,91 @@
+"""
+운동 기록 이름 검색 (목록 필터 / prefix / contains)
+
+검색 키는 표기 변형을 치환하지 않으므로 영어 부분 검색어("squ", "push")로도 찾고,
+검색 키 필드가 없는 이전 기록은 원래 이름 정규식으로 찾는지 확인합니다.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from bson import ObjectId
+
+from app.utils.exercise_names import exercise_name_search_fields, normalize_exercise_name
+from tests.fake_mongo import FakeCollection
+
+
+def make_record(user_id: ObjectId, name: str, days_ago: int, legacy: bool = False) -> dict:
+    record = {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "exercise_id": ObjectId(),
+        "exercise_name": name,
+        "completed_at": datetime(2024, 6, 1) - timedelta(days=days_ago),
+        "duration_minutes": 10,
+        "completed_sets": 3,
+        "completed_reps": 10,
+        "score": 80,
+        "calories_burned": 45,
+        "pain_level_after": 2,
+    }
+    if not legacy:
+        record.update(exercise_name_search_fields(name))
+    return record
+
+
+@pytest.fixture
+def db(user_id):
+    return SimpleNamespace(records=FakeCollection([
+        make_record(user_id, "Squat", 1),
+        make_record(user_id, "Wall Push-up", 2),
+        make_record(user_id, "의자 스쿼트", 3),
+        make_record(user_id, "목 스트레칭", 4),
+        # 검색 필드 백필 전 기록
+        make_record(user_id, "Squat Jump", 5, legacy=True),
+        make_record(ObjectId(), "Squat", 1),  # 다른 사용자
+    ]))
+
+
+def names(response) -> List[str]:
+    assert response.status_code == 200, response.text
+    return sorted(record["exercise_name"] for record in response.json()["records"])
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        # 영어 부분 검색어 (표기 변형 치환 전 값으로 저장되어 있어야 찾음)
+        ("/api/v1/records/?exercise_name=squ", ["Squat", "Squat Jump"]),
+        ("/api/v1/records/search?q=squ&match=prefix", ["Squat", "Squat Jump"]),
+        ("/api/v1/records/search?q=push&match=contains", ["Wall Push-up"]),
+        ("/api/v1/records/search?q=wa&match=prefix", ["Wall Push-up"]),
+        # 한글 부분 검색어
+        ("/api/v1/records/?exercise_name=스쿼", ["의자 스쿼트"]),
+        ("/api/v1/records/search?q=의자&match=prefix", ["의자 스쿼트"]),
+        ("/api/v1/records/search?q=스트레&match=contains", ["목 스트레칭"]),
+        # 이전 기록 (검색 필드 없음)
+        ("/api/v1/records/search?q=jump&match=contains", ["Squat Jump"]),
+    ],
+)
+def test_record_name_search(api, db, url, expected):
+    assert names(api(db).get(url)) == expected
+
+
+def test_list_total_counts_legacy_records(api, db):
+    response = api(db).get("/api/v1/records/?exercise_name=squ")
+    assert response.json()["total"] == 2
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Squats", "스쿼트"),
+        ("Hip Stretches", "엉덩이스트레칭"),
+        ("hips", "엉덩이"),
+        ("ship", "ship"),
+    ],
+)
+def test_variant_keys_handle_plurals(name: str, expected: Optional[str]):
+    assert normalize_exercise_name(name) == expected
@@ -0,0 +1,31 @@
+"""
+점수 이력 입력 정리 (소수/범위 밖 점수는 거부하지 않고 0~100 정수로 맞춤)
+"""
+
+from app.schemas.exercise_schema import ExerciseCompleteRequest
+from app.services.score_history_service import decode_scores, encode_scores, normalize_scores
+
+
+def test_normalize_scores_rounds_and_clamps():
+    assert normalize_scores([85.6, -3, 120, 70]) == [86, 0, 100, 70]
+
+
+def test_normalize_scores_drops_non_numeric():
+    assert normalize_scores([80, "x", None, True, float("nan"), 90]) == [80, 90]
+    assert normalize_scores(None) == []
+    assert normalize_scores("80") == []
+
+
+def test_complete_request_accepts_float_and_out_of_range_scores():
+    request = ExerciseCompleteRequest(
+        completed_sets=3,
+        completed_reps=10,
+        average_score=80,
+        pain_level_after=2,
+        duration_minutes=10,
+        score_history=[85.6, -3, 120],
+    )
+
+    scores = normalize_scores(request.score_history)
+    assert scores == [86, 0, 100]
+    assert decode_scores(encode_scores(scores)) == scores